@@ -0,0 +1,14 @@
+"""
+ASGI config of the API-only workers.
+
+Same application as ``_project.asgi``, with the slimmer app and middleware
+stack of ``_project.settings_api``.
+"""
+
+import os
+
+from _project.handlers import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "_project.settings_api")
+
+application = get_asgi_application()
@@ -0,0 +1,125 @@
+"""
+PostgreSQL backend with a per-process connection pool and opt-in server-side
+prepared statements.
+
+    DATABASES["default"]["ENGINE"] = "_project.db"
+    DATABASES["default"]["POOL"] = {"MAX_SIZE": 10, "TIMEOUT": 10, ...}
+    DATABASES["default"]["PREPARED_STATEMENTS"] = 64
+"""
+from django.db.backends.postgresql import base
+from django.db.backends.utils import CursorWrapper
+import psycopg2.extensions
+import psycopg2.extras
+
+from .pool import ConnectionPool, get_pool
+from .prepared import PreparedStatementCache, is_enabled
+
+REUSABLE_STATUSES = (
+    psycopg2.extensions.TRANSACTION_STATUS_IDLE,
+    psycopg2.extensions.TRANSACTION_STATUS_INTRANS,
+    psycopg2.extensions.TRANSACTION_STATUS_INERROR,
+)
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = None
+
+
+class PreparingCursorWrapper(CursorWrapper):
+    def _execute(self, sql, params, *ignored_wrapper_args):
+        prepared = getattr(self.db.connection, "prepared", None)
+
+        if (
+            prepared is None
+            or params is None
+            or self.cursor.name is not None
+            or not is_enabled()
+            or sql.lstrip()[:6].upper() != "SELECT"
+        ):
+            return super()._execute(sql, params, *ignored_wrapper_args)
+
+        self.db.validate_no_broken_transaction()
+
+        with self.db.wrap_database_errors:
+            return prepared.execute(self.cursor, sql, params)
+
+
+class PreparingCursorDebugWrapper(base.CursorDebugWrapper, PreparingCursorWrapper):
+    pass
+
+
+def connect(conn_params: dict, max_prepared: int):
+    connection = base.Database.connect(
+        **conn_params, connection_factory=PooledConnection
+    )
+    psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+
+    if max_prepared:
+        connection.prepared = PreparedStatementCache(max_prepared)
+
+    return connection
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_pool(self) -> ConnectionPool:
+        options = self.settings_dict.get("POOL", {})
+        conn_params = self.get_connection_params()
+        max_prepared = self.settings_dict.get("PREPARED_STATEMENTS", 0)
+
+        return get_pool(
+            self.alias,
+            lambda: ConnectionPool(
+                connect=lambda: connect(conn_params, max_prepared),
+                max_size=options.get("MAX_SIZE", 10),
+                timeout=options.get("TIMEOUT", 10),
+                max_lifetime=options.get("MAX_LIFETIME", 1800),
+                health_check_interval=options.get("HEALTH_CHECK_INTERVAL", 30),
+            ),
+        )
+
+    def get_new_connection(self, conn_params):
+        connection = self.get_pool().getconn()
+
+        # Same as the stock backend: keep the server default unless OPTIONS
+        # asks for another level.
+        options = self.settings_dict["OPTIONS"]
+        self.isolation_level = options.get(
+            "isolation_level", connection.isolation_level
+        )
+
+        if self.isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=self.isolation_level)
+
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        pool = self.get_pool()
+
+        try:
+            if self.connection.closed:
+                pool.discard(self.connection)
+                return
+
+            status = self.connection.get_transaction_status()
+
+            if status not in REUSABLE_STATUSES:
+                pool.discard(self.connection)
+                return
+
+            if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                self.connection.rollback()
+
+            pool.putconn(self.connection)
+        except psycopg2.Error:
+            pool.discard(self.connection)
+
+    def make_cursor(self, cursor):
+        return PreparingCursorWrapper(cursor, self)
+
+    def make_debug_cursor(self, cursor):
+        return PreparingCursorDebugWrapper(cursor, self)
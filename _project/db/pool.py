@@ -0,0 +1,205 @@
+from collections import deque
+from threading import Condition
+from time import monotonic
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class PoolStats:
+    def __init__(self, samples: int = 1024):
+        self.wait_times = deque(maxlen=samples)
+        self.reset()
+
+    def reset(self):
+        self.wait_times.clear()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.created = 0
+        self.discarded = 0
+
+    def as_dict(self) -> dict:
+        waits = sorted(self.wait_times)
+
+        def percentile(pct):
+            if not waits:
+                return 0.0
+
+            return waits[min(len(waits) - 1, int(pct / 100 * len(waits)))] * 1000
+
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "created": self.created,
+            "discarded": self.discarded,
+            "wait_p50_ms": percentile(50),
+            "wait_p99_ms": percentile(99),
+            "wait_max_ms": waits[-1] * 1000 if waits else 0.0,
+        }
+
+
+class ConnectionPool:
+    """
+    Blocking pool of DB-API connections shared by the threads of one process.
+
+    Connections idle for longer than `health_check_interval` are pinged
+    before being handed out, and connections older than `max_lifetime` are
+    replaced, so a restarted or failed-over server is never seen by a view.
+    """
+
+    def __init__(
+        self,
+        connect,
+        max_size: int,
+        timeout: float = 10,
+        max_lifetime: float = 1800,
+        health_check_interval: float = 30,
+    ):
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self.stats = PoolStats()
+        self._idle = deque()
+        self._born = {}
+        self._size = 0
+        self._condition = Condition()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def getconn(self):
+        start = monotonic()
+        deadline = start + self.timeout
+
+        with self._condition:
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - monotonic()
+
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    self.stats.timeouts += 1
+                    raise PoolTimeout(
+                        f"no connection available within {self.timeout}s "
+                        f"(max_size={self.max_size})"
+                    )
+
+            if self._idle:
+                connection, released_at = self._idle.pop()
+            else:
+                connection, released_at = None, None
+                self._size += 1
+
+            self.stats.checkouts += 1
+            self.stats.wait_times.append(monotonic() - start)
+
+        if connection is not None and self.is_healthy(connection, released_at):
+            return connection
+
+        if connection is not None:
+            self.discard(connection, replace=True)
+
+        try:
+            connection = self.connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        self._born[id(connection)] = monotonic()
+        self.stats.created += 1
+
+        return connection
+
+    def is_healthy(self, connection, released_at) -> bool:
+        if connection.closed:
+            return False
+
+        if monotonic() - self._born.get(id(connection), 0) > self.max_lifetime:
+            return False
+
+        if monotonic() - released_at < self.health_check_interval:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception:
+            logger.info("discarding pooled connection that failed its health check")
+            return False
+
+        return True
+
+    def putconn(self, connection):
+        with self._condition:
+            self._idle.append((connection, monotonic()))
+            self._condition.notify()
+
+    def discard(self, connection, replace=False):
+        self._born.pop(id(connection), None)
+        self.stats.discarded += 1
+
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+        if not replace:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+
+    def close(self):
+        with self._condition:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._size -= 1
+
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+
+
+_pools = {}
+
+
+def get_pool(alias: str, factory) -> ConnectionPool:
+    """
+    One pool per database alias and process; forked workers build their own.
+    """
+    key = (alias, os.getpid())
+
+    if key not in _pools:
+        _pools.setdefault(key, factory())
+
+    return _pools[key]
+
+
+def pool_stats() -> dict:
+    pid = os.getpid()
+
+    return {
+        alias: {**pool.stats.as_dict(), "size": pool.size, "idle": pool.idle}
+        for (alias, owner), pool in sorted(_pools.items())
+        if owner == pid
+    }
+
+
+def reset_pool_stats():
+    pid = os.getpid()
+
+    for (_, owner), pool in _pools.items():
+        if owner == pid:
+            pool.stats.reset()
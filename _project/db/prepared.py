@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import md5
+import re
+
+_enabled = ContextVar("prepared_statements", default=False)
+
+PLACEHOLDER_RE = re.compile(r"%([%s])")
+
+
+@contextmanager
+def prepared_statements():
+    """
+    SELECTs run inside this block are prepared once per connection and then
+    executed by name, skipping parse and plan on the server.
+    """
+    token = _enabled.set(True)
+
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def is_enabled() -> bool:
+    return _enabled.get()
+
+
+def to_server_placeholders(sql: str) -> tuple[str, int]:
+    count = 0
+
+    def replace(match):
+        nonlocal count
+
+        if match.group(1) == "%":
+            return "%"
+
+        count += 1
+        return f"${count}"
+
+    return PLACEHOLDER_RE.sub(replace, sql), count
+
+
+class PreparedStatementCache:
+    """Prepared statement names of one connection, least recently used first."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.names = OrderedDict()
+
+    def execute(self, cursor, sql: str, params):
+        name = self.names.get(sql)
+
+        if name is None:
+            name = f"django_{md5(sql.encode(), usedforsecurity=False).hexdigest()[:16]}"
+            statement, count = to_server_placeholders(sql)
+
+            if count != len(params or ()):
+                return cursor.execute(sql, params)
+
+            if len(self.names) >= self.max_size:
+                _, evicted = self.names.popitem(last=False)
+                cursor.execute(f"DEALLOCATE {evicted}")
+
+            cursor.execute(f"PREPARE {name} AS {statement}")
+            self.names[sql] = name
+        else:
+            self.names.move_to_end(sql)
+
+        if not params:
+            return cursor.execute(f"EXECUTE {name}")
+
+        placeholders = ", ".join(["%s"] * len(params))
+
+        return cursor.execute(f"EXECUTE {name} ({placeholders})", params)
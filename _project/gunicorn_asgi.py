@@ -0,0 +1,23 @@
+"""
+Gunicorn settings for serving `_project.asgi` with uvicorn workers, an
+opt-in alternative to the WSGI `web` process:
+
+    gunicorn _project.asgi:application -c _project/gunicorn_asgi.py
+
+Async views (/api/async/...) share the event loop of each worker. Django
+4.1 runs every sync view (all the DRF views) in a thread of its own per
+request, so persistent connections are never reused there; the ASGI
+handler turns CONN_MAX_AGE off (see `_project.handlers`), and
+DB_POOL_ENABLED=true keeps connections open across requests instead.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 0))
@@ -0,0 +1,68 @@
+"""
+ASGI handler of the project.
+
+Django 4.1 iterates streaming responses on the event loop, where the ORM
+raises SynchronousOnlyOperation, so generators reading the database (the
+catalog export) cannot be streamed. This handler pulls each part from the
+sync thread that ran the view, the one holding its database connection.
+"""
+import os
+
+import django
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIHandler
+
+
+def get_response_headers(response) -> list:
+    headers = []
+
+    for header, value in response.items():
+        if isinstance(header, str):
+            header = header.encode("ascii")
+        if isinstance(value, str):
+            value = value.encode("latin1")
+        headers.append((bytes(header), bytes(value)))
+
+    for cookie in response.cookies.values():
+        headers.append(
+            (b"Set-Cookie", cookie.output(header="").encode("ascii").strip())
+        )
+
+    return headers
+
+
+class StreamingASGIHandler(ASGIHandler):
+    async def send_response(self, response, send):
+        if not response.streaming:
+            return await super().send_response(response, send)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": get_response_headers(response),
+            }
+        )
+
+        parts = iter(response)
+        next_part = sync_to_async(next, thread_sensitive=True)
+
+        try:
+            while (part := await next_part(parts, None)) is not None:
+                for chunk, _ in self.chunk_bytes(part):
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+
+            await send({"type": "http.response.body"})
+        finally:
+            await sync_to_async(response.close, thread_sensitive=True)()
+
+
+def get_asgi_application() -> StreamingASGIHandler:
+    # Each request runs its sync code in a new thread, with new connections,
+    # so persistent ones would only pile up until CONN_MAX_AGE.
+    os.environ["DJANGO_SERVER_INTERFACE"] = "asgi"
+    django.setup(set_prefix=False)
+
+    return StreamingASGIHandler()
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 import os
 import dotenv
 import dj_database_url
@@ -28,8 +29,20 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.getenv("SECRET_KEY")
 
+# Settings profile: dev, test or prod. Heroku sets DATABASE_URL, so that is
+# taken as production unless DJANGO_PROFILE says otherwise.
+PROFILES = ("dev", "test", "prod")
+PROFILE = os.getenv("DJANGO_PROFILE") or (
+    "prod" if os.getenv("DATABASE_URL") else "dev"
+)
+
+if PROFILE not in PROFILES:
+    raise ImproperlyConfigured(
+        f"DJANGO_PROFILE must be one of {', '.join(PROFILES)}, got {PROFILE!r}"
+    )
+
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = PROFILE == "dev"
 
 ALLOWED_HOSTS = ["komercio-manager-api.herokuapp.com", "localhost"]
 
@@ -54,11 +67,13 @@ THIRD_PARTY_APPS = [
 MY_APPS = [
     "users",
     "products",
+    "benchmarks",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + MY_APPS
 
 MIDDLEWARE = [
+    "utils.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -123,6 +138,33 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+PASSWORD_HASHER_CLASSES = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "pbkdf2_sha1": "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "bcrypt_sha256": "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+}
+
+# The first hasher encodes new passwords; the others still verify existing
+# ones, which are re-encoded with the first on the next successful login.
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[name]
+    for name in sorted(
+        PASSWORD_HASHER_CLASSES,
+        key=lambda name: name != os.getenv("PASSWORD_HASHER", "pbkdf2"),
+    )
+]
+
+PASSWORD_HASHING_WORKERS = int(
+    os.getenv("PASSWORD_HASHING_WORKERS", os.cpu_count() or 1)
+)
+PASSWORD_HASHING_QUEUE_SIZE = int(
+    os.getenv("PASSWORD_HASHING_QUEUE_SIZE", 4 * PASSWORD_HASHING_WORKERS)
+)
+PASSWORD_HASHING_WAIT = float(os.getenv("PASSWORD_HASHING_WAIT", 5))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
 
@@ -148,11 +190,74 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_SCHEMA_CLASS": "utils.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 2,
 }
 
+KEYSET_PAGINATION_MAX_PAGE_SIZE = int(os.getenv("KEYSET_PAGINATION_MAX_PAGE_SIZE", 100))
+CHANGE_FEED_PAGE_SIZE = int(os.getenv("CHANGE_FEED_PAGE_SIZE", 100))
+CHANGE_FEED_MAX_PAGE_SIZE = int(os.getenv("CHANGE_FEED_MAX_PAGE_SIZE", 1000))
+
+# Each worker keeps its own token cache and checks a per-user version in
+# the "auth" cache on every hit. Invalidation reaches the other workers
+# only when that cache is shared (redis, memcached); a per-process locmem
+# falls back to a short TTL.
+AUTH_CACHE_BACKEND = os.getenv(
+    "AUTH_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+)
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 1024))
+TOKEN_CACHE_TTL = float(
+    os.getenv(
+        "TOKEN_CACHE_TTL", 5 if AUTH_CACHE_BACKEND.endswith("LocMemCache") else 60
+    )
+)
+
+PRODUCT_BULK_BATCH_SIZE = int(os.getenv("PRODUCT_BULK_BATCH_SIZE", 500))
+PRODUCT_BULK_MAX_ITEMS = int(os.getenv("PRODUCT_BULK_MAX_ITEMS", 10000))
+PRODUCT_EXPORT_CHUNK_SIZE = int(os.getenv("PRODUCT_EXPORT_CHUNK_SIZE", 2000))
+
+NEWEST_ACCOUNTS_MAX = int(os.getenv("NEWEST_ACCOUNTS_MAX", 100))
+RECENT_SIGNUPS_BUFFER_SIZE = int(os.getenv("RECENT_SIGNUPS_BUFFER_SIZE", 50))
+RECENT_SIGNUPS_TTL = float(os.getenv("RECENT_SIGNUPS_TTL", 5))
+
+PRODUCT_SEARCH_MAX_RESULTS = int(os.getenv("PRODUCT_SEARCH_MAX_RESULTS", 1000))
+
+# Every test client request is checked against the query budget of its view
+# (utils.testing). max_repeats caps how many times one query shape may run
+# in a request; more than that is an N+1.
+TEST_RUNNER = "utils.testing.QueryAuditRunner"
+QUERY_BUDGETS = {
+    "default": {"max_repeats": 1},
+    # One guarded UPDATE per reserved product, taken in id order so that
+    # concurrent reservations lock rows consistently.
+    "products.views.ProductReserveView": {"max_repeats": None},
+}
+
+# Share of requests timed by utils.instrumentation, from 0 (off) to 1.
+INSTRUMENTATION_SAMPLE_RATE = float(os.getenv("INSTRUMENTATION_SAMPLE_RATE", 0))
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "catalog": {
+        "BACKEND": os.getenv(
+            "CATALOG_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CATALOG_CACHE_LOCATION", "catalog"),
+        "TIMEOUT": int(os.getenv("CATALOG_CACHE_TIMEOUT", 300)),
+    },
+    "auth": {
+        "BACKEND": AUTH_CACHE_BACKEND,
+        "LOCATION": os.getenv("AUTH_CACHE_LOCATION", "auth"),
+        "TIMEOUT": None,
+    },
+}
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Komercio API",
     "DESCRIPTION": "Komercio é uma aplicação simples para gerenciamento de usuários e produtos.",
@@ -160,6 +265,11 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+SCHEMA_FILE = BASE_DIR / "schema.yml"
+# The schema documents the full URLconf, whichever one the worker serves.
+SCHEMA_URLCONF = "_project.urls"
+SCHEMA_PRECOMPUTED = os.getenv("SCHEMA_PRECOMPUTED", "true").lower() == "true"
+
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
 if DATABASE_URL:
@@ -168,4 +278,89 @@ if DATABASE_URL:
     )
     DATABASES["default"].update(db_from_env)
 
-    DEBUG = False
+# Connection pooling
+# One pool per worker process: DB_POOL_TOTAL_SIZE is the connection budget
+# of the whole deployment, split across the WEB_CONCURRENCY workers.
+
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "false").lower() == "true"
+
+if DB_POOL_ENABLED:
+    DB_POOL_TOTAL_SIZE = os.getenv("DB_POOL_TOTAL_SIZE")
+    DB_POOL_MAX_SIZE = int(
+        os.getenv("DB_POOL_MAX_SIZE")
+        or (
+            max(1, int(DB_POOL_TOTAL_SIZE) // int(os.getenv("WEB_CONCURRENCY", 1)))
+            if DB_POOL_TOTAL_SIZE
+            else 10
+        )
+    )
+
+    DATABASES["default"].update(
+        {
+            "ENGINE": "_project.db",
+            "CONN_MAX_AGE": 0,
+            "POOL": {
+                "MAX_SIZE": DB_POOL_MAX_SIZE,
+                "TIMEOUT": float(os.getenv("DB_POOL_TIMEOUT", 10)),
+                "MAX_LIFETIME": float(os.getenv("DB_POOL_MAX_LIFETIME", 1800)),
+                "HEALTH_CHECK_INTERVAL": float(
+                    os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", 30)
+                ),
+            },
+            "PREPARED_STATEMENTS": int(os.getenv("DB_PREPARED_STATEMENTS", 64)),
+        }
+    )
+
+# Set by `_project.handlers.get_asgi_application`. The ASGI handler gives
+# each request its own thread and so its own connections, which are never
+# reused: close them at the end of the request (the pool keeps its own).
+if os.getenv("DJANGO_SERVER_INTERFACE") == "asgi":
+    for database in DATABASES.values():
+        database["CONN_MAX_AGE"] = 0
+
+# Profiles
+# https://docs.djangoproject.com/en/4.1/howto/deployment/checklist/
+
+# Read by the prod profile only. The admin needs the session and message
+# middleware, which the API does not: it authenticates with tokens and never
+# sets cookies.
+ADMIN_ENABLED = os.getenv("ADMIN_ENABLED", str(PROFILE != "prod")).lower() == "true"
+
+if PROFILE == "prod":
+    TEMPLATES[0]["APP_DIRS"] = False
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [
+        (
+            "django.template.loaders.cached.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+        )
+    ]
+
+    if not ADMIN_ENABLED:
+        INSTALLED_APPS.remove("django.contrib.admin")
+        TEMPLATES[0]["OPTIONS"]["context_processors"] = [
+            "django.template.context_processors.request",
+            "django.contrib.auth.context_processors.auth",
+        ]
+        MIDDLEWARE = [
+            "utils.instrumentation.InstrumentationMiddleware",
+            "django.middleware.security.SecurityMiddleware",
+            "django.middleware.common.CommonMiddleware",
+            "django.middleware.clickjacking.XFrameOptionsMiddleware",
+        ]
+
+if PROFILE == "test":
+    CACHES["catalog"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "catalog",
+        "TIMEOUT": 300,
+    }
+    CACHES["auth"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "auth",
+        "TIMEOUT": None,
+    }
+    PASSWORD_HASHING_WORKERS = 2
+    PASSWORD_HASHING_QUEUE_SIZE = 8
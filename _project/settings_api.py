@@ -0,0 +1,44 @@
+"""
+Settings of the API-only workers, served by `_project.wsgi_api` and
+`_project.asgi_api`.
+
+These workers only answer /api/ (and /schema/, imported on first request).
+The API authenticates with tokens and never sets cookies, so the admin,
+sessions, messages, static files and CSRF are left to the full application.
+"""
+
+from .settings import *  # noqa: F401, F403
+from .settings import INSTALLED_APPS, TEMPLATES
+
+API_SKIPPED_APPS = (
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "drf_spectacular",
+)
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_SKIPPED_APPS]
+
+MIDDLEWARE = [
+    "utils.instrumentation.InstrumentationMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
+ROOT_URLCONF = "_project.urls_api"
+
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],
+            "context_processors": [
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+            ],
+        },
+    }
+]
+
+WSGI_APPLICATION = "_project.wsgi_api.application"
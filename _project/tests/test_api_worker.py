@@ -0,0 +1,78 @@
+from unittest import mock
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from _project import settings_api
+from _project.urls_api import lazy_view
+
+
+@override_settings(
+    ROOT_URLCONF=settings_api.ROOT_URLCONF, MIDDLEWARE=settings_api.MIDDLEWARE
+)
+class APIWorkerTests(APITestCase):
+    def test_api_routes_are_served(self):
+        """As rotas /api/ e o schema devem responder no worker da API"""
+
+        msg = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_200_OK, self.client.get("/api/products/").status_code, msg
+        )
+        self.assertEqual(
+            status.HTTP_200_OK, self.client.get("/schema/").status_code, msg
+        )
+
+    def test_admin_is_not_served(self):
+        """O admin não deve ser servido pelo worker da API"""
+
+        response = self.client.get("/admin/")
+
+        msg = "O admin deveria ficar apenas na aplicação completa"
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code, msg)
+
+    def test_lazy_view_is_imported_on_first_request(self):
+        """A view preguiçosa deve ser importada apenas na primeira requisição"""
+
+        with mock.patch("_project.urls_api.import_string") as import_string:
+            view = lazy_view("utils.schema.PrecomputedSchemaView")
+
+            msg_mount = "A view não deveria ser importada ao montar as URLs"
+            self.assertEqual(0, import_string.call_count, msg_mount)
+
+            view(mock.Mock())
+            view(mock.Mock())
+
+        msg_import = "A view deveria ser importada uma única vez"
+        self.assertEqual(1, import_string.call_count, msg_import)
+
+    def test_worker_starts_without_optional_apps(self):
+        """O worker da API não deve carregar o drf_spectacular nem o admin"""
+
+        code = (
+            "import sys; from django.core.wsgi import get_wsgi_application; "
+            "from django.apps import apps; from django.urls import get_resolver; "
+            "get_wsgi_application(); get_resolver().url_patterns; "
+            "print('drf_spectacular' in sys.modules, "
+            "apps.is_installed('django.contrib.admin'))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=settings.BASE_DIR,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": "_project.settings_api",
+                "SECRET_KEY": "test",
+            },
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        msg = "O worker da API carregou módulos que deveriam ser preguiçosos"
+        self.assertEqual("False False", output.strip(), msg)
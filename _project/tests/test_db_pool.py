@@ -0,0 +1,192 @@
+from threading import Thread
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from _project.db.pool import ConnectionPool, PoolTimeout
+from _project.db.prepared import (
+    PreparedStatementCache,
+    is_enabled,
+    prepared_statements,
+    to_server_placeholders,
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.healthy = True
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeCursor:
+    def __init__(self, connection=None):
+        self.connection = connection
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def execute(self, sql, params=None):
+        if self.connection is not None and not self.connection.healthy:
+            raise RuntimeError("server closed the connection unexpectedly")
+
+        self.executed.append((sql, params))
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def make_pool(self, **kwargs):
+        return ConnectionPool(connect=FakeConnection, **{"max_size": 2, **kwargs})
+
+    def test_released_connection_is_reused(self):
+        """Uma conexão devolvida ao pool deve ser reaproveitada"""
+
+        pool = self.make_pool()
+        connection = pool.getconn()
+        pool.putconn(connection)
+
+        msg = "O pool deve entregar a conexão ociosa em vez de abrir outra"
+        self.assertIs(connection, pool.getconn(), msg)
+        self.assertEqual(1, pool.stats.created, msg)
+
+    def test_checkout_waits_for_a_released_connection(self):
+        """Com o pool cheio, a requisição deve esperar uma conexão ser devolvida"""
+
+        pool = self.make_pool(max_size=1, timeout=5)
+        connection = pool.getconn()
+        released = []
+
+        def release():
+            released.append(connection)
+            pool.putconn(connection)
+
+        timer = Thread(target=release)
+        timer.start()
+        waited = pool.getconn()
+        timer.join()
+
+        msg = "A conexão devolvida deve ser entregue a quem estava esperando"
+        self.assertIs(connection, waited, msg)
+        self.assertEqual(1, pool.size, msg)
+        self.assertEqual(2, len(pool.stats.wait_times), msg)
+
+    def test_checkout_times_out_when_exhausted(self):
+        """Com o pool cheio e sem devoluções, deve lançar PoolTimeout"""
+
+        pool = self.make_pool(max_size=1, timeout=0.01)
+        pool.getconn()
+
+        with self.assertRaises(PoolTimeout):
+            pool.getconn()
+
+        msg = "O timeout deve ser contabilizado nas métricas do pool"
+        self.assertEqual(1, pool.stats.as_dict()["timeouts"], msg)
+
+    def test_unhealthy_connection_is_replaced(self):
+        """Uma conexão ociosa que falha no health check deve ser substituída"""
+
+        pool = self.make_pool(health_check_interval=0)
+        connection = pool.getconn()
+        connection.healthy = False
+        pool.putconn(connection)
+
+        replacement = pool.getconn()
+
+        msg = "A conexão quebrada deve ser fechada e substituída por uma nova"
+        self.assertIsNot(connection, replacement, msg)
+        self.assertTrue(connection.closed, msg)
+        self.assertEqual(1, pool.size, msg)
+        self.assertEqual(1, pool.stats.discarded, msg)
+
+    def test_expired_connection_is_replaced(self):
+        """Conexões mais antigas que max_lifetime devem ser recicladas"""
+
+        pool = self.make_pool(max_lifetime=60)
+        connection = pool.getconn()
+        pool.putconn(connection)
+
+        with mock.patch("_project.db.pool.monotonic", return_value=10**9):
+            replacement = pool.getconn()
+
+        msg = "A conexão expirada não deve voltar a ser usada"
+        self.assertIsNot(connection, replacement, msg)
+        self.assertTrue(connection.closed, msg)
+
+    def test_discarded_connection_frees_its_slot(self):
+        """Descartar uma conexão deve liberar espaço no pool"""
+
+        pool = self.make_pool(max_size=1, timeout=0.01)
+        pool.discard(pool.getconn())
+
+        msg = "Após o descarte, uma nova conexão deve poder ser aberta"
+        self.assertIsNotNone(pool.getconn(), msg)
+        self.assertEqual(2, pool.stats.created, msg)
+
+
+class PreparedStatementTests(SimpleTestCase):
+    def test_placeholders_are_numbered(self):
+        """Os placeholders do psycopg2 devem virar parâmetros numerados"""
+
+        statement, count = to_server_placeholders(
+            "SELECT * FROM t WHERE a LIKE '10%%' AND b = %s AND c IN (%s, %s)"
+        )
+
+        self.assertEqual(
+            "SELECT * FROM t WHERE a LIKE '10%' AND b = $1 AND c IN ($2, $3)",
+            statement,
+        )
+        self.assertEqual(3, count)
+
+    def test_statement_is_prepared_once(self):
+        """A mesma consulta deve ser preparada uma única vez por conexão"""
+
+        cache = PreparedStatementCache(max_size=8)
+        cursor = FakeCursor()
+        sql = "SELECT * FROM t WHERE id = %s"
+
+        cache.execute(cursor, sql, (1,))
+        cache.execute(cursor, sql, (2,))
+
+        name = cache.names[sql]
+
+        self.assertEqual(
+            [
+                (f"PREPARE {name} AS SELECT * FROM t WHERE id = $1", None),
+                (f"EXECUTE {name} (%s)", (1,)),
+                (f"EXECUTE {name} (%s)", (2,)),
+            ],
+            cursor.executed,
+        )
+
+    def test_least_recently_used_statement_is_deallocated(self):
+        """Ao exceder o limite, a consulta menos usada deve ser desalocada"""
+
+        cache = PreparedStatementCache(max_size=1)
+        cursor = FakeCursor()
+
+        cache.execute(cursor, "SELECT 1", ())
+        evicted = cache.names["SELECT 1"]
+        cache.execute(cursor, "SELECT 2", ())
+
+        msg = "A consulta antiga deve ser desalocada no servidor"
+        self.assertIn((f"DEALLOCATE {evicted}", None), cursor.executed, msg)
+        self.assertEqual(["SELECT 2"], list(cache.names), msg)
+
+    def test_prepared_statements_are_scoped(self):
+        """prepared_statements() deve valer apenas dentro do bloco"""
+
+        self.assertFalse(is_enabled())
+
+        with prepared_statements():
+            self.assertTrue(is_enabled())
+
+        self.assertFalse(is_enabled())
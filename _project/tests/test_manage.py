@@ -0,0 +1,27 @@
+from unittest import mock
+import os
+
+from django.test import SimpleTestCase
+
+import manage
+
+
+class ManageProfileTests(SimpleTestCase):
+    def run_manage(self, *argv, **environ) -> str | None:
+        with mock.patch.dict(os.environ), mock.patch(
+            "sys.argv", ["manage.py", *argv]
+        ), mock.patch("django.core.management.execute_from_command_line"):
+            os.environ.pop("DJANGO_PROFILE", None)
+            os.environ.update(environ)
+            manage.main()
+
+            return os.environ.get("DJANGO_PROFILE")
+
+    def test_test_command_selects_the_test_profile(self):
+        """O comando test deve usar o perfil test por padrão"""
+
+        msg = "O perfil escolhido esta diferente do esperado"
+
+        self.assertEqual("test", self.run_manage("test"), msg)
+        self.assertIsNone(self.run_manage("runserver"), msg)
+        self.assertEqual("dev", self.run_manage("test", DJANGO_PROFILE="dev"), msg)
@@ -0,0 +1,32 @@
+"""
+URLconf of the API-only workers (`_project.settings_api`).
+
+The schema view pulls in drf_spectacular, so it is only imported the first
+time /schema/ is requested. The admin and the docs UIs are not served here.
+"""
+from django.urls import path, include
+from django.utils.module_loading import import_string
+
+from utils.instrumentation import TimingHistogramView
+
+
+def lazy_view(dotted_path, **initkwargs):
+    view = None
+
+    def dispatch(request, *args, **kwargs):
+        nonlocal view
+
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+
+        return view(request, *args, **kwargs)
+
+    return dispatch
+
+
+urlpatterns = [
+    path("api/", include("users.urls")),
+    path("api/", include("products.urls")),
+    path("api/metrics/timings/", TimingHistogramView.as_view()),
+    path("schema/", lazy_view("utils.schema.PrecomputedSchemaView"), name="schema"),
+]
@@ -0,0 +1,14 @@
+"""
+WSGI config of the API-only workers.
+
+Same application as ``_project.wsgi``, with the slimmer app and middleware
+stack of ``_project.settings_api``.
+"""
+
+import os
+
+from django.core.wsgi import get_wsgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "_project.settings_api")
+
+application = get_wsgi_application()
@@ -0,0 +1,24 @@
+import os
+
+from .benchmark_settings import Command as SettingsBenchmark
+
+
+class Command(SettingsBenchmark):
+    help = (
+        "Compares cold start and per-request middleware cost of the full "
+        "application and of the API-only workers (_project.settings_api)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full-settings",
+            default=os.getenv("DJANGO_SETTINGS_MODULE", "_project.settings"),
+        )
+        parser.add_argument("--api-settings", default="_project.settings_api")
+        self.add_measure_arguments(parser)
+
+    def get_variants(self, options) -> dict:
+        return {
+            "full": {"DJANGO_SETTINGS_MODULE": options["full_settings"]},
+            "api": {"DJANGO_SETTINGS_MODULE": options["api_settings"]},
+        }
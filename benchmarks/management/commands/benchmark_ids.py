@@ -0,0 +1,84 @@
+from time import perf_counter
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from benchmarks.utils import rolled_back
+from products.models import Product
+from users.models import User
+from utils.ids import uuid7
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares product insert throughput with random (v4) and time-ordered (v7) keys"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--report-every", type=int, default=200_000)
+
+    def get_index_size(self) -> str:
+        if connection.vendor != "postgresql":
+            return "n/a"
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_size_pretty(pg_relation_size(indexrelid)) "
+                "FROM pg_index WHERE indrelid = 'products_product'::regclass "
+                "AND indisprimary"
+            )
+            return cursor.fetchone()[0]
+
+    def handle(self, *args, **options):
+        rows, batch_size = options["rows"], options["batch_size"]
+
+        for name, generate_id in GENERATORS.items():
+            with rolled_back():
+                seller = User.objects.create_user(
+                    username="benchmark-seller",
+                    password="benchmark",
+                    first_name="Benchmark",
+                    last_name="Seller",
+                    is_seller=True,
+                )
+                inserted, elapsed = 0, 0.0
+                window_rows, window = 0, 0.0
+
+                while inserted < rows:
+                    size = min(batch_size, rows - inserted)
+                    products = [
+                        Product(
+                            id=generate_id(),
+                            description="Benchmark product",
+                            price=10,
+                            quantity=1,
+                            user=seller,
+                        )
+                        for _ in range(size)
+                    ]
+
+                    start = perf_counter()
+                    Product.objects.bulk_create(products)
+                    spent = perf_counter() - start
+
+                    elapsed += spent
+                    window += spent
+                    inserted += size
+                    window_rows += size
+
+                    if inserted % options["report_every"] < size or inserted == rows:
+                        self.stdout.write(
+                            f"{name}: {inserted:>9} rows  "
+                            f"last window {window_rows / window:,.0f} rows/s"
+                        )
+                        window_rows, window = 0, 0.0
+
+                self.stdout.write(
+                    f"{name}: total {rows / elapsed:,.0f} rows/s  "
+                    f"pk index {self.get_index_size()}"
+                )
@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.utils import summarize
+from users.models import User
+from users.views import LoginView
+
+OPTIONAL_HASHERS = {"argon2": "argon2", "bcrypt_sha256": "bcrypt"}
+
+
+class Command(BaseCommand):
+    help = "Measures POST /api/login/ throughput per hashing core for each available hasher"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=0)
+
+    def get_hashers(self):
+        return [
+            name
+            for name in ("pbkdf2", "scrypt", "argon2", "bcrypt_sha256")
+            if name not in OPTIONAL_HASHERS or find_spec(OPTIONAL_HASHERS[name])
+        ]
+
+    def run_logins(self, user, headers, logins, concurrency):
+        view = LoginView.as_view()
+        factory = APIRequestFactory(SERVER_NAME="localhost")
+        data = {"username": user.username, "password": "benchmark"}
+
+        def login(_):
+            start = perf_counter()
+            response = view(factory.post("/api/login/", data, **headers))
+            assert response.status_code == 200, response.data
+            connections.close_all()
+
+            return perf_counter() - start
+
+        start = perf_counter()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(login, range(logins)))
+
+        return logins / (perf_counter() - start), summarize(samples)
+
+    def handle(self, *args, **options):
+        cores = settings.PASSWORD_HASHING_WORKERS
+        concurrency = options["concurrency"] or 2 * cores
+        user = User.objects.create_user(
+            username="benchmark-login",
+            password="benchmark",
+            first_name="Benchmark",
+            last_name="Login",
+        )
+
+        try:
+            scenarios = [(name, {}) for name in self.get_hashers()]
+            token = Token.objects.create(user=user)
+            scenarios.append(
+                ("token reuse", {"HTTP_AUTHORIZATION": f"Token {token.key}"})
+            )
+
+            for name, headers in scenarios:
+                hasher = settings.PASSWORD_HASHER_CLASSES.get(name)
+                hashers = [hasher] if hasher else settings.PASSWORD_HASHERS
+
+                with override_settings(PASSWORD_HASHERS=hashers):
+                    User.objects.filter(pk=user.pk).update(
+                        password=make_password("benchmark")
+                    )
+                    rate, stats = self.run_logins(
+                        user, headers, options["logins"], concurrency
+                    )
+
+                self.stdout.write(
+                    f"{name:>13}: {rate:8.1f} logins/s  {rate / cores:8.1f} /core  "
+                    + "  ".join(f"{key}={value:.2f}" for key, value in stats.items())
+                )
+        finally:
+            user.delete()
@@ -0,0 +1,88 @@
+from unittest import mock
+import warnings
+
+from django.core.management.base import BaseCommand
+from django.core.paginator import UnorderedObjectListWarning
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.utils import measure, rolled_back, summarize
+from products.models import Product
+from products.views import ProductView
+from users.models import User
+from utils import KeysetPagination
+
+
+class SizedPageNumberPagination(PageNumberPagination):
+    page_size_query_param = "page_size"
+
+
+class Command(BaseCommand):
+    help = "Compares page-number and keyset latency on the first and a deep page of /api/products/"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page", type=int, default=1000)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=30)
+
+    def handle(self, *args, **options):
+        page, page_size = options["page"], options["page_size"]
+        view = ProductView.as_view(
+            pagination_map={
+                "page": SizedPageNumberPagination,
+                "keyset": KeysetPagination,
+            }
+        )
+        factory = APIRequestFactory(SERVER_NAME="localhost")
+        warnings.simplefilter("ignore", UnorderedObjectListWarning)
+
+        # Compare the paginators, not the anonymous response cache.
+        with rolled_back(), mock.patch.object(ProductView, "response_cache", None):
+            seller = User.objects.create_user(
+                username="benchmark-seller",
+                password="benchmark",
+                first_name="Benchmark",
+                last_name="Seller",
+                is_seller=True,
+            )
+            Product.objects.bulk_create(
+                (
+                    Product(
+                        description=f"Benchmark product {index}",
+                        price=10,
+                        quantity=1,
+                        user=seller,
+                    )
+                    for index in range(page * page_size)
+                ),
+                batch_size=1000,
+            )
+
+            boundary = Product.objects.order_by(*ProductView.keyset_ordering)[
+                (page - 1) * page_size - 1
+            ]
+            deep_cursor = KeysetPagination().encode_cursor(
+                [boundary.created_at, boundary.id],
+                ordering=ProductView.keyset_ordering,
+            )
+
+            scenarios = {
+                "page 1": {"pagination": "page", "page": 1},
+                f"page {page}": {"pagination": "page", "page": page},
+                "keyset 1": {"pagination": "keyset"},
+                f"keyset {page}": {"pagination": "keyset", "cursor": deep_cursor},
+            }
+
+            for name, params in scenarios.items():
+                request_params = {**params, "page_size": page_size}
+
+                def run():
+                    response = view(factory.get("/api/products/", request_params))
+                    assert response.status_code == 200, response.data
+                    assert "X-Cache" not in response, response["X-Cache"]
+
+                stats = summarize(measure(run, options["repeat"]))
+                self.stdout.write(
+                    f"{name:>14}: "
+                    + "  ".join(f"{key}={value:.2f}" for key, value in stats.items())
+                )
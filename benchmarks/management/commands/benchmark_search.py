@@ -0,0 +1,115 @@
+from random import Random
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.utils import measure, rolled_back, summarize
+from products.models import Product
+from products.search import search_index
+from products.views import ProductView
+from users.models import User
+
+ADJECTIVES = ["preto", "branco", "azul", "compacto", "premium", "sem fio", "digital"]
+NOUNS = ["smartband", "fone", "teclado", "mouse", "monitor", "cabo", "carregador"]
+RARE_TERM = "raridade"
+
+
+class Command(BaseCommand):
+    help = "Measures ?q= search latency on /api/products/ over a synthetic catalog"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=30)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def describe(self, random: Random, index: int) -> str:
+        words = random.sample(ADJECTIVES, 2) + random.sample(NOUNS, 2)
+
+        if index % 10_000 == 0:
+            words.append(RARE_TERM)
+
+        return f"{' '.join(words)} modelo {index}"
+
+    def handle(self, *args, **options):
+        random = Random(options["seed"])
+        view = ProductView.as_view()
+        factory = APIRequestFactory(SERVER_NAME="localhost")
+
+        with rolled_back():
+            seller = User.objects.create_user(
+                username="benchmark-seller",
+                password="benchmark",
+                first_name="Benchmark",
+                last_name="Seller",
+                is_seller=True,
+            )
+
+            start = perf_counter()
+            remaining = options["products"]
+
+            while remaining:
+                size = min(remaining, options["batch_size"])
+                Product.objects.bulk_create(
+                    Product(
+                        description=self.describe(random, remaining - index),
+                        price=10,
+                        quantity=1,
+                        user=seller,
+                    )
+                    for index in range(size)
+                )
+                remaining -= size
+
+            self.stdout.write(
+                f"seeded {options['products']} products in {perf_counter() - start:.1f}s"
+            )
+
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE products_product")
+            else:
+                start = perf_counter()
+                search_index.clear()
+                search_index.build(
+                    Product.objects.values_list("pk", "description").iterator(
+                        chunk_size=5000
+                    )
+                )
+                self.stdout.write(
+                    f"built inverted index in {perf_counter() - start:.1f}s"
+                )
+
+            scenarios = {
+                "search common": {"q": "smartband"},
+                "search two terms": {"q": "smartband azul"},
+                "search rare": {"q": RARE_TERM},
+                "icontains rare": None,
+            }
+
+            for name, params in scenarios.items():
+                if params is None:
+
+                    def run():
+                        list(
+                            Product.objects.filter(description__icontains=RARE_TERM)[
+                                :20
+                            ]
+                        )
+
+                else:
+                    request_params = {**params, "pagination": "keyset", "page_size": 20}
+
+                    def run():
+                        response = view(factory.get("/api/products/", request_params))
+                        assert response.status_code == 200, response.data
+
+                stats = summarize(measure(run, options["repeat"]))
+                self.stdout.write(
+                    f"{name:>16}: "
+                    + "  ".join(f"{key}={value:.2f}" for key, value in stats.items())
+                )
+
+            search_index.clear()
@@ -0,0 +1,82 @@
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from benchmarks.seed import seed_products, seed_sellers
+from benchmarks.utils import measure, rolled_back
+from products.models import Product
+from products.serializers import ProductDetailSerializer, ProductSerializer
+from users.models import User
+from users.serializers import AccountSerializer
+from utils import compile_serializer
+from utils.query_plan import get_query_plan
+
+SERIALIZERS = {
+    "ProductSerializer": (ProductSerializer, Product),
+    "ProductDetailSerializer": (ProductDetailSerializer, Product),
+    "AccountSerializer": (AccountSerializer, User),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares rows/s of the regular and the compiled read serializers, "
+        "with and without the query, over a seeded catalog"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sellers", type=int, default=1000)
+        parser.add_argument("--products", type=int, default=10_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def get_scenarios(self, serializer_class, model) -> tuple[dict, int]:
+        compiled = compile_serializer(serializer_class)
+        queryset = get_query_plan(serializer_class).apply(model.objects.order_by("pk"))
+        values = model.objects.order_by("pk").values(*compiled.lookups)
+        instances, rows = list(queryset), list(values)
+
+        regular = JSONRenderer().render(serializer_class(instances, many=True).data)
+
+        if regular != JSONRenderer().render(compiled.to_representation(rows)):
+            raise CommandError(
+                f"{serializer_class.__name__}: compiled output differs from DRF"
+            )
+
+        return {
+            "regular": lambda: serializer_class(instances, many=True).data,
+            "compiled": lambda: compiled.to_representation(rows),
+            "regular + query": lambda: serializer_class(
+                list(queryset.all()), many=True
+            ).data,
+            "compiled + query": lambda: compiled.to_representation(list(values.all())),
+        }, len(rows)
+
+    def handle(self, *args, **options):
+        if options["products"] < options["sellers"]:
+            raise CommandError("--products must be at least --sellers")
+
+        with rolled_back():
+            seller_ids = seed_sellers(options["sellers"], options["batch_size"])
+            seed_products(
+                seller_ids, options["products"], options["batch_size"], options["seed"]
+            )
+
+            for name, (serializer_class, model) in SERIALIZERS.items():
+                scenarios, total = self.get_scenarios(serializer_class, model)
+                rates = {}
+
+                for scenario, func in scenarios.items():
+                    samples = measure(func, options["repeat"])
+                    rates[scenario] = total / statistics.fmean(samples)
+
+                self.stdout.write(f"{name} ({total} rows, identical JSON):")
+
+                for scenario, rate in rates.items():
+                    baseline = rates[scenario.replace("compiled", "regular")]
+                    self.stdout.write(
+                        f"{scenario:>18}: {rate:12.0f} rows/s  "
+                        f"x{rate / baseline:.2f}"
+                    )
@@ -0,0 +1,136 @@
+from time import perf_counter
+from unittest import mock
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.test.client import RequestFactory
+
+from benchmarks.utils import measure, summarize
+from products.views import ProductDetailView, ProductView
+
+ROUTES = [
+    "/api/products/?pagination=keyset&page_size=20",
+    "/api/accounts/?pagination=keyset&page_size=20",
+    "/api/products/not-a-product/",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares process startup time and per-request overhead of the dev, test "
+        "and prod settings profiles, each in a fresh interpreter"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", nargs="+", default=list(settings.PROFILES))
+        self.add_measure_arguments(parser)
+
+    def add_measure_arguments(self, parser):
+        parser.add_argument("--starts", type=int, default=5)
+        parser.add_argument("--repeat", type=int, default=500)
+        parser.add_argument(
+            "--probe",
+            action="store_true",
+            help="Measure the current settings and print JSON (used internally)",
+        )
+
+    def get_variants(self, options) -> dict:
+        """Environment overrides of each compared variant, by label."""
+        return {profile: {"DJANGO_PROFILE": profile} for profile in options["profiles"]}
+
+    def measure_startup(self, variants, starts) -> dict:
+        # Interpreter start, settings, app registry and URLconf: what a
+        # worker pays before it can serve its first request. Variants take
+        # turns so machine noise is spread evenly across them.
+        code = (
+            "import django; from django.core.wsgi import get_wsgi_application; "
+            "from django.urls import get_resolver; "
+            "get_wsgi_application(); get_resolver().url_patterns"
+        )
+        samples = {label: [] for label in variants}
+
+        for _ in range(starts):
+            for label, overrides in variants.items():
+                start = perf_counter()
+                subprocess.run(
+                    [sys.executable, "-c", code],
+                    env={**os.environ, **overrides},
+                    check=True,
+                )
+                samples[label].append(perf_counter() - start)
+
+        return {label: summarize(samples[label]) for label in variants}
+
+    def probe(self, repeat) -> dict:
+        handler = WSGIHandler()
+        factory = RequestFactory(SERVER_NAME="localhost")
+        results = {}
+
+        for route in ROUTES:
+            path, _, query = route.partition("?")
+
+            def run():
+                environ = factory._base_environ(PATH_INFO=path, QUERY_STRING=query)
+                response = handler(environ, lambda status, headers: None)
+                b"".join(response)
+                response.close()
+
+            # Compare the request cycle, not the anonymous response cache.
+            with mock.patch.object(
+                ProductView, "response_cache", None
+            ), mock.patch.object(ProductDetailView, "response_cache", None):
+                results[route] = summarize(measure(run, repeat, warmup=10))
+
+        return {
+            "debug": settings.DEBUG,
+            "apps": len(settings.INSTALLED_APPS),
+            "middleware": len(settings.MIDDLEWARE),
+            "requests": results,
+        }
+
+    def handle(self, *args, **options):
+        if options["probe"]:
+            self.stdout.write(json.dumps(self.probe(options["repeat"])))
+            return
+
+        variants = self.get_variants(options)
+        startups = self.measure_startup(variants, options["starts"])
+
+        for label, overrides in variants.items():
+            probe = subprocess.run(
+                [
+                    sys.executable,
+                    "manage.py",
+                    "benchmark_settings",
+                    "--probe",
+                    f"--repeat={options['repeat']}",
+                ],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, **overrides},
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            report = json.loads(probe.stdout)
+
+            self.stdout.write(
+                f"{label}: debug={report['debug']} "
+                f"apps={report['apps']} middleware={report['middleware']}"
+            )
+            self.stdout.write(
+                f"{'startup':>48}: "
+                + "  ".join(
+                    f"{key}={value:.2f}" for key, value in startups[label].items()
+                )
+            )
+
+            for route, stats in report["requests"].items():
+                self.stdout.write(
+                    f"{route:>48}: "
+                    + "  ".join(f"{key}={value:.2f}" for key, value in stats.items())
+                )
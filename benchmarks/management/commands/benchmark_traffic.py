@@ -0,0 +1,294 @@
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from unittest import mock
+import json
+import statistics
+import subprocess
+import warnings
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import UnorderedObjectListWarning
+from django.db import connection
+from django.test import Client
+from rest_framework.authtoken.models import Token
+
+from benchmarks.seed import seed_products, seed_sellers
+from benchmarks.traffic import TRAFFIC_MIX, TrafficMix
+from benchmarks.utils import rolled_back, summarize
+from products.cache import catalog_cache
+from products.models import Product
+from products.search import search_index
+from products.views import ProductChangesView, ProductDetailView, ProductView
+from users.models import User
+from users.recent import recent_signups
+from utils import FeedPagination
+
+
+def get_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return result.stdout.strip()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a synthetic catalog, replays a weighted traffic mix over every "
+        "products and users route in-process and writes req/s, latency "
+        "percentiles and queries per request to a JSON file"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sellers", type=int, default=1000)
+        parser.add_argument("--products", type=int, default=100_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--warmup", type=int, default=200)
+        parser.add_argument("--active-sellers", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--no-response-cache",
+            action="store_true",
+            help="Bypass the anonymous catalog response cache",
+        )
+        parser.add_argument("--output", default="benchmark-traffic.json")
+        parser.add_argument(
+            "--compare", help="Earlier result file to print the change against"
+        )
+
+    def seed(self, options) -> dict:
+        start = perf_counter()
+        seller_ids = seed_sellers(options["sellers"], options["batch_size"])
+        seed_products(
+            seller_ids, options["products"], options["batch_size"], options["seed"]
+        )
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE users_user")
+                cursor.execute("ANALYZE products_product")
+
+        return {
+            "sellers": options["sellers"],
+            "products": options["products"],
+            "seconds": round(perf_counter() - start, 2),
+            "seller_ids": seller_ids,
+        }
+
+    def get_fixtures(self, seller_ids, active_sellers) -> dict:
+        sellers = []
+
+        for seller in User.objects.filter(pk__in=seller_ids[:active_sellers]):
+            sellers.append(
+                {
+                    "id": str(seller.pk),
+                    "username": seller.username,
+                    "token": Token.objects.create(user=seller).key,
+                    "product_ids": list(
+                        Product.objects.filter(user=seller).values_list(
+                            "pk", flat=True
+                        )[:20]
+                    ),
+                }
+            )
+
+        buyer = User.objects.create_user(username="bench-buyer", password="bench")
+        admin = User.objects.create_superuser(username="bench-admin", password="bench")
+
+        return {
+            "sellers": sellers,
+            "product_ids": list(
+                Product.objects.order_by(*ProductView.keyset_ordering).values_list(
+                    "pk", flat=True
+                )[:1000]
+            ),
+            "buyer_token": Token.objects.create(user=buyer).key,
+            "admin_token": Token.objects.create(user=admin).key,
+            "managed_ids": seller_ids[active_sellers : active_sellers * 2],
+            "changes_cursor": FeedPagination().encode_cursor(
+                Product.objects.order_by("-revision", "-id").values_list(
+                    "revision", "id"
+                )[0],
+                ordering=ProductChangesView.keyset_ordering,
+            ),
+        }
+
+    def send(self, client, method, path, data, token):
+        extra = {"HTTP_AUTHORIZATION": f"Token {token}"} if token else {}
+        body = json.dumps(data) if data is not None else ""
+
+        response = client.generic(
+            method, path, body, content_type="application/json", **extra
+        )
+
+        if response.streaming:
+            b"".join(response.streaming_content)
+
+        return response
+
+    def replay(self, mix, total) -> dict:
+        client = Client(SERVER_NAME="localhost", raise_request_exception=False)
+        samples, queries = defaultdict(list), defaultdict(list)
+        statuses = defaultdict(Counter)
+        counter = QueryCounter()
+
+        with connection.execute_wrapper(counter):
+            for name, method, path, data, token in mix.requests(total):
+                counter.count = 0
+                start = perf_counter()
+                response = self.send(client, method, path, data, token)
+                samples[name].append(perf_counter() - start)
+                queries[name].append(counter.count)
+                statuses[name][str(response.status_code)] += 1
+
+        return {"samples": samples, "queries": queries, "statuses": statuses}
+
+    def report(self, results, elapsed) -> dict:
+        routes = {}
+        all_samples, all_queries = [], []
+
+        for name, (weight, method, route) in TRAFFIC_MIX.items():
+            samples = results["samples"].get(name)
+
+            if not samples:
+                continue
+
+            all_samples.extend(samples)
+            all_queries.extend(results["queries"][name])
+            routes[name] = {
+                "method": method,
+                "route": route,
+                "weight": weight,
+                "requests": len(samples),
+                "req_per_s": len(samples) / sum(samples),
+                **summarize(samples),
+                "queries_per_request": statistics.fmean(results["queries"][name]),
+                "statuses": dict(results["statuses"][name]),
+            }
+
+        return {
+            "total": {
+                "requests": len(all_samples),
+                "req_per_s": len(all_samples) / elapsed,
+                **summarize(all_samples),
+                "queries_per_request": statistics.fmean(all_queries),
+            },
+            "routes": routes,
+        }
+
+    def write_summary(self, report):
+        rows = [("total", report["total"]), *report["routes"].items()]
+
+        for name, stats in rows:
+            self.stdout.write(
+                f"{name:>22}: {stats['req_per_s']:8.1f} req/s  "
+                f"p50={stats['p50_ms']:.2f}  p95={stats['p95_ms']:.2f}  "
+                f"p99={stats['p99_ms']:.2f}  "
+                f"queries={stats['queries_per_request']:.1f}"
+            )
+
+    def write_comparison(self, report, baseline):
+        self.stdout.write(f"\nchange against {baseline.get('commit') or 'baseline'}:")
+        rows = [("total", report["total"], baseline["total"])]
+        rows.extend(
+            (name, stats, baseline["routes"][name])
+            for name, stats in report["routes"].items()
+            if name in baseline["routes"]
+        )
+
+        for name, stats, before in rows:
+            changes = "  ".join(
+                f"{key}={(stats[key] - before[key]) / before[key] * 100:+.1f}%"
+                for key in ("req_per_s", "p50_ms", "p95_ms", "p99_ms")
+                if before[key]
+            )
+            self.stdout.write(f"{name:>22}: {changes}")
+
+    def handle(self, *args, **options):
+        if options["products"] < options["sellers"]:
+            raise CommandError("--products must be at least --sellers")
+
+        if options["sellers"] < options["active_sellers"] * 2:
+            raise CommandError("--sellers must be at least twice --active-sellers")
+
+        baseline = None
+
+        if options["compare"]:
+            baseline = json.loads(Path(options["compare"]).read_text())
+
+        warnings.simplefilter("ignore", UnorderedObjectListWarning)
+        caches = ExitStack()
+
+        if options["no_response_cache"]:
+            for view in (ProductView, ProductDetailView):
+                caches.enter_context(mock.patch.object(view, "response_cache", None))
+
+        with caches:
+            with rolled_back():
+                seeding = self.seed(options)
+                self.stdout.write(
+                    f"seeded {seeding['sellers']} sellers and {seeding['products']} "
+                    f"products in {seeding['seconds']}s"
+                )
+
+                fixtures = self.get_fixtures(
+                    seeding.pop("seller_ids"), options["active_sellers"]
+                )
+                mix = TrafficMix(fixtures, options["seed"])
+                self.replay(mix, options["warmup"])
+
+                start = perf_counter()
+                results = self.replay(mix, options["requests"])
+                elapsed = perf_counter() - start
+
+            # Rolled back rows must not outlive the run in shared caches.
+            catalog_cache.bump()
+            search_index.clear()
+            recent_signups.clear()
+
+        report = {
+            "commit": get_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "database": connection.vendor,
+            "options": {
+                key: options[key]
+                for key in (
+                    "sellers",
+                    "products",
+                    "requests",
+                    "warmup",
+                    "seed",
+                    "no_response_cache",
+                )
+            },
+            "seed": seeding,
+            **self.report(results, elapsed),
+        }
+        Path(options["output"]).write_text(json.dumps(report, indent=2) + "\n")
+
+        self.write_summary(report)
+
+        if baseline:
+            self.write_comparison(report, baseline)
+
+        self.stdout.write(f"\nresults written to {options['output']}")
@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+from time import perf_counter
+from unittest import mock
+import asyncio
+import tracemalloc
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test.client import RequestFactory
+
+from _project.db.pool import pool_stats
+from benchmarks.utils import summarize
+from products.models import Product
+from products.views import ProductDetailView, ProductView
+from users.models import User
+
+ROUTES = {
+    "sync": [
+        "/api/products/?pagination=keyset&page_size=20",
+        "/api/products/{product_id}/",
+        "/api/accounts/?pagination=keyset&page_size=20",
+    ],
+    "async": [
+        "/api/async/products/?page_size=20",
+        "/api/async/products/{product_id}/",
+        "/api/async/accounts/?page_size=20",
+    ],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Replays the read endpoints through the WSGI handler on a thread pool and "
+        "through the ASGI handler on an event loop, at the same concurrency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--products", type=int, default=1000)
+        parser.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Report the peak Python heap of each mode (slows both down)",
+        )
+
+    def get_paths(self, mode, product_id, requests):
+        routes = [route.format(product_id=product_id) for route in ROUTES[mode]]
+
+        return list(islice(cycle(routes), requests))
+
+    def run_sync(self, paths, concurrency):
+        handler = WSGIHandler()
+        factory = RequestFactory(SERVER_NAME="localhost")
+
+        def call(path):
+            path, _, query = path.partition("?")
+            environ = factory._base_environ(PATH_INFO=path, QUERY_STRING=query)
+            start = perf_counter()
+            response = handler(environ, lambda status, headers: None)
+            b"".join(response)
+            response.close()
+
+            return perf_counter() - start, response.status_code
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(call, paths))
+            list(executor.map(lambda _: connections.close_all(), range(concurrency)))
+
+        return results
+
+    async def run_async(self, paths, concurrency):
+        handler = ASGIHandler()
+        slots = asyncio.Semaphore(concurrency)
+
+        async def call(path):
+            path, _, query = path.partition("?")
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": query.encode(),
+                "headers": [(b"host", b"localhost")],
+                "server": ("localhost", 80),
+                "client": ("127.0.0.1", 0),
+            }
+            messages = []
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                messages.append(message)
+
+            async with slots:
+                start = perf_counter()
+                await handler(scope, receive, send)
+
+            return perf_counter() - start, messages[0]["status"]
+
+        return await asyncio.gather(*(call(path) for path in paths))
+
+    def run_mode(self, mode, paths, concurrency, trace_memory):
+        if trace_memory:
+            tracemalloc.start()
+
+        start = perf_counter()
+
+        if mode == "sync":
+            results = self.run_sync(paths, concurrency)
+        else:
+            results = asyncio.run(self.run_async(paths, concurrency))
+
+        elapsed = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        tracemalloc.stop()
+
+        failures = [status for _, status in results if status != 200]
+        assert not failures, f"{mode}: {len(failures)} failed requests {failures[:5]}"
+
+        return len(paths) / elapsed, summarize([sample for sample, _ in results]), peak
+
+    def handle(self, *args, **options):
+        seller = User.objects.create_user(
+            username="loadtest-seller",
+            password="loadtest",
+            first_name="Load",
+            last_name="Test",
+            is_seller=True,
+        )
+
+        try:
+            Product.objects.bulk_create(
+                Product(
+                    description=f"Load test {index}", price=10, quantity=1, user=seller
+                )
+                for index in range(options["products"])
+            )
+            product_id = Product.objects.filter(user=seller).values_list(
+                "pk", flat=True
+            )[0]
+
+            # Compare the handlers, not the anonymous response cache.
+            with mock.patch.object(
+                ProductView, "response_cache", None
+            ), mock.patch.object(ProductDetailView, "response_cache", None):
+                for mode in ("sync", "async"):
+                    paths = self.get_paths(mode, product_id, options["requests"])
+                    rate, stats, peak = self.run_mode(
+                        mode, paths, options["concurrency"], options["trace_memory"]
+                    )
+                    memory = f"  peak_heap={peak / 2**20:.1f}MiB" if peak else ""
+
+                    self.stdout.write(
+                        f"{mode:>5}: {rate:8.1f} req/s  "
+                        + "  ".join(
+                            f"{key}={value:.2f}" for key, value in stats.items()
+                        )
+                        + memory
+                    )
+
+            # Only populated when the pooled backend is enabled (DB_POOL_ENABLED).
+            for alias, stats in pool_stats().items():
+                self.stdout.write(
+                    f"pool {alias}: "
+                    + "  ".join(
+                        f"{key}={round(value, 2)}" for key, value in stats.items()
+                    )
+                )
+        finally:
+            seller.delete()
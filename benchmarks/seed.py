@@ -0,0 +1,63 @@
+from random import Random
+
+from django.contrib.auth.hashers import make_password
+
+from products.models import Product
+from users.models import User
+from utils import batched
+
+ADJECTIVES = ["preto", "branco", "azul", "compacto", "premium", "sem fio", "digital"]
+NOUNS = ["smartband", "fone", "teclado", "mouse", "monitor", "cabo", "carregador"]
+SEED_PASSWORD = "benchmark"
+
+
+def seed_sellers(total: int, batch_size: int = 5000, prefix: str = "bench") -> list:
+    """
+    Bulk inserts `total` sellers whose password is SEED_PASSWORD. The hash is
+    computed once and shared, so seeding does not pay the hasher per row.
+    """
+    password = make_password(SEED_PASSWORD)
+    sellers = (
+        User(
+            username=f"{prefix}-seller-{index}",
+            password=password,
+            first_name="Vendedor",
+            last_name=str(index),
+            is_seller=True,
+        )
+        for index in range(total)
+    )
+    seller_ids = []
+
+    for batch in batched(sellers, batch_size):
+        User.objects.bulk_create(batch)
+        seller_ids.extend(seller.pk for seller in batch)
+
+    return seller_ids
+
+
+def describe(random: Random, index: int) -> str:
+    words = random.sample(ADJECTIVES, 2) + random.sample(NOUNS, 2)
+
+    return f"{' '.join(words)} modelo {index}"
+
+
+def seed_products(
+    seller_ids: list, total: int, batch_size: int = 5000, seed: int = 42
+) -> int:
+    """Bulk inserts `total` products spread round-robin over `seller_ids`."""
+    random = Random(seed)
+    products = (
+        Product(
+            description=describe(random, index),
+            price=random.randint(100, 100_000) / 100,
+            quantity=random.randint(0, 1000),
+            user_id=seller_ids[index % len(seller_ids)],
+        )
+        for index in range(total)
+    )
+
+    for batch in batched(products, batch_size):
+        Product.objects.bulk_create(batch)
+
+    return total
@@ -0,0 +1,185 @@
+from itertools import count
+from random import Random
+
+from .seed import ADJECTIVES, NOUNS, SEED_PASSWORD
+
+# name: (weight, method, URL pattern). Every route of products/urls.py and
+# users/urls.py appears at least once; reads dominate, as in production.
+TRAFFIC_MIX = {
+    "product_list": (20, "GET", "/api/products/"),
+    "product_list_keyset": (12, "GET", "/api/products/"),
+    "product_search": (8, "GET", "/api/products/"),
+    "product_filter": (5, "GET", "/api/products/"),
+    "product_detail": (15, "GET", "/api/products/<pk>/"),
+    "async_product_list": (3, "GET", "/api/async/products/"),
+    "async_product_detail": (3, "GET", "/api/async/products/<pk>/"),
+    "product_export": (1, "GET", "/api/products/export/"),
+    "product_changes": (3, "GET", "/api/products/changes/"),
+    "product_create": (3, "POST", "/api/products/"),
+    "product_update": (2, "PATCH", "/api/products/<pk>/"),
+    "product_bulk_create": (1, "POST", "/api/products/bulk/"),
+    "product_bulk_update": (1, "PATCH", "/api/products/bulk/"),
+    "product_reserve": (3, "POST", "/api/products/reserve/"),
+    "login": (3, "POST", "/api/login/"),
+    "account_list": (5, "GET", "/api/accounts/"),
+    "account_list_keyset": (3, "GET", "/api/accounts/"),
+    "account_newest": (3, "GET", "/api/accounts/newest/<int:num>"),
+    "async_account_list": (2, "GET", "/api/async/accounts/"),
+    "account_create": (1, "POST", "/api/accounts/"),
+    "account_update": (1, "PATCH", "/api/accounts/<pk>/"),
+    "account_management": (1, "PATCH", "/api/accounts/<pk>/management/"),
+}
+
+
+class TrafficMix:
+    """
+    Draws requests from TRAFFIC_MIX. Each route has a method of the same
+    name returning `(path, data, token)` for one request.
+
+    `fixtures` holds the seeded rows the requests point at:
+    `product_ids`, `sellers` (dicts with `id`, `username`, `token` and
+    `product_ids`), `buyer_token`, `admin_token`, `managed_ids`, the
+    accounts the admin deactivates and reactivates, and `changes_cursor`,
+    the change feed position right after seeding.
+    """
+
+    def __init__(self, fixtures: dict, seed: int = 42):
+        self.fixtures = fixtures
+        self.random = Random(seed)
+        self.names = list(TRAFFIC_MIX)
+        self.weights = [weight for weight, _, _ in TRAFFIC_MIX.values()]
+        self.counter = count()
+        self.deactivated = set()
+
+    def requests(self, total: int):
+        for name in self.random.choices(self.names, self.weights, k=total):
+            method = TRAFFIC_MIX[name][1]
+            path, data, token = getattr(self, name)()
+
+            yield name, method, path, data, token
+
+    def product_id(self):
+        return self.random.choice(self.fixtures["product_ids"])
+
+    def seller(self) -> dict:
+        return self.random.choice(self.fixtures["sellers"])
+
+    def product_payload(self) -> dict:
+        words = self.random.sample(ADJECTIVES, 2) + self.random.sample(NOUNS, 2)
+
+        return {
+            "description": f"{' '.join(words)} modelo {next(self.counter)}",
+            "price": self.random.randint(100, 100_000) / 100,
+            "quantity": self.random.randint(1, 1000),
+        }
+
+    def product_list(self):
+        return "/api/products/", None, None
+
+    def product_list_keyset(self):
+        return "/api/products/?pagination=keyset&page_size=20", None, None
+
+    def product_search(self):
+        return f"/api/products/?q={self.random.choice(NOUNS)}", None, None
+
+    def product_filter(self):
+        low = self.random.randint(1, 500)
+
+        return (
+            f"/api/products/?min_price={low}&max_price={low + 100}&in_stock=true",
+            None,
+            None,
+        )
+
+    def product_detail(self):
+        return f"/api/products/{self.product_id()}/", None, None
+
+    def async_product_list(self):
+        return "/api/async/products/?page_size=20", None, None
+
+    def async_product_detail(self):
+        return f"/api/async/products/{self.product_id()}/", None, None
+
+    def product_export(self):
+        seller = self.seller()
+
+        return f"/api/products/export/?seller={seller['id']}", None, seller["token"]
+
+    def product_changes(self):
+        path = f"/api/products/changes/?cursor={self.fixtures['changes_cursor']}"
+
+        return path, None, self.fixtures["buyer_token"]
+
+    def product_create(self):
+        return "/api/products/", self.product_payload(), self.seller()["token"]
+
+    def product_update(self):
+        seller = self.seller()
+        product_id = self.random.choice(seller["product_ids"])
+        data = {"price": self.random.randint(100, 100_000) / 100}
+
+        return f"/api/products/{product_id}/", data, seller["token"]
+
+    def product_bulk_create(self):
+        data = [self.product_payload() for _ in range(20)]
+
+        return "/api/products/bulk/", data, self.seller()["token"]
+
+    def product_bulk_update(self):
+        seller = self.seller()
+        data = [
+            {"id": str(product_id), "quantity": self.random.randint(1, 1000)}
+            for product_id in seller["product_ids"]
+        ]
+
+        return "/api/products/bulk/", data, seller["token"]
+
+    def product_reserve(self):
+        data = [{"id": str(self.product_id()), "quantity": 1}]
+
+        return "/api/products/reserve/", data, self.fixtures["buyer_token"]
+
+    def login(self):
+        data = {"username": self.seller()["username"], "password": SEED_PASSWORD}
+
+        return "/api/login/", data, None
+
+    def account_list(self):
+        return "/api/accounts/", None, None
+
+    def account_list_keyset(self):
+        return "/api/accounts/?pagination=keyset&page_size=20", None, None
+
+    def account_newest(self):
+        return f"/api/accounts/newest/{self.random.randint(1, 20)}", None, None
+
+    def async_account_list(self):
+        return "/api/async/accounts/?page_size=20", None, None
+
+    def account_create(self):
+        data = {
+            "username": f"bench-signup-{next(self.counter)}",
+            "password": SEED_PASSWORD,
+            "first_name": "Cliente",
+            "last_name": "Novo",
+            "is_seller": False,
+        }
+
+        return "/api/accounts/", data, None
+
+    def account_update(self):
+        seller = self.seller()
+        data = {"first_name": f"Vendedor {next(self.counter)}"}
+
+        return f"/api/accounts/{seller['id']}/", data, seller["token"]
+
+    def account_management(self):
+        account_id = self.random.choice(self.fixtures["managed_ids"])
+        is_active = account_id in self.deactivated
+        self.deactivated ^= {account_id}
+
+        return (
+            f"/api/accounts/{account_id}/management/",
+            {"is_active": is_active},
+            self.fixtures["admin_token"],
+        )
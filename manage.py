@@ -7,6 +7,9 @@ import sys
 def main():
     """Run administrative tasks."""
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "_project.settings")
+    # `manage.py test` runs with the test profile unless DJANGO_PROFILE is set.
+    if sys.argv[1:2] == ["test"]:
+        os.environ.setdefault("DJANGO_PROFILE", "test")
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
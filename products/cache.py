@@ -0,0 +1,4 @@
+from utils import ResponseCache
+
+
+catalog_cache = ResponseCache("catalog", alias="catalog")
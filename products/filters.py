@@ -0,0 +1,71 @@
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from .serializers import ProductFilterSerializer
+
+
+class ProductFilter(BaseFilterBackend):
+    serializer_class = ProductFilterSerializer
+    lookups = {
+        "seller": "user_id",
+        "is_active": "is_active",
+        "min_price": "price__gte",
+        "max_price": "price__lte",
+    }
+
+    def get_filters(self, request) -> dict:
+        params = {
+            name: request.query_params[name]
+            for name in self.serializer_class().fields
+            if name in request.query_params
+        }
+        serializer = self.serializer_class(data=params)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data
+
+    def filter_queryset(self, request, queryset, view):
+        filters = self.get_filters(request)
+        in_stock = filters.pop("in_stock", None)
+
+        queryset = queryset.filter(
+            **{self.lookups[name]: value for name, value in filters.items()}
+        )
+
+        if in_stock is True:
+            queryset = queryset.filter(quantity__gt=0)
+        elif in_stock is False:
+            queryset = queryset.filter(quantity=0)
+
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        types = {
+            "seller": {"type": "string", "format": "uuid"},
+            "is_active": {"type": "boolean"},
+            "min_price": {"type": "string", "format": "decimal"},
+            "max_price": {"type": "string", "format": "decimal"},
+            "in_stock": {"type": "boolean"},
+        }
+
+        return [
+            {"name": name, "required": False, "in": "query", "schema": schema}
+            for name, schema in types.items()
+        ]
+
+
+class ProductOrderingFilter(OrderingFilter):
+    """
+    Whitelisted ordering that always ends on the primary key, so keyset
+    pagination gets a unique, stable position for every row.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+
+        if not ordering:
+            return ordering
+
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            ordering = [*ordering, "-id"]
+
+        return tuple(ordering)
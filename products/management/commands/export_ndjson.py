@@ -0,0 +1,49 @@
+import sys
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.fixtures import dump_objects, write_ndjson
+
+FIXTURE_MODELS = ["users.user", "products.product", "authtoken.token"]
+
+
+class Command(BaseCommand):
+    help = "Streams users, products and tokens to an NDJSON file, one object per line"
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="File to write, or - for stdout")
+        parser.add_argument(
+            "--models",
+            nargs="+",
+            default=FIXTURE_MODELS,
+            help="Labels to export, in order (referenced models first)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--database", default="default")
+
+    def export(self, stream, options) -> dict:
+        counts = {}
+
+        for label in options["models"]:
+            try:
+                model = apps.get_model(label)
+            except LookupError as exc:
+                raise CommandError(str(exc))
+
+            queryset = model._default_manager.using(options["database"])
+            counts[label] = write_ndjson(
+                stream, dump_objects(queryset, options["chunk_size"])
+            )
+
+        return counts
+
+    def handle(self, *args, **options):
+        if options["output"] == "-":
+            counts = self.export(sys.stdout, options)
+        else:
+            with open(options["output"], "w", encoding="utf-8") as stream:
+                counts = self.export(stream, options)
+
+        for label, count in counts.items():
+            self.stderr.write(f"{label}: {count} exported")
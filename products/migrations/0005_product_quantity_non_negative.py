@@ -0,0 +1,47 @@
+# Generated by Django 4.1.2 on 2026-10-18 09:51
+
+from django.db import IntegrityError, migrations, models
+
+REPORTED_ROWS = 20
+
+
+def check_negative_quantities(apps, schema_editor):
+    # Negative stock is a data problem only its owner can settle, so the
+    # migration stops and lists the rows instead of rewriting them.
+    Product = apps.get_model("products", "Product")
+    negative = (
+        Product.objects.using(schema_editor.connection.alias)
+        .filter(quantity__lt=0)
+        .order_by("pk")
+        .values_list("pk", "quantity")
+    )
+    count = negative.count()
+
+    if count:
+        rows = ", ".join(
+            f"{pk}={quantity}" for pk, quantity in negative[:REPORTED_ROWS]
+        )
+        more = f" and {count - REPORTED_ROWS} more" if count > REPORTED_ROWS else ""
+
+        raise IntegrityError(
+            f"{count} products have a negative quantity (id=quantity: {rows}{more}). "
+            "Fix them before adding products_quantity_non_negative."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0004_product_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_negative_quantities, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="product",
+            constraint=models.CheckConstraint(
+                check=models.Q(("quantity__gte", 0)),
+                name="products_quantity_non_negative",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.1.2 on 2026-10-18 11:20
+
+from django.db import migrations
+
+# Must match the expression compiled by SearchVector("description", config="simple")
+# in products.search, otherwise the planner will not pick the index up.
+CREATE_SEARCH_INDEX = """
+CREATE INDEX IF NOT EXISTS products_description_search_idx
+ON products_product
+USING gin (to_tsvector('simple'::regconfig, COALESCE(description, '')))
+"""
+
+DROP_SEARCH_INDEX = "DROP INDEX IF EXISTS products_description_search_idx"
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SEARCH_INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_product_quantity_non_negative"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.2 on 2026-10-18 10:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_product_time_ordered_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="revision",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["revision", "id"], name="products_revision_id_idx"
+            ),
+        ),
+    ]
@@ -1,16 +1,133 @@
-from django.db import models
-import uuid
+from django.db import connections, models, router, transaction
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from utils.ids import uuid7
+
+
+class InsufficientStock(Exception):
+    def __init__(self, product_id):
+        super().__init__(f"insufficient stock for product {product_id}")
+        self.product_id = product_id
+
+
+class UnknownProduct(Exception):
+    def __init__(self, product_id):
+        super().__init__(f"product {product_id} does not exist")
+        self.product_id = product_id
+
+
+def next_revision(using: str) -> RawSQL:
+    """
+    The revision a write statement gives the rows it touches, computed by
+    the statement itself so writers share no lock.
+
+    PostgreSQL uses the id of the writing transaction; `visible_revisions`
+    holds back revisions of transactions still open, so the change feed
+    never skips a write that commits late. SQLite allows one writer at a
+    time, so the latest revision plus one already follows commit order.
+    """
+    if connections[using].vendor == "postgresql":
+        return RawSQL("txid_current()", ())
+
+    return RawSQL(
+        f"SELECT COALESCE(MAX(revision), 0) + 1 FROM {Product._meta.db_table}", ()
+    )
+
+
+def current_revision(using: str) -> int:
+    """The revision writes of the current transaction get, for COPY loads."""
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT (%s)" % next_revision(using).sql)
+
+        return cursor.fetchone()[0]
+
+
+def visible_revisions(queryset):
+    """Rows whose revision no open transaction can still commit below."""
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute("SELECT txid_snapshot_xmin(txid_current_snapshot())")
+        watermark = cursor.fetchone()[0]
+
+    return queryset.filter(revision__lt=watermark)
+
+
+class ProductQuerySet(models.QuerySet):
+    def reserve(self, quantities: dict) -> None:
+        with transaction.atomic(using=self.db):
+            for product_id in sorted(quantities, key=str):
+                quantity = quantities[product_id]
+                reserved = self.filter(
+                    pk=product_id, is_active=True, quantity__gte=quantity
+                ).update(
+                    quantity=models.F("quantity") - quantity,
+                    updated_at=timezone.now(),
+                    revision=next_revision(self.db),
+                )
+
+                if not reserved:
+                    if not self.filter(pk=product_id).exists():
+                        raise UnknownProduct(product_id)
+
+                    raise InsufficientStock(product_id)
 
 
 class Product(models.Model):
-    id = models.UUIDField(default=uuid.uuid4, primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid7, primary_key=True, editable=False)
     description = models.TextField()
     price = models.DecimalField(max_digits=10, decimal_places=2)
     quantity = models.IntegerField()
     is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Set by every write, see next_revision(); older rows share revision 0.
+    revision = models.BigIntegerField(default=0, editable=False)
 
     user = models.ForeignKey(
         "users.User",
         on_delete=models.CASCADE,
         related_name="products",
     )
+
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"], name="products_created_at_id_idx"
+            ),
+            models.Index(
+                fields=["user", "is_active"], name="products_user_is_active_idx"
+            ),
+            models.Index(
+                fields=["price", "id"],
+                name="products_active_price_idx",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="products_in_stock_created_idx",
+                condition=models.Q(quantity__gt=0),
+            ),
+            models.Index(fields=["revision", "id"], name="products_revision_id_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(quantity__gte=0),
+                name="products_quantity_non_negative",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "revision"}
+
+        self.revision = next_revision(using)
+        super().save(*args, **kwargs)
+        # The value is only known to the database; read it back on access.
+        del self.revision
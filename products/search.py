@@ -0,0 +1,187 @@
+from collections import defaultdict
+from heapq import nlargest
+import math
+import re
+import threading
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import Case, FloatField, Value, When
+from rest_framework.filters import BaseFilterBackend
+
+SEARCH_CONFIG = "simple"
+SEARCH_ORDERING = ("-rank", "-created_at", "-id")
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    In-process BM25 index over product descriptions, used where the
+    database has no full-text search (SQLite test and dev runs).
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.postings = defaultdict(dict)
+            self.lengths = {}
+            self.terms = {}
+            self.total_length = 0
+            self.built = False
+
+    def build(self, documents):
+        with self._lock:
+            self.clear()
+
+            for pk, text in documents:
+                self.add(pk, text)
+
+            self.built = True
+
+    def add(self, pk, text: str):
+        with self._lock:
+            self.remove(pk)
+            tokens = tokenize(text)
+
+            for token in tokens:
+                frequencies = self.postings[token]
+                frequencies[pk] = frequencies.get(pk, 0) + 1
+
+            self.lengths[pk] = len(tokens)
+            self.terms[pk] = set(tokens)
+            self.total_length += len(tokens)
+
+    def remove(self, pk):
+        with self._lock:
+            length = self.lengths.pop(pk, None)
+
+            if length is None:
+                return
+
+            self.total_length -= length
+
+            for token in self.terms.pop(pk):
+                frequencies = self.postings[token]
+                del frequencies[pk]
+
+                if not frequencies:
+                    del self.postings[token]
+
+    def search(self, query: str, limit: int) -> list[tuple]:
+        terms = set(tokenize(query))
+
+        with self._lock:
+            if not terms or not all(term in self.postings for term in terms):
+                return []
+
+            postings = sorted((self.postings[term] for term in terms), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            documents = len(self.lengths)
+            average_length = self.total_length / documents
+            weights = [
+                math.log(1 + (documents - len(p) + 0.5) / (len(p) + 0.5))
+                for p in postings
+            ]
+
+            def score(pk):
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.lengths[pk] / average_length
+                )
+
+                return sum(
+                    weight * p[pk] * (self.k1 + 1) / (p[pk] + norm)
+                    for weight, p in zip(weights, postings)
+                )
+
+            scored = ((pk, round(score(pk), 6)) for pk in candidates)
+
+            return nlargest(limit, scored, key=lambda hit: hit[1])
+
+
+search_index = InvertedIndex()
+
+
+def search_postgres(queryset, query: str):
+    vector = SearchVector("description", config=SEARCH_CONFIG)
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+
+    return (
+        queryset.alias(document=vector)
+        .annotate(rank=SearchRank(vector, search_query))
+        .filter(document=search_query)
+        .order_by(*SEARCH_ORDERING)
+    )
+
+
+def uses_inverted_index(queryset) -> bool:
+    return connections[queryset.db].vendor != "postgresql"
+
+
+def ensure_search_index(queryset):
+    if not search_index.built:
+        search_index.build(
+            queryset.model._default_manager.using(queryset.db)
+            .values_list("pk", "description")
+            .iterator(chunk_size=2000)
+        )
+
+
+def search_inverted_index(queryset, query: str):
+    ensure_search_index(queryset)
+
+    hits = search_index.search(query, settings.PRODUCT_SEARCH_MAX_RESULTS)
+    rank = Case(
+        *(When(pk=pk, then=Value(score)) for pk, score in hits),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+    return (
+        queryset.filter(pk__in=[pk for pk, _ in hits])
+        .annotate(rank=rank)
+        .order_by(*SEARCH_ORDERING)
+    )
+
+
+def search_products(queryset, query: str):
+    if uses_inverted_index(queryset):
+        return search_inverted_index(queryset, query)
+
+    return search_postgres(queryset, query)
+
+
+class ProductSearchFilter(BaseFilterBackend):
+    search_param = "q"
+
+    def get_search_query(self, request) -> str:
+        return request.query_params.get(self.search_param, "").strip()
+
+    def filter_queryset(self, request, queryset, view):
+        query = self.get_search_query(request)
+
+        if not query:
+            return queryset
+
+        return search_products(queryset, query)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Full-text search over the product description, ranked by relevance.",
+                "schema": {"type": "string"},
+            }
+        ]
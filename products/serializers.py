@@ -3,10 +3,11 @@ from rest_framework import serializers
 
 from .models import Product
 from users.serializers import AccountSerializer
+from utils import TimedSerializerMixin
 
 
-class ProductSerializer(serializers.ModelSerializer):
-    seller_id = serializers.UUIDField(source="user.id")
+class ProductSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    seller_id = serializers.UUIDField(source="user_id")
 
     class Meta:
         model = Product
@@ -20,7 +21,37 @@ class ProductSerializer(serializers.ModelSerializer):
         )
 
 
-class ProductDetailSerializer(serializers.ModelSerializer):
+class ProductExportSerializer(ProductSerializer):
+    class Meta:
+        model = Product
+
+        fields = (
+            "id",
+            "description",
+            "price",
+            "quantity",
+            "is_active",
+            "seller_id",
+            "created_at",
+            "updated_at",
+        )
+
+    def get_columns(self) -> list:
+        """`(name, source, to_representation)` of each field, in order."""
+        return [
+            (name, field.source, field.to_representation)
+            for name, field in self.fields.items()
+        ]
+
+
+class ProductChangeSerializer(ProductExportSerializer):
+    class Meta:
+        model = Product
+
+        fields = (*ProductExportSerializer.Meta.fields, "revision")
+
+
+class ProductDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     seller = AccountSerializer(source="user", read_only=True)
 
     class Meta:
@@ -44,3 +75,55 @@ class ProductDetailSerializer(serializers.ModelSerializer):
             )
 
         return value
+
+
+class ProductBulkUpdateSerializer(ProductDetailSerializer):
+    id = serializers.UUIDField()
+
+    class Meta:
+        model = Product
+
+        fields = (
+            "id",
+            "price",
+            "quantity",
+            "is_active",
+        )
+
+    def validate(self, attrs):
+        if "id" not in attrs:
+            raise serializers.ValidationError({"id": ["This field is required."]})
+
+        if len(attrs) == 1:
+            raise serializers.ValidationError(
+                "at least one of price, quantity or is_active must be informed"
+            )
+
+        return attrs
+
+
+class ProductReservationSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class ProductFilterSerializer(serializers.Serializer):
+    seller = serializers.UUIDField(required=False)
+    is_active = serializers.BooleanField(required=False)
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    max_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    in_stock = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        min_price, max_price = attrs.get("min_price"), attrs.get("max_price")
+
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise serializers.ValidationError(
+                {"min_price": ["min_price cannot be greater than max_price"]}
+            )
+
+        return attrs
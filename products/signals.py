@@ -0,0 +1,41 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.models import User
+from .cache import catalog_cache
+from .models import Product
+from .search import search_index
+
+# Writes run in transactions (Product.save is atomic), so the cache and the
+# search index change once the rows are visible to other connections. A
+# bump before the commit would let a concurrent read cache the old rows
+# under the new version.
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_catalog_on_product_change(sender, instance: Product, using, **kwargs):
+    transaction.on_commit(catalog_cache.bump, using=using)
+
+
+@receiver(post_save, sender=Product)
+def index_product_description(sender, instance: Product, using, **kwargs):
+    if search_index.built:
+        transaction.on_commit(
+            partial(search_index.add, instance.pk, instance.description), using=using
+        )
+
+
+@receiver(post_delete, sender=Product)
+def unindex_product_description(sender, instance: Product, using, **kwargs):
+    transaction.on_commit(partial(search_index.remove, instance.pk), using=using)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_catalog_on_seller_change(sender, instance: User, using, **kwargs):
+    if not kwargs.get("created", False):
+        transaction.on_commit(catalog_cache.bump, using=using)
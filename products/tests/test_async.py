@@ -0,0 +1,113 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+from products.search import search_index
+
+
+class AsyncProductViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        cls.products = [
+            Product.objects.create(
+                description=description, price=price, quantity=1, user=cls.seller
+            )
+            for description, price in [
+                ("Smartband XYZ 3.0", 100),
+                ("Fone sem fio", 50),
+                ("Smartband XYZ 4.0", 150),
+            ]
+        ]
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+        search_index.clear()
+
+    def test_async_list_matches_sync_list(self):
+        """A listagem assíncrona deve retornar o mesmo conteúdo da síncrona"""
+
+        params = "?pagination=keyset&page_size=2&ordering=price"
+        sync_response = self.client.get("/api/products/" + params)
+        async_response = self.client.get("/api/async/products/" + params)
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_content = "O conteúdo da listagem assíncrona difere da síncrona"
+
+        self.assertEqual(
+            status.HTTP_200_OK, async_response.status_code, msg_status_code
+        )
+        self.assertEqual(
+            sync_response.json()["results"],
+            async_response.json()["results"],
+            msg_content,
+        )
+
+    def test_async_list_follows_cursor_and_search(self):
+        """A listagem assíncrona deve suportar busca e paginação por cursor"""
+
+        first = self.client.get("/api/async/products/?q=smartband&page_size=1").json()
+        second = self.client.get(first["next"]).json()
+
+        msg_results = "Os resultados da busca assíncrona estão diferentes do esperado"
+
+        self.assertEqual(
+            {"Smartband XYZ 3.0", "Smartband XYZ 4.0"},
+            {first["results"][0]["description"], second["results"][0]["description"]},
+            msg_results,
+        )
+        self.assertIsNone(second["next"], msg_results)
+
+    def test_async_detail_matches_sync_detail(self):
+        """O detalhe assíncrono deve retornar o mesmo conteúdo do síncrono"""
+
+        product = self.products[0]
+        sync_response = self.client.get(f"/api/products/{product.id}/")
+        async_response = self.client.get(f"/api/async/products/{product.id}/")
+
+        msg_content = "O conteúdo do detalhe assíncrono difere do síncrono"
+
+        self.assertEqual(sync_response.json(), async_response.json(), msg_content)
+
+    def test_async_detail_not_found(self):
+        """Ids inexistentes ou inválidos devem retornar 404"""
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        for product_id in ["abc", self.seller.id]:
+            response = self.client.get(f"/api/async/products/{product_id}/")
+
+            self.assertEqual(
+                status.HTTP_404_NOT_FOUND, response.status_code, msg_status_code
+            )
+
+    def test_async_views_are_read_only(self):
+        """As rotas assíncronas não devem aceitar escrita"""
+
+        response = self.client.post("/api/async/products/", {})
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_405_METHOD_NOT_ALLOWED, response.status_code, msg_status_code
+        )
+
+    def test_invalid_filter_returns_400(self):
+        """Filtros inválidos devem retornar 400 também na rota assíncrona"""
+
+        response = self.client.get("/api/async/products/?min_price=x")
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_400_BAD_REQUEST, response.status_code, msg_status_code
+        )
+        self.assertIn("min_price", response.json(), msg_status_code)
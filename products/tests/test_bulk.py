@@ -0,0 +1,149 @@
+import json
+from unittest import mock
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.models import Product
+
+
+class ProductBulkCreateTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+        cls.normal_user_data = {
+            "username": "dino",
+            "password": "abcd",
+            "first_name": "Dionizio",
+            "last_name": "Notório",
+            "is_seller": False,
+        }
+
+    def setUp(self) -> None:
+        self.seller = User.objects.create_user(**self.seller_user_data)
+        token = Token.objects.create(user=self.seller)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+    def test_seller_can_bulk_create_products(self):
+        """Usuário vendedor deve ser capaz de criar vários produtos em uma requisição"""
+
+        response = self.client.post(
+            "/api/products/bulk/", [self.product_data] * 3, format="json"
+        )
+
+        expected_status_code = status.HTTP_201_CREATED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_created = "Todos os produtos devem ser criados"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertEqual(3, len(response.data["created"]), msg_created)
+        self.assertEqual(3, Product.objects.filter(user=self.seller).count())
+
+    def test_invalid_items_do_not_abort_valid_ones(self):
+        """Itens inválidos devem ser reportados sem impedir a criação dos válidos"""
+
+        items = [
+            self.product_data,
+            {**self.product_data, "quantity": -15},
+            {"description": "Sem preço"},
+            self.product_data,
+        ]
+
+        response = self.client.post("/api/products/bulk/", items, format="json")
+
+        result_created = [item["index"] for item in response.data["created"]]
+        result_errors = {
+            item["index"]: set(item["errors"]) for item in response.data["errors"]
+        }
+
+        msg_created = "Os itens válidos devem ser criados"
+        msg_errors = "Os erros devem ser reportados por item"
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual([0, 3], result_created, msg_created)
+        self.assertEqual(
+            {1: {"quantity"}, 2: {"price", "quantity"}}, result_errors, msg_errors
+        )
+
+    def test_bulk_create_from_ndjson_stream(self):
+        """Deve ser capaz de criar produtos a partir de um corpo NDJSON"""
+
+        body = "\n".join(
+            [json.dumps(self.product_data), "{banana", json.dumps(self.product_data)]
+        )
+
+        response = self.client.post(
+            "/api/products/bulk/", body, content_type="application/x-ndjson"
+        )
+
+        result_errors = [item["index"] for item in response.data["errors"]]
+
+        msg_created = "As linhas válidas devem ser criadas"
+        msg_errors = "A linha inválida deve ser reportada"
+
+        self.assertEqual(2, len(response.data["created"]), msg_created)
+        self.assertEqual([1], result_errors, msg_errors)
+
+    def test_bulk_create_queries_do_not_grow_with_items(self):
+        """A criação em lote deve inserir os produtos em lotes"""
+
+        with mock.patch("django.conf.settings.PRODUCT_BULK_BATCH_SIZE", 100):
+            # token, savepoint, insert, release
+            with self.assertNumQueries(4):
+                self.client.post(
+                    "/api/products/bulk/", [self.product_data] * 100, format="json"
+                )
+
+    def test_bulk_create_item_limit(self):
+        """Itens acima do limite devem ser recusados"""
+
+        with mock.patch("django.conf.settings.PRODUCT_BULK_MAX_ITEMS", 2):
+            response = self.client.post(
+                "/api/products/bulk/", [self.product_data] * 3, format="json"
+            )
+
+        result_errors = [item["index"] for item in response.data["errors"]]
+
+        self.assertEqual(2, len(response.data["created"]))
+        self.assertEqual([2], result_errors)
+
+    def test_all_invalid_items(self):
+        """Uma requisição sem itens válidos deve retornar 400"""
+
+        response = self.client.post(
+            "/api/products/bulk/", [{"quantity": -1}], format="json"
+        )
+
+        expected_status_code = status.HTTP_400_BAD_REQUEST
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_normal_user_cannot_bulk_create(self):
+        """Usuário comum não deve ser capaz de criar produtos em lote"""
+
+        user = User.objects.create_user(**self.normal_user_data)
+        token = Token.objects.create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        response = self.client.post(
+            "/api/products/bulk/", [self.product_data], format="json"
+        )
+
+        expected_status_code = status.HTTP_403_FORBIDDEN
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
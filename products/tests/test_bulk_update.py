@@ -0,0 +1,98 @@
+from unittest import mock
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.models import Product
+
+
+class ProductBulkUpdateTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+
+    def setUp(self) -> None:
+        self.seller = User.objects.create_user(**self.seller_user_data)
+        token = Token.objects.create(user=self.seller)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        self.products = Product.objects.bulk_create(
+            Product(**self.product_data, user=self.seller) for _ in range(3)
+        )
+
+    def test_seller_can_bulk_update_products(self):
+        """Usuário vendedor deve ser capaz de atualizar estoque e preço em lote"""
+
+        items = [
+            {"id": str(self.products[0].id), "quantity": 1},
+            {"id": str(self.products[1].id), "price": "9.90", "is_active": False},
+        ]
+
+        response = self.client.patch("/api/products/bulk/", items, format="json")
+
+        result_status = [result["status"] for result in response.data["results"]]
+
+        msg_status = "Os produtos devem ser atualizados"
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(["updated", "updated"], result_status, msg_status)
+        self.assertEqual(1, Product.objects.get(id=self.products[0].id).quantity)
+        self.assertFalse(Product.objects.get(id=self.products[1].id).is_active)
+        self.assertEqual(15, Product.objects.get(id=self.products[2].id).quantity)
+
+    def test_bulk_update_reports_per_id_outcomes(self):
+        """A atualização em lote deve informar o resultado de cada item"""
+
+        other_seller = User.objects.create_user(
+            **{**self.seller_user_data, "username": "outro"}
+        )
+        other_product = Product.objects.create(**self.product_data, user=other_seller)
+
+        items = [
+            {"id": str(self.products[0].id), "quantity": -1},
+            {"id": str(other_product.id), "quantity": 1},
+            {"id": "f5b5bcd6-8d1f-4f4b-9b1f-2c5a8a0d5a11", "quantity": 1},
+            {"quantity": 1},
+            {"id": str(self.products[2].id), "quantity": 0},
+        ]
+
+        response = self.client.patch("/api/products/bulk/", items, format="json")
+
+        result_status = [result["status"] for result in response.data["results"]]
+
+        msg_status = "Os resultados por item estão diferentes do esperado"
+
+        self.assertEqual(
+            ["invalid", "forbidden", "not_found", "invalid", "updated"],
+            result_status,
+            msg_status,
+        )
+        self.assertEqual(15, Product.objects.get(id=other_product.id).quantity)
+
+    def test_bulk_update_queries_do_not_grow_with_items(self):
+        """A atualização em lote deve verificar a posse com uma única query por lote"""
+
+        products = Product.objects.bulk_create(
+            Product(**self.product_data, user=self.seller) for _ in range(50)
+        )
+        items = [{"id": str(product.id), "quantity": 3} for product in products]
+
+        with mock.patch("django.conf.settings.PRODUCT_BULK_BATCH_SIZE", 100):
+            # token, savepoint, select, update, release
+            with self.assertNumQueries(5):
+                self.client.patch("/api/products/bulk/", items, format="json")
+
+        self.assertEqual(50, Product.objects.filter(quantity=3).count())
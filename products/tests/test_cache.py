@@ -0,0 +1,189 @@
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+
+
+class CatalogCacheTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+
+        self.seller = User.objects.create_user(**self.seller_user_data)
+        self.token = Token.objects.create(user=self.seller)
+        self.product = Product.objects.create(
+            **{**self.product_data, "user": self.seller}
+        )
+
+    def test_anonymous_list_is_served_from_cache(self):
+        """A segunda listagem anônima deve ser servida pelo cache sem consultar o banco"""
+
+        first = self.client.get("/api/products/")
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/products/")
+
+        msg_header = "O cabeçalho `X-Cache` esta diferente do esperado"
+        msg_content = "O conteúdo em cache esta diferente do original"
+
+        self.assertEqual("MISS", first["X-Cache"], msg_header)
+        self.assertEqual("HIT", second["X-Cache"], msg_header)
+        self.assertEqual(first.content, second.content, msg_content)
+
+    def test_cache_key_includes_query_string(self):
+        """Páginas diferentes devem possuir entradas de cache diferentes"""
+
+        self.client.get("/api/products/")
+        response = self.client.get("/api/products/?pagination=keyset")
+
+        msg_header = "O cabeçalho `X-Cache` esta diferente do esperado"
+
+        self.assertEqual("MISS", response["X-Cache"], msg_header)
+
+    def test_cache_key_includes_host_and_scheme(self):
+        """Hosts e esquemas diferentes devem possuir entradas de cache diferentes"""
+
+        for _ in range(2):
+            Product.objects.create(**{**self.product_data, "user": self.seller})
+
+        url = "/api/products/?pagination=keyset&page_size=1"
+        self.client.get(url)
+        other_host = self.client.get(url, HTTP_HOST="localhost")
+        other_scheme = self.client.get(url, secure=True)
+
+        msg_header = "O cabeçalho `X-Cache` esta diferente do esperado"
+        msg_link = "Os links devem apontar para o host e o esquema da requisição"
+
+        self.assertEqual("MISS", other_host["X-Cache"], msg_header)
+        self.assertEqual("MISS", other_scheme["X-Cache"], msg_header)
+        self.assertTrue(
+            other_host.data["next"].startswith("http://localhost/"), msg_link
+        )
+        self.assertTrue(other_scheme.data["next"].startswith("https://"), msg_link)
+
+    def test_product_update_invalidates_cache(self):
+        """A atualização de um produto não deve servir a versão antiga do cache"""
+
+        url = f"/api/products/{self.product.id}/"
+        self.client.get(url)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url, {"description": "Smartband XYZ 4.0"})
+
+        self.client.credentials()
+
+        response = self.client.get(url)
+
+        msg_description = "A descrição retornada esta desatualizada"
+
+        self.assertEqual(
+            "Smartband XYZ 4.0", response.json()["description"], msg_description
+        )
+
+    def test_product_creation_invalidates_cache(self):
+        """A criação de um produto deve invalidar a listagem em cache"""
+
+        self.client.get("/api/products/?pagination=keyset")
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/products/", self.product_data)
+
+        self.client.credentials()
+
+        response = self.client.get("/api/products/?pagination=keyset")
+
+        msg_results = "A listagem em cache deve incluir o novo produto"
+
+        self.assertEqual(2, len(response.json()["results"]), msg_results)
+
+    def test_invalidation_waits_for_commit(self):
+        """O cache só deve ser invalidado após o commit da escrita"""
+
+        version = catalog_cache.get_version()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.product.description = "Smartband XYZ 4.0"
+            self.product.save()
+
+        msg = "A versão do cache não deveria mudar antes do commit"
+        self.assertEqual(version, catalog_cache.get_version(), msg)
+
+        for callback in callbacks:
+            callback()
+
+        msg = "A versão do cache deveria mudar após o commit"
+        self.assertNotEqual(version, catalog_cache.get_version(), msg)
+
+    def test_authenticated_requests_bypass_cache(self):
+        """Requisições autenticadas não devem utilizar o cache"""
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.client.get("/api/products/")
+        response = self.client.get("/api/products/")
+
+        msg_header = "Requisições autenticadas não devem possuir o cabeçalho `X-Cache`"
+
+        self.assertFalse(response.has_header("X-Cache"), msg_header)
+
+    def test_cache_counts_hits_and_misses(self):
+        """O cache deve contabilizar acertos e falhas"""
+
+        before = catalog_cache.stats()
+
+        self.client.get("/api/products/")
+        self.client.get("/api/products/")
+
+        after = catalog_cache.stats()
+
+        msg_hits = "O contador de acertos esta diferente do esperado"
+        msg_misses = "O contador de falhas esta diferente do esperado"
+
+        self.assertEqual(before["hits"] + 1, after["hits"], msg_hits)
+        self.assertEqual(before["misses"] + 1, after["misses"], msg_misses)
+
+    def test_evicted_version_does_not_go_back(self):
+        """Uma versão despejada do cache não deve voltar a um valor antigo"""
+
+        catalog_cache.bump()
+        version = catalog_cache.get_version()
+        catalog_cache.cache.delete(catalog_cache.version_key)
+
+        msg = "A nova versão deveria ser maior que todas as anteriores"
+        self.assertGreater(catalog_cache.get_version(), version, msg)
+
+        catalog_cache.cache.delete(catalog_cache.version_key)
+        catalog_cache.bump()
+        self.assertGreater(catalog_cache.get_version(), version, msg)
+
+    def test_not_found_is_not_cached(self):
+        """Respostas de erro não devem ser armazenadas em cache"""
+
+        self.client.get("/api/products/banana/")
+        response = self.client.get("/api/products/banana/")
+
+        expected_status_code = status.HTTP_404_NOT_FOUND
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertFalse(response.has_header("X-Cache"))
@@ -0,0 +1,157 @@
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.models import Product
+
+
+class ProductChangesViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        cls.token = Token.objects.create(user=cls.seller)
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.products = [
+            Product.objects.create(**self.product_data, user=self.seller)
+            for _ in range(3)
+        ]
+
+    def sync(self, url="/api/products/changes/"):
+        """Follows the feed until it is caught up; returns the ids and cursor."""
+        ids = []
+
+        while True:
+            response = self.client.get(url)
+            ids.extend(product["id"] for product in response.data["results"])
+            url = response.data["next"]
+
+            if not response.data["has_more"]:
+                return ids, url
+
+    def test_changes_require_authentication(self):
+        """Apenas usuários autenticados podem consultar as alterações"""
+
+        self.client.credentials()
+        response = self.client.get("/api/products/changes/")
+
+        expected_status_code = status.HTTP_401_UNAUTHORIZED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_first_sync_returns_every_product(self):
+        """Sem cursor, o feed deve percorrer todo o catálogo, inclusive linhas antigas"""
+
+        legacy = Product.objects.bulk_create(
+            [Product(**self.product_data, user=self.seller)]
+        )[0]
+
+        ids, _ = self.sync("/api/products/changes/?page_size=2")
+
+        msg = "A primeira sincronização deveria conter todos os produtos"
+
+        self.assertEqual(str(legacy.id), ids[0], msg)
+        self.assertEqual(
+            {str(product.id) for product in [legacy, *self.products]}, set(ids), msg
+        )
+
+    def test_caught_up_cursor_is_repeated(self):
+        """Sem novas alterações, o feed deve devolver o mesmo cursor"""
+
+        _, cursor_url = self.sync()
+        response = self.client.get(cursor_url)
+
+        msg = "O feed deveria estar vazio e repetir o cursor"
+
+        self.assertEqual([], response.data["results"], msg)
+        self.assertEqual(cursor_url, response.data["next"], msg)
+        self.assertFalse(response.data["has_more"], msg)
+
+    def test_only_changed_products_are_returned(self):
+        """Após o cursor, o feed deve conter apenas os produtos alterados"""
+
+        _, cursor_url = self.sync()
+
+        created = self.client.post("/api/products/", self.product_data)
+        self.client.patch(f"/api/products/{self.products[1].id}/", {"is_active": False})
+        self.client.post(
+            "/api/products/bulk/",
+            [{**self.product_data, "description": "Lote"}],
+            format="json",
+        )
+        self.client.post(
+            "/api/products/reserve/",
+            [{"id": str(self.products[2].id), "quantity": 1}],
+            format="json",
+        )
+
+        response = self.client.get(cursor_url)
+        results = response.data["results"]
+
+        msg = "As alterações retornadas estão diferentes do esperado"
+
+        self.assertEqual(4, len(results), msg)
+        self.assertEqual(created.data["id"], results[0]["id"], msg)
+        self.assertEqual(str(self.products[1].id), results[1]["id"], msg)
+        self.assertFalse(results[1]["is_active"], msg)
+        self.assertEqual("Lote", results[2]["description"], msg)
+        self.assertEqual(str(self.products[2].id), results[3]["id"], msg)
+        self.assertEqual(14, results[3]["quantity"], msg)
+        self.assertEqual(
+            sorted(result["revision"] for result in results),
+            [result["revision"] for result in results],
+            msg,
+        )
+
+    def test_product_appears_once_at_its_latest_revision(self):
+        """Um produto alterado várias vezes deve aparecer uma única vez"""
+
+        _, cursor_url = self.sync()
+
+        for price in (10, 20, 30):
+            self.client.patch(f"/api/products/{self.products[0].id}/", {"price": price})
+
+        response = self.client.get(cursor_url)
+
+        msg = "O produto deveria aparecer uma vez, com a última versão"
+
+        self.assertEqual(1, len(response.data["results"]), msg)
+        self.assertEqual("30.00", response.data["results"][0]["price"], msg)
+
+    def test_invalid_cursor(self):
+        """Um cursor inválido deve retornar 404"""
+
+        response = self.client.get("/api/products/changes/?cursor=banana")
+
+        expected_status_code = status.HTTP_404_NOT_FOUND
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_save_computes_the_revision_in_the_write(self):
+        """Salvar um produto não deve exigir queries extras para a revisão"""
+
+        product = self.products[0]
+        previous = product.revision
+
+        with self.assertNumQueries(1):
+            product.price = 10
+            product.save()
+
+        msg = "A revisão deveria avançar a cada escrita"
+        self.assertGreater(product.revision, previous, msg)
+        self.assertGreater(product.revision, self.products[2].revision, msg)
@@ -0,0 +1,176 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from users.models import User
+from users.serializers import AccountSerializer
+from users.views import AccountView
+from products.cache import catalog_cache
+from products.models import Product
+from products.serializers import (
+    ProductSerializer,
+    ProductDetailSerializer,
+    ProductChangeSerializer,
+)
+from products.views import ProductView
+from utils import compile_serializer
+
+
+class ProductSellerSerializer(serializers.ModelSerializer):
+    seller_username = serializers.CharField(source="user.username")
+    seller_last_login = serializers.DateTimeField(source="user.last_login")
+
+    class Meta:
+        model = Product
+        fields = ("id", "seller_username", "seller_last_login")
+
+
+class ProductMethodSerializer(serializers.ModelSerializer):
+    label = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Product
+        fields = ("id", "label")
+
+    def get_label(self, product):
+        return product.description.upper()
+
+
+def render(data) -> bytes:
+    return JSONRenderer().render(data)
+
+
+class CompiledSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Ávila",
+            is_seller=True,
+        )
+        cls.other_seller = User.objects.create_user(
+            username="dino",
+            password="abcd",
+            first_name="Dionizio",
+            last_name="Notório",
+            is_seller=True,
+            last_login=timezone.now(),
+        )
+
+        for index in range(4):
+            Product.objects.create(
+                description=f'Smartband XYZ {index}.0 "edição" ✓',
+                price=f"{index}00.99",
+                quantity=index,
+                is_active=bool(index % 2),
+                user=cls.seller if index % 2 else cls.other_seller,
+            )
+
+    def assertSameJSON(self, serializer_class, queryset):
+        compiled = compile_serializer(serializer_class)
+        instances = queryset.order_by("id")
+        rows = queryset.order_by("id").values(*compiled.lookups)
+
+        msg = f"O JSON compilado de {serializer_class.__name__} deveria ser idêntico"
+        self.assertEqual(
+            render(serializer_class(instances, many=True).data),
+            render(compiled.to_representation(rows)),
+            msg,
+        )
+
+    def test_compiled_json_is_identical(self):
+        """Os serializers compilados devem gerar os mesmos bytes de JSON"""
+
+        for serializer_class in (
+            ProductSerializer,
+            ProductDetailSerializer,
+            ProductChangeSerializer,
+            ProductSellerSerializer,
+        ):
+            with self.subTest(serializer=serializer_class.__name__):
+                self.assertSameJSON(serializer_class, Product.objects.all())
+
+        self.assertSameJSON(AccountSerializer, User.objects.all())
+
+    def test_compiled_json_follows_current_timezone(self):
+        """As datas compiladas devem seguir o fuso horário corrente"""
+
+        with timezone.override("America/Sao_Paulo"):
+            self.assertSameJSON(AccountSerializer, User.objects.all())
+            self.assertSameJSON(ProductDetailSerializer, Product.objects.all())
+
+    def test_lookups_follow_the_sources(self):
+        """As colunas lidas devem seguir o source de cada campo"""
+
+        compiled = compile_serializer(ProductDetailSerializer)
+
+        msg = "As colunas do serializer compilado estão diferentes do esperado"
+        self.assertIn("user_id", compile_serializer(ProductSerializer).lookups, msg)
+        self.assertIn("user__date_joined", compiled.lookups, msg)
+        self.assertNotIn("password", compile_serializer(AccountSerializer).lookups, msg)
+
+    def test_method_fields_are_not_compiled(self):
+        """Serializers com campos sem coluna devem manter o caminho normal"""
+
+        msg = "Um SerializerMethodField não deveria ser compilado"
+        self.assertIsNone(compile_serializer(ProductMethodSerializer), msg)
+
+
+class CompiledListViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+
+        for index in range(5):
+            Product.objects.create(
+                description=f"Smartband XYZ {index}.0",
+                price=100.99 + index,
+                quantity=index,
+                user=cls.seller,
+            )
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+
+    def assertSameResponse(self, view, url):
+        compiled = self.client.get(url)
+        catalog_cache.cache.clear()
+
+        with mock.patch.object(view, "get_compiled_serializer", lambda view: None):
+            regular = self.client.get(url)
+
+        msg = f"A resposta compilada de {url} deveria ser idêntica"
+        self.assertEqual(200, compiled.status_code, msg)
+        self.assertEqual(regular.content, compiled.content, msg)
+        self.assertEqual(regular["ETag"], compiled["ETag"], msg)
+
+    def test_product_list_is_identical(self):
+        """As listagens de produtos compiladas devem ser idênticas às normais"""
+
+        for url in (
+            "/api/products/",
+            "/api/products/?pagination=keyset&page_size=2",
+            "/api/products/?pagination=keyset&page_size=2&ordering=-price",
+            "/api/products/?q=smartband&pagination=keyset&page_size=2",
+        ):
+            with self.subTest(url=url):
+                self.assertSameResponse(ProductView, url)
+
+    def test_account_list_is_identical(self):
+        """As listagens de contas compiladas devem ser idênticas às normais"""
+
+        for url in ("/api/accounts/", "/api/accounts/?pagination=keyset"):
+            with self.subTest(url=url):
+                self.assertSameResponse(AccountView, url)
@@ -0,0 +1,156 @@
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+
+
+class ConditionalRequestTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+
+        self.seller = User.objects.create_user(**self.seller_user_data)
+        self.token = Token.objects.create(user=self.seller)
+        self.product = Product.objects.create(
+            **{**self.product_data, "user": self.seller}
+        )
+        self.url = f"/api/products/{self.product.id}/"
+
+    def test_detail_returns_etag(self):
+        """O detalhe do produto deve retornar o cabeçalho `ETag`"""
+
+        response = self.client.get(self.url)
+
+        msg = "O detalhe do produto deve possuir o cabeçalho `ETag`"
+
+        self.assertTrue(response.has_header("ETag"), msg)
+
+    def test_detail_if_none_match_returns_not_modified(self):
+        """Um `If-None-Match` válido deve retornar 304 sem serializar o produto"""
+
+        etag = self.client.get(self.url)["ETag"]
+        catalog_cache.cache.clear()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        expected_status_code = status.HTTP_304_NOT_MODIFIED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertEqual(etag, response["ETag"])
+        self.assertEqual(b"", response.content)
+
+    def test_cached_detail_if_none_match_returns_not_modified(self):
+        """O cache deve responder 304 sem consultar o banco de dados"""
+
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        expected_status_code = status.HTTP_304_NOT_MODIFIED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_seller_update_changes_detail_etag(self):
+        """A alteração do vendedor deve alterar o `ETag` do produto"""
+
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seller.first_name = "Roberto"
+            self.seller.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        expected_status_code = status.HTTP_200_OK
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertNotEqual(etag, response["ETag"])
+
+    def test_list_if_none_match_returns_not_modified(self):
+        """A listagem deve possuir um `ETag` da coleção"""
+
+        etag = self.client.get("/api/products/")["ETag"]
+        catalog_cache.cache.clear()
+
+        response = self.client.get("/api/products/", HTTP_IF_NONE_MATCH=etag)
+
+        expected_status_code = status.HTTP_304_NOT_MODIFIED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_list_etag_changes_when_a_product_changes(self):
+        """O `ETag` da coleção deve mudar quando um produto da página muda"""
+
+        etag = self.client.get("/api/products/")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product.quantity = 1
+            self.product.save()
+
+        response = self.client.get("/api/products/", HTTP_IF_NONE_MATCH=etag)
+
+        expected_status_code = status.HTTP_200_OK
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_patch_with_matching_if_match(self):
+        """Um `If-Match` atual deve permitir a atualização do produto"""
+
+        etag = self.client.get(self.url)["ETag"]
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.patch(
+            self.url, {"quantity": 3}, HTTP_IF_MATCH=etag, format="json"
+        )
+
+        expected_status_code = status.HTTP_200_OK
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertNotEqual(etag, response["ETag"])
+        self.assertEqual(3, response.data["quantity"])
+
+    def test_patch_with_stale_if_match(self):
+        """Um `If-Match` desatualizado deve retornar 412 sem alterar o produto"""
+
+        etag = self.client.get(self.url)["ETag"]
+
+        self.product.quantity = 1
+        self.product.save()
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.patch(
+            self.url, {"quantity": 3}, HTTP_IF_MATCH=etag, format="json"
+        )
+
+        expected_status_code = status.HTTP_412_PRECONDITION_FAILED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.product.refresh_from_db()
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertEqual(1, self.product.quantity)
@@ -0,0 +1,214 @@
+import csv
+import json
+
+from asgiref.testing import ApplicationCommunicator
+from django.core.exceptions import SynchronousOnlyOperation
+from django.core.handlers.asgi import ASGIHandler
+from rest_framework.authtoken.models import Token
+from django.test import TransactionTestCase
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.models import Product
+from products.serializers import ProductSerializer
+from _project.handlers import StreamingASGIHandler
+
+
+class ProductExportViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        cls.other_seller = User.objects.create_user(
+            username="dino",
+            password="abcd",
+            first_name="Dionizio",
+            last_name="Notório",
+            is_seller=True,
+        )
+        cls.token = Token.objects.create(user=cls.seller)
+        cls.products = [
+            Product.objects.create(
+                description=f'Smartband XYZ {index}.0, edição "especial"',
+                price=100.99,
+                quantity=index,
+                user=cls.seller if index % 2 else cls.other_seller,
+            )
+            for index in range(5)
+        ]
+        cls.expected_keys = [
+            "id",
+            "description",
+            "price",
+            "quantity",
+            "is_active",
+            "seller_id",
+            "created_at",
+            "updated_at",
+        ]
+
+    def export(self, url="/api/products/export/", **extra):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.get(url, **extra)
+        content = b"".join(response.streaming_content).decode()
+
+        return response, content
+
+    def test_export_requires_authentication(self):
+        """Apenas usuários autenticados podem exportar o catálogo"""
+
+        response = self.client.get("/api/products/export/")
+
+        expected_status_code = status.HTTP_401_UNAUTHORIZED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_export_streams_ndjson_by_default(self):
+        """O catálogo deve ser exportado em NDJSON, um produto por linha"""
+
+        response, content = self.export()
+        rows = [json.loads(line) for line in content.splitlines()]
+        listed = ProductSerializer(self.products[0]).data
+
+        msg_type = "O content type da exportação esta diferente do esperado"
+        msg_rows = "Os produtos exportados estão diferentes do esperado"
+
+        self.assertTrue(response.streaming, msg_type)
+        self.assertEqual(
+            "application/x-ndjson; charset=utf-8", response["Content-Type"], msg_type
+        )
+        self.assertEqual(len(self.products), len(rows), msg_rows)
+        self.assertEqual(self.expected_keys, list(rows[0]), msg_rows)
+        self.assertEqual(
+            [str(product.id) for product in self.products],
+            [row["id"] for row in rows],
+            msg_rows,
+        )
+        self.assertEqual(dict(listed), {key: rows[0][key] for key in listed}, msg_rows)
+
+    def test_export_streams_csv(self):
+        """O catálogo deve poder ser exportado em CSV"""
+
+        by_param, content = self.export("/api/products/export/?format=csv")
+        by_header, header_content = self.export(HTTP_ACCEPT="text/csv")
+        rows = list(csv.reader(content.splitlines()))
+
+        msg_type = "O content type da exportação esta diferente do esperado"
+        msg_rows = "O CSV exportado esta diferente do esperado"
+
+        self.assertEqual("text/csv; charset=utf-8", by_param["Content-Type"], msg_type)
+        self.assertEqual(content, header_content, msg_rows)
+        self.assertEqual(self.expected_keys, rows[0], msg_rows)
+        self.assertEqual(len(self.products) + 1, len(rows), msg_rows)
+        self.assertEqual(self.products[0].description, rows[1][1], msg_rows)
+        self.assertEqual(["100.99", "0", "true"], rows[1][2:5], msg_rows)
+
+    def test_export_can_be_filtered(self):
+        """A exportação deve aceitar os filtros da listagem"""
+
+        _, content = self.export(f"/api/products/export/?seller={self.seller.id}")
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        msg = "A exportação deveria conter apenas os produtos do vendedor"
+
+        self.assertEqual(2, len(rows), msg)
+        self.assertEqual({str(self.seller.id)}, {row["seller_id"] for row in rows}, msg)
+
+    def test_export_rejects_invalid_filters(self):
+        """Filtros inválidos devem retornar 400 antes do início da exportação"""
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.get("/api/products/export/?is_active=banana")
+
+        expected_status_code = status.HTTP_400_BAD_REQUEST
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_streaming = "Uma resposta de erro não deveria ser transmitida"
+        msg_body = "O erro deveria apontar o filtro inválido"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertFalse(response.streaming, msg_streaming)
+        self.assertIn("is_active", json.loads(response.content), msg_body)
+
+    def test_export_query_count_does_not_grow(self):
+        """A exportação deve fazer uma única consulta, qualquer que seja o catálogo"""
+
+        self.export()
+
+        with self.assertNumQueries(1):
+            self.export()
+
+
+class ProductExportASGITests(TransactionTestCase):
+    # The ASGI handler runs each request in a thread of its own, which only
+    # sees committed rows.
+
+    def setUp(self) -> None:
+        seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        self.token = Token.objects.create(user=seller)
+        self.products = [
+            Product.objects.create(
+                description=f"Smartband XYZ {index}.0",
+                price=100.99,
+                quantity=index,
+                user=seller,
+            )
+            for index in range(3)
+        ]
+
+    async def export(self, handler):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/products/export/",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", f"Token {self.token.key}".encode()),
+            ],
+        }
+        communicator = ApplicationCommunicator(handler, scope)
+        await communicator.send_input({"type": "http.request"})
+        start = await communicator.receive_output()
+        body = [await communicator.receive_output()]
+
+        while body[-1].get("more_body"):
+            body.append(await communicator.receive_output())
+
+        return start, b"".join(message.get("body", b"") for message in body)
+
+    async def test_export_streams_through_asgi(self):
+        """A exportação deve ser transmitida pelo handler ASGI dos workers"""
+
+        start, body = await self.export(StreamingASGIHandler())
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+
+        msg_status = "O status code recebido esta diferente do esperado"
+        msg_rows = "Os produtos exportados via ASGI estão diferentes do esperado"
+
+        self.assertEqual(status.HTTP_200_OK, start["status"], msg_status)
+        self.assertEqual(
+            [str(product.id) for product in self.products],
+            [row["id"] for row in rows],
+            msg_rows,
+        )
+
+    async def test_stock_handler_cannot_stream_the_export(self):
+        """O handler padrão do Django 4.1 lê o banco no event loop e falha"""
+
+        msg = "O handler padrão deveria falhar ao transmitir a exportação"
+
+        with self.assertRaises(SynchronousOnlyOperation, msg=msg):
+            await self.export(ASGIHandler())
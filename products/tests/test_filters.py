@@ -0,0 +1,131 @@
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+
+
+class ProductFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        cls.other_seller = User.objects.create_user(
+            username="bia",
+            password="abcd",
+            first_name="Beatriz",
+            last_name="Alves",
+            is_seller=True,
+        )
+        cls.products = {
+            description: Product.objects.create(
+                description=description,
+                price=price,
+                quantity=quantity,
+                is_active=is_active,
+                user=user,
+            )
+            for description, price, quantity, is_active, user in [
+                ("Smartband", 100, 5, True, cls.seller),
+                ("Fone", 50, 0, True, cls.seller),
+                ("Teclado", 150, 3, False, cls.seller),
+                ("Mouse", 80, 2, True, cls.other_seller),
+            ]
+        }
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+
+    def list_descriptions(self, **params):
+        response = self.client.get(
+            "/api/products/", {"pagination": "keyset", "page_size": 10, **params}
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code, response.content)
+
+        return [product["description"] for product in response.json()["results"]]
+
+    def test_filter_by_seller_and_is_active(self):
+        """Deve filtrar os produtos pelo vendedor e pelo status de ativação"""
+
+        descriptions = self.list_descriptions(
+            seller=str(self.seller.id), is_active="true", ordering="description"
+        )
+
+        msg_results = "Os produtos filtrados estão diferentes do esperado"
+
+        self.assertEqual(["Fone", "Smartband"], descriptions, msg_results)
+
+    def test_filter_by_price_range(self):
+        """Deve filtrar os produtos pela faixa de preço informada"""
+
+        descriptions = self.list_descriptions(
+            min_price="60", max_price="120", ordering="price"
+        )
+
+        msg_results = "Os produtos filtrados estão diferentes do esperado"
+
+        self.assertEqual(["Mouse", "Smartband"], descriptions, msg_results)
+
+    def test_filter_by_stock(self):
+        """Deve filtrar os produtos com e sem estoque"""
+
+        in_stock = self.list_descriptions(in_stock="true", ordering="description")
+        out_of_stock = self.list_descriptions(in_stock="false")
+
+        msg_results = "Os produtos filtrados estão diferentes do esperado"
+
+        self.assertEqual(["Mouse", "Smartband", "Teclado"], in_stock, msg_results)
+        self.assertEqual(["Fone"], out_of_stock, msg_results)
+
+    def test_ordering_is_whitelisted(self):
+        """Campos fora da lista permitida devem ser ignorados na ordenação"""
+
+        descriptions = self.list_descriptions(ordering="-price")
+        ignored = self.list_descriptions(ordering="user__password")
+
+        msg_order = "A ordenação retornada esta diferente do esperado"
+
+        self.assertEqual(
+            ["Teclado", "Smartband", "Mouse", "Fone"], descriptions, msg_order
+        )
+        self.assertEqual(["Mouse", "Teclado", "Fone", "Smartband"], ignored, msg_order)
+
+    def test_keyset_pagination_follows_ordering(self):
+        """A paginação por cursor deve seguir a ordenação solicitada"""
+
+        pages, url = [], "/api/products/"
+        params = {"pagination": "keyset", "page_size": 1, "ordering": "price"}
+
+        while url:
+            data = self.client.get(url, params).json()
+            pages.extend(product["description"] for product in data["results"])
+            url, params = data["next"], None
+
+        msg_pages = "As páginas retornadas estão diferentes do esperado"
+
+        self.assertEqual(["Fone", "Mouse", "Smartband", "Teclado"], pages, msg_pages)
+
+    def test_invalid_filter_returns_400(self):
+        """Filtros inválidos devem retornar 400"""
+
+        invalid = [
+            {"seller": "abc"},
+            {"min_price": "x"},
+            {"min_price": "10", "max_price": "5"},
+            {"in_stock": "talvez"},
+        ]
+
+        msg_status = "O status code esta diferente do esperado"
+
+        for params in invalid:
+            response = self.client.get("/api/products/", params)
+
+            self.assertEqual(
+                status.HTTP_400_BAD_REQUEST, response.status_code, msg_status
+            )
@@ -0,0 +1,151 @@
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import json
+
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from products.models import Product
+from users.models import User
+
+
+class NDJSONFixtureTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        cls.token = Token.objects.create(user=cls.seller)
+        cls.products = [
+            Product.objects.create(
+                description=f"Smartband XYZ {index}.0\tnova",
+                price=100.99,
+                quantity=15,
+                user=cls.seller,
+            )
+            for index in range(5)
+        ]
+
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / "dump.ndjson")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def export(self, *args):
+        call_command("export_ndjson", self.path, *args, stderr=StringIO())
+
+    def load(self, *args) -> str:
+        stdout = StringIO()
+        call_command("import_ndjson", self.path, *args, stdout=stdout)
+
+        return stdout.getvalue()
+
+    def test_export_writes_one_object_per_line(self):
+        """A exportação deve gerar um objeto no formato do dumpdata por linha"""
+
+        self.export()
+
+        lines = Path(self.path).read_text().splitlines()
+        objects = [json.loads(line) for line in lines]
+
+        msg = "O conteúdo exportado esta diferente do esperado"
+
+        self.assertEqual(7, len(objects), msg)
+        self.assertEqual(
+            ["users.user"] + ["products.product"] * 5 + ["authtoken.token"],
+            [obj["model"] for obj in objects],
+            msg,
+        )
+        self.assertEqual(str(self.seller.id), objects[1]["fields"]["user"], msg)
+        self.assertEqual(self.token.key, objects[-1]["pk"], msg)
+
+    def test_round_trip_keeps_rows_and_passwords(self):
+        """Os dados importados devem ser idênticos aos exportados"""
+
+        self.export()
+        User.objects.all().delete()
+
+        output = self.load()
+
+        seller = User.objects.get(pk=self.seller.id)
+        product = Product.objects.get(pk=self.products[0].id)
+        response = self.client.post(
+            "/api/login/", {"username": "ale", "password": "abcd"}
+        )
+
+        msg_counts = "As quantidades importadas estão diferentes do esperado"
+        msg_rows = "Os dados importados estão diferentes dos exportados"
+        msg_login = "O usuário importado deveria conseguir fazer login"
+
+        self.assertIn("products.product: 5 imported", output, msg_counts)
+        self.assertEqual(self.seller.password, seller.password, msg_rows)
+        self.assertEqual(self.seller.date_joined, seller.date_joined, msg_rows)
+        self.assertEqual(self.seller.updated_at, seller.updated_at, msg_rows)
+        self.assertEqual(self.products[0].created_at, product.created_at, msg_rows)
+        self.assertEqual(self.products[0].updated_at, product.updated_at, msg_rows)
+        self.assertEqual(self.products[0].description, product.description, msg_rows)
+        self.assertEqual(self.token.key, Token.objects.get(user=seller).key, msg_rows)
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg_login)
+        self.assertEqual(self.token.key, response.data["token"], msg_login)
+
+    def test_import_inserts_in_batches(self):
+        """A importação deve inserir em lotes, sem uma query por linha"""
+
+        self.export()
+        User.objects.all().delete()
+
+        # savepoint, current revision, 1 user batch, 3 product batches and 1
+        # token batch (each followed by the UPDATE of its timestamps), release
+        with self.assertNumQueries(13):
+            self.load("--batch-size", "2")
+
+    def test_import_skips_other_models_and_conflicts(self):
+        """Objetos de outros models e linhas já existentes devem ser ignorados"""
+
+        self.export()
+        permission = {
+            "model": "auth.permission",
+            "pk": 1,
+            "fields": {"name": "Can add log entry", "codename": "add_logentry"},
+        }
+
+        with open(self.path, "a") as stream:
+            stream.write(json.dumps(permission) + "\n")
+
+        output = self.load("--ignore-conflicts")
+
+        msg = "Os objetos deveriam ter sido ignorados"
+
+        self.assertIn("skipped: 1", output, msg)
+        self.assertEqual(5, Product.objects.count(), msg)
+
+    def test_ignored_conflicts_keep_their_timestamps(self):
+        """Linhas já existentes não devem receber as datas do arquivo"""
+
+        self.export()
+        existing, deleted = self.products[:2]
+        updated_at = timezone.now() + timedelta(days=1)
+        Product.objects.filter(pk=existing.pk).update(updated_at=updated_at)
+        Product.objects.filter(pk=deleted.pk).delete()
+
+        self.load("--ignore-conflicts")
+
+        msg = "As datas importadas estão diferentes do esperado"
+
+        self.assertEqual(
+            updated_at, Product.objects.get(pk=existing.pk).updated_at, msg
+        )
+        self.assertEqual(
+            deleted.updated_at, Product.objects.get(pk=deleted.pk).updated_at, msg
+        )
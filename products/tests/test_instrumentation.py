@@ -0,0 +1,209 @@
+import os
+import re
+
+from django.test import override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from _project.db.pool import ConnectionPool, _pools, get_pool
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+from products.serializers import ProductDetailSerializer
+from utils.instrumentation import RequestTimings, _timings, request_timings
+
+SERVER_TIMING_RE = re.compile(r'(\w+);dur=([\d.]+)(?:;desc="(\d+) queries")?')
+
+
+def parse_server_timing(header: str) -> dict:
+    return {
+        name: (float(duration), queries)
+        for name, duration, queries in SERVER_TIMING_RE.findall(header)
+    }
+
+
+@override_settings(INSTRUMENTATION_SAMPLE_RATE=1)
+class InstrumentationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+        cls.admin_user_data = {
+            "username": "amb",
+            "password": "abcd",
+            "first_name": "Ambrósio",
+            "last_name": "Silva",
+            "is_seller": False,
+        }
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+        request_timings.clear()
+
+        self.seller = User.objects.create_user(**self.seller_user_data)
+        self.seller_token = Token.objects.create(user=self.seller)
+        self.admin = User.objects.create_superuser(**self.admin_user_data)
+        self.admin_token = Token.objects.create(user=self.admin)
+        self.product = Product.objects.create(
+            **{**self.product_data, "user": self.seller}
+        )
+
+    def test_product_list_reports_server_timing(self):
+        """A listagem de produtos deve informar os tempos no cabeçalho Server-Timing"""
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.seller_token.key)
+        response = self.client.get("/api/products/")
+        timings = parse_server_timing(response["Server-Timing"])
+
+        msg_metrics = "O cabeçalho `Server-Timing` não possui as métricas esperadas"
+        msg_queries = "O número de queries informado esta diferente do esperado"
+
+        self.assertEqual(
+            {"db", "serializer", "permission", "total"}, set(timings), msg_metrics
+        )
+        self.assertGreater(timings["serializer"][0], 0, msg_metrics)
+        self.assertGreater(timings["total"][0], timings["db"][0], msg_metrics)
+        # token lookup, count and page
+        self.assertEqual("3", timings["db"][1], msg_queries)
+
+    def test_account_views_are_instrumented(self):
+        """As views de contas também devem ser medidas"""
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.seller_token.key)
+        response = self.client.patch(
+            f"/api/accounts/{self.seller.id}/", {"first_name": "Alê"}
+        )
+        timings = parse_server_timing(response["Server-Timing"])
+
+        msg = "As métricas da view de contas não foram registradas"
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertGreater(timings["serializer"][0], 0, msg)
+        self.assertGreater(timings["permission"][0], 0, msg)
+
+    @override_settings(INSTRUMENTATION_SAMPLE_RATE=0)
+    def test_nothing_is_recorded_when_sampling_is_off(self):
+        """Com a amostragem desligada, nenhuma métrica deve ser registrada"""
+
+        response = self.client.get("/api/products/")
+
+        msg = "Nenhuma métrica deveria ser registrada com a amostragem desligada"
+
+        self.assertNotIn("Server-Timing", response, msg)
+        self.assertEqual({}, request_timings.snapshot(), msg)
+
+    def test_nested_serializers_are_timed_once(self):
+        """Serializers aninhados não devem ser contados em dobro"""
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+
+        try:
+            ProductDetailSerializer(self.product).data
+        finally:
+            _timings.reset(token)
+
+        msg = "O tempo do serializer aninhado não deveria ser somado ao do pai"
+
+        self.assertGreater(timings.serializer, 0, msg)
+        self.assertLessEqual(timings.serializer, timings.as_dict()["total"] / 1000, msg)
+        self.assertEqual(set(), timings.active, msg)
+
+    def test_histograms_are_aggregated_per_route(self):
+        """O endpoint de métricas deve agregar as requisições por rota"""
+
+        self.client.get("/api/products/")
+        self.client.get(f"/api/products/{self.product.id}/")
+        self.client.get(f"/api/products/{self.product.id}/")
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.admin_token.key)
+        response = self.client.get("/api/metrics/timings/")
+        routes = response.json()["routes"]
+
+        msg = "As métricas agregadas estão diferentes do esperado"
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg)
+        self.assertEqual(1, routes["GET /api/products/"]["total"]["count"], msg)
+        self.assertEqual(2, routes["GET /api/products/<pk>/"]["total"]["count"], msg)
+        self.assertEqual(
+            2, routes["GET /api/products/<pk>/"]["queries"]["buckets"]["+Inf"], msg
+        )
+
+    def test_metrics_include_response_cache_stats(self):
+        """As métricas devem incluir os acertos e falhas do cache de respostas"""
+
+        catalog_cache.reset_stats()
+        self.client.get("/api/products/")
+        self.client.get("/api/products/")
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.admin_token.key)
+        stats = self.client.get("/api/metrics/timings/").json()["response_caches"]
+
+        msg = "As estatísticas do cache de respostas estão diferentes do esperado"
+
+        self.assertEqual(1, stats["catalog"]["hits"], msg)
+        self.assertEqual(1, stats["catalog"]["misses"], msg)
+
+    def test_metrics_include_db_pool_stats(self):
+        """As métricas devem incluir as esperas e retiradas do pool de conexões"""
+
+        pool = get_pool("metrics", lambda: ConnectionPool(object, max_size=1))
+        self.addCleanup(_pools.pop, ("metrics", os.getpid()))
+        pool.putconn(pool.getconn())
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.admin_token.key)
+        stats = self.client.get("/api/metrics/timings/").json()["db_pools"]
+
+        msg = "As estatísticas do pool de conexões estão diferentes do esperado"
+
+        self.assertEqual(1, stats["metrics"]["checkouts"], msg)
+        self.assertIn("wait_p99_ms", stats["metrics"], msg)
+
+        self.client.delete("/api/metrics/timings/")
+        stats = self.client.get("/api/metrics/timings/").json()["db_pools"]
+
+        self.assertEqual(0, stats["metrics"]["checkouts"], msg)
+
+    def test_histograms_require_admin(self):
+        """Apenas administradores podem consultar ou limpar as métricas"""
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.seller_token.key)
+
+        msg = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_403_FORBIDDEN,
+            self.client.get("/api/metrics/timings/").status_code,
+            msg,
+        )
+        self.assertEqual(
+            status.HTTP_403_FORBIDDEN,
+            self.client.delete("/api/metrics/timings/").status_code,
+            msg,
+        )
+
+    def test_histograms_can_be_cleared(self):
+        """Administradores podem zerar as métricas agregadas"""
+
+        self.client.get("/api/products/")
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.admin_token.key)
+        response = self.client.delete("/api/metrics/timings/")
+
+        msg = "As métricas deveriam ter sido zeradas"
+
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code, msg)
+        # Only the DELETE itself, recorded after the reset
+        self.assertEqual(
+            ["DELETE /api/metrics/timings/"], list(request_timings.snapshot()), msg
+        )
@@ -0,0 +1,83 @@
+from unittest import mock
+
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APITestCase
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+
+
+class ProductQueryCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+
+    def create_products(self, total: int) -> list[Product]:
+        products = []
+
+        for index in range(total):
+            seller = User.objects.create_user(
+                **{**self.seller_user_data, "username": f"seller{index}"}
+            )
+            products.append(
+                Product.objects.create(**{**self.product_data, "user": seller})
+            )
+
+        return products
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        """A listagem de produtos deve executar o mesmo número de queries para qualquer tamanho de página"""
+
+        self.create_products(25)
+
+        msg = "O número de queries da listagem não deve crescer com o tamanho da página"
+
+        for page_size in (1, 10, 25):
+            catalog_cache.cache.clear()
+
+            with mock.patch.object(PageNumberPagination, "page_size", page_size):
+                with self.assertNumQueries(2, msg=msg):
+                    response = self.client.get("/api/products/")
+
+            self.assertEqual(len(response.data["results"]), page_size, msg)
+
+    def test_list_returns_seller_id_without_joining(self):
+        """O `seller_id` deve ser lido da coluna da chave estrangeira"""
+
+        product = self.create_products(1)[0]
+
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/products/")
+
+        msg = "O `seller_id` retornado esta diferente do esperado"
+
+        self.assertEqual(
+            response.data["results"][0]["seller_id"], str(product.user_id), msg
+        )
+
+    def test_detail_loads_seller_in_a_single_query(self):
+        """O detalhe do produto deve carregar o vendedor na mesma query"""
+
+        product = self.create_products(1)[0]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/products/{product.id}/")
+
+        msg = "O vendedor retornado esta diferente do esperado"
+
+        self.assertEqual(response.data["seller"]["id"], str(product.user_id), msg)
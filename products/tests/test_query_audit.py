@@ -0,0 +1,118 @@
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+from products.serializers import ProductDetailSerializer
+from products.views import ProductView
+from utils.testing import (
+    QueryAuditTestMixin,
+    QueryBudgetExceeded,
+    audit_client_queries,
+    audit_queries,
+    query_shape,
+)
+
+
+class QueryAuditTests(QueryAuditTestMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+        self.sellers = 0
+
+    def add_products(self, total: int):
+        for _ in range(total):
+            self.sellers += 1
+            seller = User.objects.create(
+                username=f"seller{self.sellers}",
+                first_name="Vendedor",
+                last_name="Teste",
+                is_seller=True,
+            )
+            Product.objects.create(**{**self.product_data, "user": seller})
+
+    def without_query_plan(self):
+        # The N+1 this suite guards against: the nested seller fetched one
+        # product at a time, through the regular (not compiled) serializer.
+        return mock.patch.multiple(
+            ProductView,
+            serializer_map={"GET": ProductDetailSerializer},
+            get_queryset=lambda view: Product.objects.all(),
+            get_compiled_serializer=lambda view: None,
+        )
+
+    def test_query_shape_ignores_literals(self):
+        """Queries que só diferem nos valores devem ter o mesmo formato"""
+
+        first = query_shape(
+            "SELECT * FROM t WHERE id = 'a1' AND n = 10 AND k IN ('x', 'y')"
+        )
+        second = query_shape(
+            "SELECT *  FROM t WHERE id = 'b''2' AND n = 7 AND k IN ('z')"
+        )
+
+        msg = "O formato das queries deveria ser o mesmo"
+        self.assertEqual(first, second, msg)
+        self.assertEqual("SELECT * FROM t WHERE id = ? AND n = ? AND k IN (...)", first)
+
+    def test_repeated_queries_are_flagged(self):
+        """Uma query repetida acima do limite da view deve ser apontada"""
+
+        queries = [{"sql": f"SELECT * FROM users_user WHERE id = '{n}'"} for n in "abc"]
+
+        msg = "A repetição da query deveria ser apontada"
+        self.assertEqual(1, len(audit_queries("products.views.ProductView", queries)))
+
+        with override_settings(
+            QUERY_BUDGETS={"products.views.ProductView": {"max_repeats": 3}}
+        ):
+            self.assertEqual(
+                [], audit_queries("products.views.ProductView", queries), msg
+            )
+
+    @override_settings(QUERY_BUDGETS={"default": {"max_queries": 1}})
+    def test_query_count_budget(self):
+        """Uma view acima do número de queries declarado deve ser apontada"""
+
+        queries = [{"sql": "SELECT 1 FROM a"}, {"sql": "SELECT 1 FROM b"}]
+
+        msg = "O excesso de queries deveria ser apontado"
+        self.assertEqual(
+            ["2 queries, the budget is 1"],
+            audit_queries("products.views.ProductView", queries),
+            msg,
+        )
+
+    def test_n_plus_one_request_fails(self):
+        """Uma requisição com N+1 deve falhar o teste"""
+
+        self.add_products(3)
+
+        with audit_client_queries(), self.without_query_plan():
+            with self.assertRaisesRegex(QueryBudgetExceeded, "3x"):
+                self.client.get("/api/products/?pagination=keyset&page_size=20")
+
+    @override_settings(
+        QUERY_BUDGETS={"products.views.ProductView": {"max_repeats": None}}
+    )
+    def test_growing_query_count_fails(self):
+        """Um número de queries que cresce com os resultados deve falhar o teste"""
+
+        with self.without_query_plan():
+            with self.assertRaisesRegex(AssertionError, "query count grows"):
+                self.assertQueryCountConstant(
+                    lambda: self.client.get(
+                        "/api/products/?pagination=keyset&page_size=20"
+                    ),
+                    self.add_products,
+                )
@@ -0,0 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest import mock
+import uuid
+
+from django.db import connection
+from django.test import TransactionTestCase, skipUnlessDBFeature
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from products.models import Product, InsufficientStock, UnknownProduct
+
+
+class ProductReserveTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.product_data = {
+            "description": "Smartband XYZ 3.0",
+            "price": 100.99,
+            "quantity": 15,
+        }
+        cls.user_data = {
+            "username": "dino",
+            "password": "abcd",
+            "first_name": "Dionizio",
+            "last_name": "Notório",
+            "is_seller": True,
+        }
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(**self.user_data)
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        self.first = Product.objects.create(**self.product_data, user=self.user)
+        self.second = Product.objects.create(**self.product_data, user=self.user)
+
+    def test_reserve_decrements_stock(self):
+        """A reserva deve decrementar o estoque dos produtos"""
+
+        items = [
+            {"id": str(self.first.id), "quantity": 5},
+            {"id": str(self.second.id), "quantity": 15},
+        ]
+
+        # token, savepoint, 2 updates, release
+        with self.assertNumQueries(5):
+            response = self.client.post("/api/products/reserve/", items, format="json")
+
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+
+        msg_quantity = "O estoque restante esta diferente do esperado"
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(10, self.first.quantity, msg_quantity)
+        self.assertEqual(0, self.second.quantity, msg_quantity)
+
+    def test_reserve_is_all_or_nothing(self):
+        """Uma reserva sem estoque suficiente não deve alterar nenhum produto"""
+
+        items = [
+            {"id": str(self.first.id), "quantity": 5},
+            {"id": str(self.second.id), "quantity": 16},
+        ]
+
+        response = self.client.post("/api/products/reserve/", items, format="json")
+
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+
+        expected_status_code = status.HTTP_409_CONFLICT
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_quantity = "O estoque não deve ser alterado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertEqual(self.second.id, response.data["id"])
+        self.assertEqual(15, self.first.quantity, msg_quantity)
+        self.assertEqual(15, self.second.quantity, msg_quantity)
+
+    def test_repeated_items_are_summed(self):
+        """Itens repetidos devem ser somados antes da reserva"""
+
+        items = [
+            {"id": str(self.first.id), "quantity": 8},
+            {"id": str(self.first.id), "quantity": 8},
+        ]
+
+        response = self.client.post("/api/products/reserve/", items, format="json")
+
+        expected_status_code = status.HTTP_409_CONFLICT
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_reserve_invalid_quantity(self):
+        """Não deve ser capaz de reservar quantidades menores que 1"""
+
+        items = [{"id": str(self.first.id), "quantity": 0}]
+
+        response = self.client.post("/api/products/reserve/", items, format="json")
+
+        expected_status_code = status.HTTP_400_BAD_REQUEST
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+    def test_inactive_products_cannot_be_reserved(self):
+        """Produtos inativos não devem ser reservados"""
+
+        self.first.is_active = False
+        self.first.save()
+
+        with self.assertRaises(InsufficientStock):
+            Product.objects.reserve({self.first.id: 1})
+
+    def test_unknown_product_is_not_found(self):
+        """Reservar um produto inexistente deve retornar 404 sem alterar o estoque"""
+
+        unknown = uuid.uuid4()
+        items = [
+            {"id": str(self.first.id), "quantity": 5},
+            {"id": str(unknown), "quantity": 1},
+        ]
+
+        response = self.client.post("/api/products/reserve/", items, format="json")
+
+        self.first.refresh_from_db()
+
+        expected_status_code = status.HTTP_404_NOT_FOUND
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_quantity = "O estoque não deve ser alterado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertEqual(unknown, response.data["id"])
+        self.assertEqual(15, self.first.quantity, msg_quantity)
+
+        with self.assertRaises(UnknownProduct):
+            Product.objects.reserve({unknown: 1})
+
+    def test_reserve_item_limit(self):
+        """Reservas acima do limite de itens devem ser recusadas"""
+
+        items = [{"id": str(self.first.id), "quantity": 1}] * 3
+
+        with mock.patch("django.conf.settings.PRODUCT_BULK_MAX_ITEMS", 2):
+            response = self.client.post("/api/products/reserve/", items, format="json")
+
+        self.first.refresh_from_db()
+
+        expected_status_code = status.HTTP_400_BAD_REQUEST
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_quantity = "O estoque não deve ser alterado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+        self.assertEqual(15, self.first.quantity, msg_quantity)
+
+    def test_anonymous_user_cannot_reserve(self):
+        """Usuário anônimo não deve ser capaz de reservar produtos"""
+
+        self.client.credentials()
+        items = [{"id": str(self.first.id), "quantity": 1}]
+
+        response = self.client.post("/api/products/reserve/", items, format="json")
+
+        expected_status_code = status.HTTP_401_UNAUTHORIZED
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, response.status_code, msg_status_code)
+
+
+# Checked against the test database when the tests run: SQLite locks whole
+# tables, and its in-memory test database raises instead of waiting.
+@skipUnlessDBFeature("has_select_for_update")
+class ProductReserveConcurrencyTests(TransactionTestCase):
+    attempts = 20
+
+    def setUp(self) -> None:
+        user = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        self.product = Product.objects.create(
+            description="Smartband XYZ 3.0", price=100.99, quantity=50, user=user
+        )
+
+    def reserve(self, barrier: Barrier) -> bool:
+        barrier.wait()
+
+        try:
+            Product.objects.reserve({self.product.id: 3})
+            return True
+        except InsufficientStock:
+            return False
+        finally:
+            connection.close()
+
+    def test_concurrent_reservations_never_oversell(self):
+        """Reservas concorrentes não devem deixar o estoque negativo"""
+
+        barrier = Barrier(self.attempts)
+
+        with ThreadPoolExecutor(max_workers=self.attempts) as executor:
+            results = list(executor.map(self.reserve, [barrier] * self.attempts))
+
+        self.product.refresh_from_db()
+
+        msg_reserved = "Devem ser efetuadas exatamente as reservas que cabem no estoque"
+        msg_quantity = "O estoque restante esta diferente do esperado"
+
+        self.assertEqual(16, results.count(True), msg_reserved)
+        self.assertEqual(2, self.product.quantity, msg_quantity)
@@ -0,0 +1,176 @@
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from users.models import User
+from products.cache import catalog_cache
+from products.models import Product
+from products.search import InvertedIndex, search_index
+
+
+class ProductSearchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="ale",
+            password="abcd",
+            first_name="Alexandre",
+            last_name="Alves",
+            is_seller=True,
+        )
+        descriptions = [
+            "Smartband XYZ 3.0",
+            "Smartband preta com pulseira extra de smartband",
+            "Fone de ouvido sem fio",
+            "Pulseira de couro",
+        ]
+        cls.products = [
+            Product.objects.create(
+                description=description, price=10, quantity=1, user=cls.seller
+            )
+            for description in descriptions
+        ]
+
+    def setUp(self) -> None:
+        catalog_cache.cache.clear()
+        search_index.clear()
+
+    def search(self, query, **params):
+        response = self.client.get("/api/products/", {"q": query, **params})
+        self.assertEqual(200, response.status_code, response.content)
+
+        return response.json()
+
+    def test_search_returns_only_matching_products(self):
+        """A busca deve retornar apenas os produtos que contêm o termo"""
+
+        results = self.search("pulseira", page_size=10, pagination="keyset")["results"]
+
+        msg_results = "Os produtos retornados pela busca estão diferentes do esperado"
+
+        self.assertEqual(
+            {self.products[1].description, self.products[3].description},
+            {product["description"] for product in results},
+            msg_results,
+        )
+
+    def test_search_is_case_insensitive_and_requires_every_term(self):
+        """A busca deve ignorar maiúsculas e exigir todos os termos"""
+
+        results = self.search("SMARTBAND Preta", pagination="keyset")["results"]
+
+        msg_results = "Os produtos retornados pela busca estão diferentes do esperado"
+
+        self.assertEqual(
+            [self.products[1].description],
+            [product["description"] for product in results],
+            msg_results,
+        )
+
+    def test_search_is_ranked_by_relevance(self):
+        """Produtos com mais ocorrências do termo devem vir primeiro"""
+
+        results = self.search("smartband", page_size=10, pagination="keyset")["results"]
+
+        msg_order = "A ordem dos resultados não respeita a relevância"
+
+        self.assertEqual(
+            [self.products[1].description, self.products[0].description],
+            [product["description"] for product in results],
+            msg_order,
+        )
+
+    def test_search_supports_keyset_pagination(self):
+        """A paginação por cursor deve percorrer os resultados da busca em ordem"""
+
+        first = self.search("smartband", page_size=1, pagination="keyset")
+        second = self.client.get(first["next"]).json()
+
+        msg_pages = "As páginas da busca estão diferentes do esperado"
+
+        self.assertEqual(
+            self.products[1].description, first["results"][0]["description"], msg_pages
+        )
+        self.assertEqual(
+            self.products[0].description, second["results"][0]["description"], msg_pages
+        )
+        self.assertIsNone(second["next"], msg_pages)
+
+    def test_search_index_follows_product_changes(self):
+        """Produtos criados, editados e removidos devem refletir na busca"""
+
+        self.search("relogio")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product = Product.objects.create(
+                description="Relogio digital", price=10, quantity=1, user=self.seller
+            )
+
+        found = self.search("relogio", pagination="keyset")["results"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product.description = "Despertador digital"
+            product.save()
+
+        renamed = self.search("relogio", pagination="keyset")["results"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.products[2].delete()
+
+        deleted = self.search("fone", pagination="keyset")["results"]
+
+        msg_index = "O índice de busca não acompanhou as alterações dos produtos"
+
+        self.assertEqual(
+            ["Relogio digital"], [p["description"] for p in found], msg_index
+        )
+        self.assertEqual([], renamed, msg_index)
+        self.assertEqual([], deleted, msg_index)
+
+    def test_bulk_created_products_are_indexed_on_commit(self):
+        """Produtos criados em lote só devem entrar na busca após o commit"""
+
+        self.search("relogio")
+        token = Token.objects.create(user=self.seller)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(
+                "/api/products/bulk/",
+                [{"description": "Relogio digital", "price": 10, "quantity": 1}],
+                format="json",
+            )
+
+        msg_index = "O índice de busca não deveria ter produtos sem commit"
+        self.assertEqual([], search_index.search("relogio", 10), msg_index)
+
+        for callback in callbacks:
+            callback()
+
+        msg_index = "O índice de busca deveria ter os produtos após o commit"
+        self.assertEqual(1, len(search_index.search("relogio", 10)), msg_index)
+
+
+class InvertedIndexTests(APITestCase):
+    def test_bm25_prefers_shorter_documents(self):
+        """Com a mesma frequência, documentos menores devem ter maior relevância"""
+
+        index = InvertedIndex()
+        index.build([(1, "smartband"), (2, "smartband com pulseira e carregador")])
+
+        msg_rank = "A relevância calculada esta diferente do esperado"
+
+        self.assertEqual(
+            [1, 2], [pk for pk, _ in index.search("smartband", 10)], msg_rank
+        )
+
+    def test_remove_drops_empty_postings(self):
+        """Remover o último documento de um termo deve remover o termo do índice"""
+
+        index = InvertedIndex()
+        index.build([(1, "smartband"), (2, "fone")])
+        index.remove(1)
+
+        msg_postings = "O termo removido continua no índice"
+
+        self.assertNotIn("smartband", index.postings, msg_postings)
+        self.assertEqual([], index.search("smartband", 10), msg_postings)
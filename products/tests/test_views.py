@@ -1,4 +1,8 @@
+from base64 import urlsafe_b64encode
+import json
 import pdb
+import uuid
+
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 from rest_framework.views import status
@@ -6,6 +10,7 @@ from rest_framework.views import status
 
 from users.models import User
 from products.models import Product
+from utils.testing import QueryAuditTestMixin
 
 """
         cls.admin_user_data = {
@@ -18,7 +23,7 @@ from products.models import Product
 """
 
 
-class AccountViewTests(APITestCase):
+class AccountViewTests(QueryAuditTestMixin, APITestCase):
     @classmethod
     def setUpTestData(cls) -> None:
         cls.product_data = {
@@ -250,3 +255,131 @@ class AccountViewTests(APITestCase):
 
         self.assertEqual(expected_status_code, result_status_code, msg_status_code)
         self.assertSetEqual(expected_key, result_key, msg_key)
+
+    def test_anyone_can_list_products_with_keyset_pagination(self):
+        """Deve ser capaz de percorrer todos os produtos usando a paginação por cursor"""
+
+        user = User.objects.create_user(**self.seller_user_data)
+        products = [
+            Product.objects.create(**{**self.product_data, "user": user})
+            for _ in range(5)
+        ]
+
+        url = "/api/products/?pagination=keyset"
+        result_descriptions = []
+
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+
+            result_descriptions.extend(response.data["results"])
+            url = response.data["next"]
+
+        expected_keys = {"next", "previous", "results"}
+        result_keys = set(response.data.keys())
+
+        msg_keys = "As chaves recebidas no retorno esta diferente do esperado"
+        msg_results = "A paginação por cursor deve retornar todos os produtos"
+
+        self.assertSetEqual(expected_keys, result_keys, msg_keys)
+        self.assertEqual(len(products), len(result_descriptions), msg_results)
+
+    def test_keyset_pagination_previous_link(self):
+        """O link `previous` da paginação por cursor deve retornar a página anterior"""
+
+        user = User.objects.create_user(**self.seller_user_data)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(5):
+                Product.objects.create(
+                    **{
+                        **self.product_data,
+                        "description": f"produto {index}",
+                        "user": user,
+                    }
+                )
+
+        first_page = self.client.get("/api/products/?pagination=keyset")
+        second_page = self.client.get(first_page.data["next"])
+        response = self.client.get(second_page.data["previous"])
+
+        msg_results = "A página anterior esta diferente da primeira página"
+
+        self.assertEqual(
+            first_page.data["results"], response.data["results"], msg_results
+        )
+
+    def test_keyset_pagination_invalid_cursor(self):
+        """Um cursor inválido deve retornar 404"""
+
+        response = self.client.get("/api/products/?pagination=keyset&cursor=banana")
+
+        expected_status_code = status.HTTP_404_NOT_FOUND
+        result_status_code = response.status_code
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, result_status_code, msg_status_code)
+
+    def test_keyset_pagination_tampered_cursor(self):
+        """Um cursor bem formado com valores adulterados deve retornar 404"""
+
+        def encode(position, ordering=("-created_at", "-id")):
+            payload = {"p": position, "o": list(ordering), "r": 0}
+
+            return urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        created_at, product_id = "2022-10-18T10:00:00+00:00", str(uuid.uuid4())
+        cursors = [
+            encode(["bad", "bad"]),
+            encode([created_at, "not-a-uuid"]),
+            encode([None, None]),
+            encode([{"a": 1}, product_id]),
+            encode([created_at]),
+            encode([created_at, product_id], ordering=("-price", "-id")),
+        ]
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        for url in (
+            "/api/products/?pagination=keyset",
+            "/api/async/products/?pagination=keyset",
+            "/api/accounts/?pagination=keyset",
+        ):
+            for cursor in cursors:
+                with self.subTest(url=url, cursor=cursor):
+                    response = self.client.get(f"{url}&cursor={cursor}")
+
+                    self.assertEqual(
+                        status.HTTP_404_NOT_FOUND, response.status_code, msg_status_code
+                    )
+
+        user = User.objects.create_user(**self.seller_user_data)
+
+        for _ in range(2):
+            Product.objects.create(**self.product_data, user=user)
+
+        first_page = self.client.get("/api/products/?pagination=keyset&page_size=1")
+        response = self.client.get(first_page.data["next"] + "&ordering=price")
+
+        msg_ordering = "Um cursor de outra ordenação deve retornar 404"
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code, msg_ordering)
+
+    def test_product_list_query_count_does_not_grow(self):
+        """O número de queries da listagem não deve crescer com os produtos"""
+
+        sellers = []
+
+        def add_products(total):
+            with self.captureOnCommitCallbacks(execute=True):
+                for _ in range(total):
+                    seller = User.objects.create(
+                        username=f"seller{len(sellers)}", is_seller=True
+                    )
+                    sellers.append(seller)
+                    Product.objects.create(**{**self.product_data, "user": seller})
+
+        self.assertQueryCountConstant(
+            lambda: self.client.get("/api/products/?pagination=keyset&page_size=20"),
+            add_products,
+            msg="A listagem de produtos possui uma query por produto",
+        )
@@ -3,5 +3,11 @@ from . import views
 
 urlpatterns = [
     path("products/", views.ProductView.as_view()),
+    path("products/bulk/", views.ProductBulkView.as_view()),
+    path("products/export/", views.ProductExportView.as_view()),
+    path("products/changes/", views.ProductChangesView.as_view()),
+    path("products/reserve/", views.ProductReserveView.as_view()),
     path("products/<pk>/", views.ProductDetailView.as_view()),
+    path("async/products/", views.AsyncProductView.as_view()),
+    path("async/products/<pk>/", views.AsyncProductDetailView.as_view()),
 ]
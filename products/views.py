@@ -1,17 +1,94 @@
-from rest_framework.authentication import TokenAuthentication
-from rest_framework import generics
+from collections import Counter
+from collections.abc import Iterator
+from functools import partial
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import router, transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import generics, serializers, status
+from rest_framework.parsers import JSONParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 from utils import (
     IsSellerOrReadOnly,
     IsSellerAndOwnerOrReadOnly,
     SerializerByMethodMixin,
+    QueryPlanMixin,
+    PaginationByModeMixin,
+    CachedTokenAuthentication,
+    CachedResponseMixin,
+    ConditionalRequestMixin,
+    CompiledReadMixin,
+    PreparedStatementsMixin,
+    TimedPermissionsMixin,
+    NDJSONParser,
+    NDJSONRenderer,
+    CSVRenderer,
+    AsyncListAPIView,
+    AsyncRetrieveAPIView,
+    FeedPagination,
+    batched,
+)
+from .serializers import (
+    ProductSerializer,
+    ProductDetailSerializer,
+    ProductExportSerializer,
+    ProductChangeSerializer,
+    ProductBulkUpdateSerializer,
+    ProductReservationSerializer,
+)
+from .models import (
+    Product,
+    InsufficientStock,
+    UnknownProduct,
+    next_revision,
+    visible_revisions,
 )
-from .serializers import ProductSerializer, ProductDetailSerializer
-from .models import Product
+from .cache import catalog_cache
+from .filters import ProductFilter, ProductOrderingFilter
+from .search import (
+    ProductSearchFilter,
+    SEARCH_ORDERING,
+    ensure_search_index,
+    search_index,
+    uses_inverted_index,
+)
+
+
+class ProductListMixin:
+    filter_backends = [ProductFilter, ProductSearchFilter, ProductOrderingFilter]
+    ordering_fields = ("price", "quantity", "created_at", "description")
+    keyset_ordering = ("-created_at", "-id")
 
+    def get_keyset_ordering(self):
+        ordering = ProductOrderingFilter().get_ordering(self.request, None, self)
 
-class ProductView(SerializerByMethodMixin, generics.ListCreateAPIView):
-    authentication_classes = [TokenAuthentication]
+        if ordering:
+            return ordering
+
+        if ProductSearchFilter().get_search_query(self.request):
+            return SEARCH_ORDERING
+
+        return self.keyset_ordering
+
+
+class ProductView(
+    PreparedStatementsMixin,
+    TimedPermissionsMixin,
+    ProductListMixin,
+    CachedResponseMixin,
+    ConditionalRequestMixin,
+    CompiledReadMixin,
+    QueryPlanMixin,
+    PaginationByModeMixin,
+    SerializerByMethodMixin,
+    generics.ListCreateAPIView,
+):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsSellerOrReadOnly]
 
     queryset = Product.objects.all()
@@ -19,14 +96,314 @@ class ProductView(SerializerByMethodMixin, generics.ListCreateAPIView):
         "GET": ProductSerializer,
         "POST": ProductDetailSerializer,
     }
+    response_cache = catalog_cache
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class ProductDetailView(generics.RetrieveUpdateAPIView):
-    authentication_classes = [TokenAuthentication]
+class ProductDetailView(
+    PreparedStatementsMixin,
+    TimedPermissionsMixin,
+    CachedResponseMixin,
+    ConditionalRequestMixin,
+    QueryPlanMixin,
+    generics.RetrieveUpdateAPIView,
+):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsSellerAndOwnerOrReadOnly]
 
     queryset = Product.objects.all()
     serializer_class = ProductDetailSerializer
+    response_cache = catalog_cache
+    etag_fields = ("pk", "updated_at", "user__updated_at")
+
+
+class AsyncProductView(ProductListMixin, CompiledReadMixin, AsyncListAPIView):
+    queryset = Product.objects.all()
+    serializer_class = ProductSerializer
+
+    async def aget(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+
+        if ProductSearchFilter().get_search_query(request) and uses_inverted_index(
+            queryset
+        ):
+            await sync_to_async(ensure_search_index)(queryset)
+
+        return await super().aget(request, *args, **kwargs)
+
+
+class AsyncProductDetailView(AsyncRetrieveAPIView):
+    queryset = Product.objects.all()
+    serializer_class = ProductDetailSerializer
+
+
+class ProductExportView(TimedPermissionsMixin, generics.GenericAPIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    filter_backends = [ProductFilter]
+    pagination_class = None
+
+    queryset = Product.objects.all()
+    serializer_class = ProductExportSerializer
+    export_ordering = ("created_at", "id")
+
+    def get_rows(self, queryset, columns):
+        # Plain tuples through the serializer fields: no model instances,
+        # and a server-side cursor on PostgreSQL keeps memory flat.
+        rows = queryset.values_list(*(source for _, source, _ in columns)).iterator(
+            chunk_size=settings.PRODUCT_EXPORT_CHUNK_SIZE
+        )
+        representations = [to_representation for _, _, to_representation in columns]
+
+        for row in rows:
+            yield [
+                None if value is None else represent(value)
+                for represent, value in zip(representations, row)
+            ]
+
+    def get(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        columns = self.get_serializer().get_columns()
+        # Filtered before the response starts, so invalid filters are a 400
+        # and not a stream cut short after its headers went out.
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            *self.export_ordering
+        )
+        response = StreamingHttpResponse(
+            renderer.stream(
+                [name for name, _, _ in columns], self.get_rows(queryset, columns)
+            ),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="products.{renderer.format}"'
+
+        return response
+
+
+class ProductChangesView(TimedPermissionsMixin, generics.ListAPIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    pagination_class = FeedPagination
+
+    queryset = Product.objects.all()
+    serializer_class = ProductChangeSerializer
+    keyset_ordering = ("revision", "id")
+
+    def get_queryset(self):
+        return visible_revisions(super().get_queryset())
+
+
+class ProductBulkView(SerializerByMethodMixin, generics.GenericAPIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsSellerOrReadOnly]
+    parser_classes = [JSONParser, NDJSONParser]
+
+    queryset = Product.objects.all()
+    serializer_class = ProductDetailSerializer
+    serializer_map = {
+        "POST": ProductDetailSerializer,
+        "PATCH": ProductBulkUpdateSerializer,
+    }
+
+    def get_items(self):
+        if not isinstance(self.request.data, (list, Iterator)):
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Expected a list of items."]}
+            )
+
+        return enumerate(self.request.data)
+
+    def get_batches(self, items):
+        return batched(
+            islice(items, settings.PRODUCT_BULK_MAX_ITEMS),
+            settings.PRODUCT_BULK_BATCH_SIZE,
+        )
+
+    def get_limit_errors(self, items):
+        if next(items, None) is None:
+            return []
+
+        max_items = settings.PRODUCT_BULK_MAX_ITEMS
+
+        return [
+            {
+                "index": max_items,
+                "errors": {
+                    "non_field_errors": [
+                        f"Bulk request limit of {max_items} items exceeded."
+                    ]
+                },
+            }
+        ]
+
+    def index_products(self, products):
+        if search_index.built:
+            for product in products:
+                search_index.add(product.pk, product.description)
+
+    def validate_item(self, child, item):
+        if isinstance(item, Exception):
+            raise serializers.ValidationError({"non_field_errors": [str(item)]})
+
+        return child.run_validation(item)
+
+    def post(self, request, *args, **kwargs):
+        items = self.get_items()
+        child = self.get_serializer()
+        created, errors = [], []
+
+        with transaction.atomic():
+            for batch in self.get_batches(items):
+                products = []
+
+                for index, item in batch:
+                    try:
+                        validated_data = self.validate_item(child, item)
+                    except serializers.ValidationError as exc:
+                        errors.append({"index": index, "errors": exc.detail})
+                        continue
+
+                    products.append(Product(**validated_data, user=request.user))
+                    created.append({"index": index, "id": products[-1].id})
+
+                if not products:
+                    continue
+
+                revision = next_revision(router.db_for_write(Product))
+
+                for product in products:
+                    product.revision = revision
+
+                Product.objects.bulk_create(products)
+                # Like the signal handlers, the index follows committed rows.
+                transaction.on_commit(partial(self.index_products, products))
+
+        errors.extend(self.get_limit_errors(items))
+
+        if created:
+            catalog_cache.bump()
+
+        return Response(
+            {"created": created, "errors": errors},
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+    def patch(self, request, *args, **kwargs):
+        items = self.get_items()
+        child = self.get_serializer(partial=True)
+        results = []
+        updated = 0
+
+        with transaction.atomic():
+            for batch in self.get_batches(items):
+                changes, batch_results = {}, []
+
+                for index, item in batch:
+                    try:
+                        validated_data = self.validate_item(child, item)
+                    except serializers.ValidationError as exc:
+                        batch_results.append(
+                            {"index": index, "status": "invalid", "errors": exc.detail}
+                        )
+                        continue
+
+                    product_id = validated_data.pop("id")
+                    changes.setdefault(product_id, {}).update(validated_data)
+                    batch_results.append({"index": index, "id": product_id})
+
+                updated += self.apply_changes(changes, batch_results)
+                results.extend(batch_results)
+
+        results.extend(
+            {**error, "status": "invalid"} for error in self.get_limit_errors(items)
+        )
+
+        if updated:
+            catalog_cache.bump()
+
+        return Response({"results": results})
+
+    def apply_changes(self, changes, results):
+        products = self.get_queryset().in_bulk(changes.keys())
+        now = timezone.now()
+        updates = {}
+
+        for product_id, fields in changes.items():
+            product = products.get(product_id)
+
+            if product is None or product.user_id != self.request.user.id:
+                continue
+
+            for field, value in fields.items():
+                setattr(product, field, value)
+
+            product.updated_at = now
+            updates.setdefault(tuple(sorted(fields)), []).append(product)
+
+        updated = sum(len(group) for group in updates.values())
+        revision = next_revision(router.db_for_write(Product))
+
+        for fields, group in updates.items():
+            for product in group:
+                product.revision = revision
+
+            Product.objects.bulk_update(group, [*fields, "updated_at", "revision"])
+
+        for result in results:
+            if "id" not in result:
+                continue
+
+            product = products.get(result["id"])
+
+            if product is None:
+                result["status"] = "not_found"
+            elif product.user_id != self.request.user.id:
+                result["status"] = "forbidden"
+            else:
+                result["status"] = "updated"
+
+        return updated
+
+
+class ProductReserveView(generics.GenericAPIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    queryset = Product.objects.all()
+    serializer_class = ProductReservationSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.PRODUCT_BULK_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        quantities = Counter()
+
+        for item in serializer.validated_data:
+            quantities[item["id"]] += item["quantity"]
+
+        try:
+            self.get_queryset().reserve(quantities)
+        except UnknownProduct as exc:
+            return Response(
+                {"detail": str(exc), "id": exc.product_id},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except InsufficientStock as exc:
+            return Response(
+                {"detail": str(exc), "id": exc.product_id},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        catalog_cache.bump()
+
+        return Response({"reserved": serializer.data})
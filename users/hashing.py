@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many concurrent logins, try again shortly."
+    default_code = "hashing_unavailable"
+
+
+# Hashers release the GIL while they run, so the pool caps how many cores
+# hashing may use; the semaphore caps how many requests may wait for it.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    thread_name_prefix="password-hashing",
+)
+_slots = BoundedSemaphore(
+    settings.PASSWORD_HASHING_WORKERS + settings.PASSWORD_HASHING_QUEUE_SIZE
+)
+
+
+def run_hashing(func, *args):
+    if not _slots.acquire(timeout=settings.PASSWORD_HASHING_WAIT):
+        raise HashingUnavailable()
+
+    try:
+        return _executor.submit(func, *args).result()
+    finally:
+        _slots.release()
+
+
+def _verify(password: str, encoded):
+    if encoded is None:
+        # Same cost as a real check, so unknown usernames are not faster.
+        make_password(password)
+        return False, None
+
+    upgraded = []
+    valid = check_password(
+        password, encoded, setter=lambda raw: upgraded.append(make_password(raw))
+    )
+
+    return valid, upgraded[0] if upgraded else None
+
+
+def hash_password(password: str) -> str:
+    return run_hashing(make_password, password)
+
+
+def verify_password(password: str, encoded) -> tuple:
+    """
+    Returns `(valid, upgraded)`, where `upgraded` is a new encoding with the
+    preferred hasher when the stored one is outdated, and None otherwise.
+    """
+    return run_hashing(_verify, password, encoded)
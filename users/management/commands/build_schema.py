@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+import yaml
+
+from utils.schema import (
+    compute_fingerprint,
+    generate_schema,
+    read_schema_file,
+    render_schema_file,
+)
+
+
+class Command(BaseCommand):
+    help = "Regenerates the checked-in OpenAPI schema when the URLconf or serializers changed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", default=str(settings.SCHEMA_FILE))
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error instead of writing when the file is outdated",
+        )
+        parser.add_argument("--force", action="store_true")
+
+    def check_file(self, path, fingerprint, stored_fingerprint, stored):
+        content = render_schema_file(
+            generate_schema(settings.SCHEMA_URLCONF), fingerprint
+        )
+
+        if stored != yaml.safe_load(content):
+            raise CommandError(
+                f"{path} is outdated, run `python manage.py build_schema`"
+            )
+
+        if stored_fingerprint != fingerprint:
+            self.stdout.write(f"{path} matches the API, only its fingerprint changed")
+        else:
+            self.stdout.write(f"{path} is up to date")
+
+    def handle(self, *args, **options):
+        path = Path(options["file"])
+        fingerprint = compute_fingerprint(settings.SCHEMA_URLCONF)
+        stored_fingerprint, stored = read_schema_file(path)
+
+        # The fingerprint only covers the class definitions, so the check
+        # always compares the generated schema.
+        if options["check"]:
+            self.check_file(path, fingerprint, stored_fingerprint, stored)
+            return
+
+        if stored_fingerprint == fingerprint and not options["force"]:
+            self.stdout.write(f"{path} is up to date")
+            return
+
+        content = render_schema_file(
+            generate_schema(settings.SCHEMA_URLCONF), fingerprint
+        )
+
+        path.write_bytes(content)
+        self.stdout.write(f"wrote {path}")
@@ -1,10 +1,11 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-import uuid
+
+from utils.ids import uuid7
 
 
 class User(AbstractUser):
-    id = models.UUIDField(default=uuid.uuid4, primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid7, primary_key=True, editable=False)
     username = models.TextField(
         unique=True,
         error_messages={"unique": "username already exists."},
@@ -12,5 +13,13 @@ class User(AbstractUser):
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
     is_seller = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     REQUIRED_FIELDS = ["first_name", "last_name"]
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(
+                fields=["-date_joined", "-id"], name="users_date_joined_id_idx"
+            ),
+        ]
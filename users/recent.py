@@ -0,0 +1,58 @@
+from collections import deque
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
+
+
+class RecentSignups:
+    """
+    Ring buffer with the most recent signups of this process, so the
+    newest accounts endpoint can skip the database for small `num`.
+
+    Signups made elsewhere (other workers, createsuperuser) show up once
+    the buffer is reseeded, at most `ttl` seconds later.
+    """
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self._lock = Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._users = deque(maxlen=self.size)
+            self._complete = False
+            self._seeded_at = None
+
+    def is_fresh(self) -> bool:
+        return self._seeded_at is not None and monotonic() - self._seeded_at < self.ttl
+
+    def seed(self, users):
+        users = list(users[: self.size])
+
+        with self._lock:
+            self._users = deque(users, maxlen=self.size)
+            self._complete = len(users) < self.size
+            self._seeded_at = monotonic()
+
+    def record(self, user):
+        with self._lock:
+            if self.is_fresh():
+                self._users.appendleft(user)
+
+    def get(self, num: int):
+        with self._lock:
+            if not self.is_fresh():
+                return None
+
+            if num > len(self._users) and not self._complete:
+                return None
+
+            return list(self._users)[:num]
+
+
+recent_signups = RecentSignups(
+    settings.RECENT_SIGNUPS_BUFFER_SIZE, settings.RECENT_SIGNUPS_TTL
+)
@@ -1,9 +1,14 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
+from utils import TimedSerializerMixin
+from .hashing import hash_password, verify_password
 from .models import User
+from .recent import recent_signups
 
 
-class AccountSerializer(ModelSerializer):
+class AccountSerializer(TimedSerializerMixin, ModelSerializer):
     class Meta:
         model = User
         fields = (
@@ -22,7 +27,13 @@ class AccountSerializer(ModelSerializer):
         extra_kwargs = {"password": {"write_only": True}}
 
     def create(self, validated_data: dict) -> User:
-        user = User.objects.create_user(**validated_data)
+        password = hash_password(validated_data.pop("password"))
+
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.password = password
+        user.save()
+        recent_signups.record(user)
 
         return user
 
@@ -41,3 +52,28 @@ class AccountSerializer(ModelSerializer):
         instance.save()
 
         return instance
+
+
+class LoginSerializer(serializers.Serializer):
+    username = serializers.CharField()
+    password = serializers.CharField(
+        style={"input_type": "password"}, trim_whitespace=False, write_only=True
+    )
+
+    def validate(self, attrs):
+        user = User.objects.filter(username=attrs["username"]).first()
+        valid, upgraded = verify_password(
+            attrs["password"], user.password if user else None
+        )
+
+        if not valid or not user.is_active:
+            raise serializers.ValidationError(
+                _("Unable to log in with provided credentials."), code="authorization"
+            )
+
+        if upgraded:
+            User.objects.filter(pk=user.pk).update(password=upgraded)
+
+        attrs["user"] = user
+
+        return attrs
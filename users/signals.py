@@ -0,0 +1,37 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from utils.authentication import invalidate_token, invalidate_user_tokens
+from .models import User
+from .recent import recent_signups
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user_tokens(sender, instance: User, using, **kwargs):
+    # Once now, for this transaction's own requests, and again on commit: a
+    # worker that read the old row before the commit may have cached it
+    # under the first version.
+    invalidate_user_tokens(instance.pk)
+    transaction.on_commit(partial(invalidate_user_tokens, instance.pk), using=using)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance: Token, using, **kwargs):
+    invalidate_token(instance.key, instance.user_id)
+    transaction.on_commit(
+        partial(invalidate_token, instance.key, instance.user_id), using=using
+    )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def reset_recent_signups(sender, instance: User, **kwargs):
+    # New signups are recorded by AccountSerializer.create; anything else
+    # may have changed what the buffer holds.
+    if not kwargs.get("created", False) or kwargs.get("raw", False):
+        recent_signups.clear()
@@ -0,0 +1,113 @@
+from django.core.cache import caches
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from utils.authentication import token_cache, user_version_key
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller_user_data = {
+            "username": "ale",
+            "password": "abcd",
+            "first_name": "Alexandre",
+            "last_name": "Alves",
+            "is_seller": True,
+        }
+        cls.admin_user_data = {
+            "username": "amb",
+            "password": "abcd",
+            "first_name": "Ambrósio",
+            "last_name": "Silva",
+            "is_seller": False,
+        }
+
+    def setUp(self) -> None:
+        token_cache.clear()
+        caches["auth"].clear()
+
+        self.user = User.objects.create_user(**self.seller_user_data)
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+
+    def test_token_is_resolved_from_cache(self):
+        """Requisições autenticadas seguidas não devem consultar o token no banco"""
+
+        self.client.get("/api/products/")
+
+        msg = "A segunda requisição não deve consultar o token no banco de dados"
+
+        with self.assertNumQueries(1, msg=msg):
+            response = self.client.get("/api/products/")
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_deactivated_user_token_is_invalidated(self):
+        """O token de um usuário desativado não deve continuar no cache"""
+
+        self.client.get("/api/products/")
+
+        admin = User.objects.create_superuser(**self.admin_user_data)
+        admin_token = Token.objects.create(user=admin)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + admin_token.key)
+        self.client.patch(
+            f"/api/accounts/{self.user.id}/management/", {"is_active": False}
+        )
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.get("/api/products/")
+
+        expected_status_code = status.HTTP_401_UNAUTHORIZED
+        result_status_code = response.status_code
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, result_status_code, msg_status_code)
+
+    def test_updated_user_is_reloaded(self):
+        """Após atualizar a conta o usuário autenticado deve refletir os novos dados"""
+
+        self.client.get("/api/products/")
+        self.client.patch(f"/api/accounts/{self.user.id}/", {"first_name": "Roberto"})
+
+        credentials = token_cache.get(self.token.key)
+
+        msg = "O cache não deve manter os dados antigos do usuário"
+
+        self.assertIsNone(credentials, msg)
+
+    def test_deleted_token_is_invalidated(self):
+        """Um token removido não deve continuar autenticando"""
+
+        self.client.get("/api/products/")
+        self.token.delete()
+
+        response = self.client.get("/api/products/")
+
+        expected_status_code = status.HTTP_401_UNAUTHORIZED
+        result_status_code = response.status_code
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, result_status_code, msg_status_code)
+
+    def test_invalidation_from_another_worker(self):
+        """Um usuário desativado em outro worker não deve continuar autenticando"""
+
+        self.client.get("/api/products/")
+
+        # Outro worker só altera o banco e a versão no cache compartilhado.
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        caches["auth"].delete(user_version_key(self.user.pk))
+
+        msg = "O cache local ainda deveria ter o token"
+        self.assertIsNotNone(token_cache.get(self.token.key), msg)
+
+        response = self.client.get("/api/products/")
+
+        expected_status_code = status.HTTP_401_UNAUTHORIZED
+        result_status_code = response.status_code
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, result_status_code, msg_status_code)
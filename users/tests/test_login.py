@@ -0,0 +1,113 @@
+from threading import BoundedSemaphore
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+
+
+class LoginViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.login_data = {"username": "ale", "password": "abcd"}
+        cls.user = User.objects.create_user(
+            **cls.login_data, first_name="Alexandre", last_name="Alves"
+        )
+
+    def test_login_returns_the_user_token(self):
+        """O login deve retornar sempre o mesmo token do usuário"""
+
+        first = self.client.post("/api/login/", self.login_data)
+        second = self.client.post("/api/login/", self.login_data)
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_token = "O token retornado esta diferente do esperado"
+
+        self.assertEqual(status.HTTP_200_OK, first.status_code, msg_status_code)
+        self.assertEqual(
+            Token.objects.get(user=self.user).key, first.data["token"], msg_token
+        )
+        self.assertEqual(first.data["token"], second.data["token"], msg_token)
+
+    def test_login_with_wrong_credentials(self):
+        """Credenciais inválidas ou de usuários inexistentes devem retornar 400"""
+
+        wrong_password = self.client.post(
+            "/api/login/", {**self.login_data, "password": "errada"}
+        )
+        unknown_user = self.client.post(
+            "/api/login/", {**self.login_data, "username": "ninguem"}
+        )
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_400_BAD_REQUEST, wrong_password.status_code, msg_status_code
+        )
+        self.assertEqual(
+            status.HTTP_400_BAD_REQUEST, unknown_user.status_code, msg_status_code
+        )
+
+    def test_valid_token_skips_password_hashing(self):
+        """Um token válido deve ser devolvido sem recalcular o hash da senha"""
+
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        with mock.patch("users.serializers.verify_password") as verify_password:
+            response = self.client.post("/api/login/", self.login_data)
+
+        msg_token = "O token retornado esta diferente do esperado"
+
+        self.assertEqual(token.key, response.data["token"], msg_token)
+        verify_password.assert_not_called()
+
+    def test_token_of_another_user_is_not_reused(self):
+        """O token enviado não deve ser reutilizado no login de outro usuário"""
+
+        other = User.objects.create_user(
+            username="bia", password="abcd", first_name="Beatriz", last_name="Alves"
+        )
+        token = Token.objects.create(user=other)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+        response = self.client.post("/api/login/", self.login_data)
+
+        msg_token = "O token de outro usuário não deveria ser reutilizado"
+
+        self.assertNotEqual(token.key, response.data["token"], msg_token)
+
+    def test_outdated_hash_is_upgraded_on_login(self):
+        """Senhas com hasher antigo devem ser atualizadas no login"""
+
+        User.objects.filter(pk=self.user.pk).update(
+            password=make_password("abcd", hasher="pbkdf2_sha1")
+        )
+
+        response = self.client.post("/api/login/", self.login_data)
+        self.user.refresh_from_db()
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_hasher = "O hash da senha não foi atualizado para o hasher preferido"
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code, msg_status_code)
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"), msg_hasher)
+        self.assertTrue(self.user.check_password("abcd"), msg_hasher)
+
+    @override_settings(PASSWORD_HASHING_WAIT=0)
+    def test_saturated_hashing_pool_returns_503(self):
+        """Com a fila de hashing cheia, o login deve retornar 503"""
+
+        with mock.patch("users.hashing._slots", BoundedSemaphore(1)) as slots:
+            slots.acquire()
+            response = self.client.post("/api/login/", self.login_data)
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_503_SERVICE_UNAVAILABLE, response.status_code, msg_status_code
+        )
@@ -51,3 +51,23 @@ class AccountTests(TestCase):
 
         with self.assertRaisesMessage(ValidationError, msg):
             user.full_clean()
+
+    def test_user_ids_are_time_ordered(self):
+        """Os ids gerados devem ser UUIDv7 crescentes na ordem de criação"""
+
+        users = [
+            User.objects.create_user(
+                username=f"rex{index}",
+                password="abc123",
+                first_name="tio",
+                last_name="rex",
+            )
+            for index in range(5)
+        ]
+        ids = [user.id for user in users]
+
+        msg_version = "Os ids devem ser UUIDs da versão 7"
+        msg_order = "Os ids devem crescer na ordem de criação"
+
+        self.assertTrue(all(id.version == 7 for id in ids), msg_version)
+        self.assertEqual(sorted(ids), ids, msg_order)
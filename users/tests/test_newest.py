@@ -0,0 +1,115 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from users.models import User
+from users.recent import RecentSignups, recent_signups
+
+
+class NewestAccountsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users = [
+            User.objects.create_user(
+                username=f"user{index}",
+                password="abcd",
+                first_name="Usuário",
+                last_name=str(index),
+            )
+            for index in range(3)
+        ]
+
+    def setUp(self) -> None:
+        recent_signups.clear()
+
+    def newest_usernames(self, num):
+        response = self.client.get(f"/api/accounts/newest/{num}")
+        self.assertEqual(status.HTTP_200_OK, response.status_code, response.content)
+
+        return [user["username"] for user in response.json()["results"]]
+
+    def signup(self, username):
+        self.client.post(
+            "/api/accounts/",
+            {
+                "username": username,
+                "password": "abcd",
+                "first_name": "Novo",
+                "last_name": "Usuário",
+            },
+        )
+
+    def test_newest_is_served_from_buffer(self):
+        """Após a primeira consulta, as contas mais novas não devem acessar o banco"""
+
+        self.newest_usernames(2)
+        self.signup("novo")
+
+        with self.assertNumQueries(0):
+            usernames = self.newest_usernames(2)
+
+        msg_results = "As contas mais novas estão diferentes do esperado"
+
+        self.assertEqual(["novo", "user2"], usernames, msg_results)
+
+    def test_account_update_resets_buffer(self):
+        """Alterações em contas devem descartar o buffer de cadastros recentes"""
+
+        self.newest_usernames(2)
+
+        user = self.users[2]
+        user.first_name = "Alterado"
+        user.save()
+
+        response = self.client.get("/api/accounts/newest/1")
+
+        msg_first_name = "O nome retornado esta desatualizado"
+
+        self.assertEqual(
+            "Alterado", response.json()["results"][0]["first_name"], msg_first_name
+        )
+
+    @override_settings(NEWEST_ACCOUNTS_MAX=2)
+    def test_num_is_capped(self):
+        """O número de contas retornadas deve respeitar o limite configurado"""
+
+        usernames = self.newest_usernames(1000)
+
+        msg_results = "A quantidade de contas retornadas excede o limite"
+
+        self.assertEqual(["user2", "user1"], usernames, msg_results)
+
+
+class RecentSignupsTests(APITestCase):
+    def test_buffer_keeps_only_the_most_recent(self):
+        """O buffer deve manter apenas os cadastros mais recentes"""
+
+        buffer = RecentSignups(size=2, ttl=60)
+        buffer.seed(["b", "a"])
+        buffer.record("c")
+
+        msg_buffer = "O conteúdo do buffer esta diferente do esperado"
+
+        self.assertEqual(["c", "b"], buffer.get(2), msg_buffer)
+        self.assertIsNone(buffer.get(3), msg_buffer)
+
+    def test_small_tables_are_answered_completely(self):
+        """Se o buffer contém todos os usuários, qualquer `num` deve ser atendido"""
+
+        buffer = RecentSignups(size=5, ttl=60)
+        buffer.seed(["b", "a"])
+
+        msg_buffer = "O conteúdo do buffer esta diferente do esperado"
+
+        self.assertEqual(["b", "a"], buffer.get(10), msg_buffer)
+
+    def test_unseeded_buffer_ignores_records(self):
+        """Um buffer expirado não deve responder nem aceitar cadastros"""
+
+        buffer = RecentSignups(size=2, ttl=0)
+        buffer.seed(["a"])
+        buffer.record("b")
+
+        msg_buffer = "O buffer expirado não deveria responder"
+
+        self.assertIsNone(buffer.get(1), msg_buffer)
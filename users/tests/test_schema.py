@@ -0,0 +1,123 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+import ast
+import gzip
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from rest_framework.test import APITestCase
+from rest_framework.views import status
+
+from products.models import Product
+from utils.schema import (
+    compute_fingerprint,
+    generate_schema,
+    get_class_definition,
+    get_precomputed_schema,
+)
+
+
+class CommentedSerializer:
+    # Comentários e linhas em branco não mudam o schema.
+
+    name = "a"  # nem os do fim da linha
+
+
+class SchemaViewTests(APITestCase):
+    def setUp(self) -> None:
+        get_precomputed_schema.cache_clear()
+
+    def test_checked_in_schema_is_up_to_date(self):
+        """O schema.yml versionado deve corresponder à API atual"""
+
+        call_command("build_schema", "--check", stdout=mock.Mock())
+
+    def test_check_compares_the_generated_schema(self):
+        """O --check deve falhar quando o conteúdo do schema mudou"""
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "schema.yml"
+            content = Path(settings.SCHEMA_FILE).read_text()
+            path.write_text(content.replace("Komercio API", "Outra API"))
+
+            with self.assertRaises(CommandError):
+                call_command("build_schema", "--check", "--file", str(path))
+
+    def test_fingerprint_ignores_comments(self):
+        """A impressão digital deve ignorar comentários e formatação"""
+
+        msg = "A definição da classe deveria ignorar os comentários"
+        self.assertEqual(
+            ast.dump(ast.parse('class CommentedSerializer:\n    name = "a"\n')),
+            get_class_definition(CommentedSerializer),
+            msg,
+        )
+
+    def test_fingerprint_follows_model_fields(self):
+        """A impressão digital deve mudar quando um campo do model muda"""
+
+        fingerprint = compute_fingerprint(settings.SCHEMA_URLCONF)
+        field = Product._meta.get_field("quantity")
+
+        with mock.patch.object(field, "help_text", "Unidades em estoque"):
+            changed = compute_fingerprint(settings.SCHEMA_URLCONF)
+
+        msg = "A impressão digital deveria mudar com o campo do model"
+        self.assertNotEqual(fingerprint, changed, msg)
+
+    def test_integer_ranges_do_not_depend_on_the_database(self):
+        """Os limites dos inteiros devem ser os mesmos em qualquer banco"""
+
+        schema = generate_schema(settings.SCHEMA_URLCONF)
+        quantity = schema["components"]["schemas"]["ProductDetail"]["properties"][
+            "quantity"
+        ]
+
+        msg = "Os limites do campo quantity estão diferentes do esperado"
+        self.assertEqual(-2147483648, quantity["minimum"], msg)
+        self.assertEqual(2147483647, quantity["maximum"], msg)
+
+    def test_schema_is_served_from_memory(self):
+        """O schema não deve ser gerado novamente a cada requisição"""
+
+        first = self.client.get("/schema/")
+
+        with mock.patch(
+            "utils.schema.generate_schema", side_effect=AssertionError
+        ) as generate_schema:
+            second = self.client.get("/schema/?format=json")
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_generated = "O schema não deveria ter sido gerado novamente"
+
+        self.assertEqual(status.HTTP_200_OK, first.status_code, msg_status_code)
+        self.assertEqual(status.HTTP_200_OK, second.status_code, msg_status_code)
+        self.assertEqual("3.0.3", second.json()["openapi"], msg_generated)
+        generate_schema.assert_not_called()
+
+    def test_schema_supports_etag(self):
+        """O schema deve responder 304 quando o ETag não mudou"""
+
+        first = self.client.get("/schema/")
+        second = self.client.get("/schema/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(
+            status.HTTP_304_NOT_MODIFIED, second.status_code, msg_status_code
+        )
+
+    def test_schema_is_gzipped_when_accepted(self):
+        """O schema deve ser comprimido quando o cliente aceita gzip"""
+
+        plain = self.client.get("/schema/")
+        compressed = self.client.get("/schema/", HTTP_ACCEPT_ENCODING="gzip")
+
+        msg_encoding = "O cabeçalho `Content-Encoding` esta diferente do esperado"
+        msg_content = "O conteúdo descomprimido esta diferente do original"
+
+        self.assertEqual("gzip", compressed["Content-Encoding"], msg_encoding)
+        self.assertEqual(
+            plain.content, gzip.decompress(compressed.content), msg_content
+        )
@@ -3,9 +3,11 @@ from rest_framework.test import APITestCase
 from rest_framework.views import status
 
 from users.models import User
+from users.recent import recent_signups
+from utils.testing import QueryAuditTestMixin
 
 
-class AccountViewTests(APITestCase):
+class AccountViewTests(QueryAuditTestMixin, APITestCase):
     @classmethod
     def setUpTestData(cls) -> None:
         cls.seller_user_data = {
@@ -48,6 +50,9 @@ class AccountViewTests(APITestCase):
         token = Token.objects.create(user=cls.admin_user)
         cls.admin_token = token.key
 
+    def setUp(self) -> None:
+        recent_signups.clear()
+
     def test_create_user_seller(self):
         """Deve ser capaz de criar um novo usuário vendedor"""
 
@@ -330,3 +335,58 @@ class AccountViewTests(APITestCase):
         self.assertSetEqual(
             expected_results_objects_keys, result_results_objects_keys, msg_keys
         )
+
+    def test_anyone_can_list_users_with_keyset_pagination(self):
+        """Deve ser capaz de listar usuários usando a paginação por cursor"""
+
+        self.client.post("/api/accounts/", self.seller_user_data)
+        self.client.post("/api/accounts/", self.normal_user_data)
+
+        response = self.client.get("/api/accounts/?pagination=keyset&page_size=1")
+
+        expected_status_code = status.HTTP_200_OK
+        expected_keys = {"next", "previous", "results"}
+
+        result_status_code = response.status_code
+        result_keys = set(response.data.keys())
+        result_username = response.data["results"][0]["username"]
+
+        msg_status_code = "O status code recebido esta diferente do esperado"
+        msg_keys = "As chaves recebidas no retorno esta diferente do esperado"
+        msg_username = "O usuário mais recente deve ser o primeiro da lista"
+
+        self.assertEqual(expected_status_code, result_status_code, msg_status_code)
+        self.assertSetEqual(expected_keys, result_keys, msg_keys)
+        self.assertEqual(
+            self.normal_user_data["username"], result_username, msg_username
+        )
+        self.assertIsNotNone(response.data["next"])
+
+    def test_list_users_if_none_match_returns_not_modified(self):
+        """A listagem de usuários deve responder 304 para um `ETag` atual"""
+
+        self.client.post("/api/accounts/", self.seller_user_data)
+
+        etag = self.client.get("/api/accounts/")["ETag"]
+        response = self.client.get("/api/accounts/", HTTP_IF_NONE_MATCH=etag)
+
+        expected_status_code = status.HTTP_304_NOT_MODIFIED
+        result_status_code = response.status_code
+        msg_status_code = "O status code recebido esta diferente do esperado"
+
+        self.assertEqual(expected_status_code, result_status_code, msg_status_code)
+
+    def test_user_list_query_count_does_not_grow(self):
+        """O número de queries da listagem não deve crescer com os usuários"""
+
+        def add_users(total):
+            User.objects.bulk_create(
+                User(username=f"user{User.objects.count()}-{index}")
+                for index in range(total)
+            )
+
+        self.assertQueryCountConstant(
+            lambda: self.client.get("/api/accounts/?pagination=keyset&page_size=20"),
+            add_users,
+            msg="A listagem de usuários possui uma query por usuário",
+        )
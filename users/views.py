@@ -1,34 +1,83 @@
-from rest_framework.authentication import TokenAuthentication
+from django.conf import settings
 from rest_framework import generics
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.response import Response
 
-from utils import IsOwner, IsAdmin
-from .serializers import AccountSerializer
+from utils import (
+    IsOwner,
+    IsAdmin,
+    PaginationByModeMixin,
+    CachedTokenAuthentication,
+    AsyncListAPIView,
+    ConditionalRequestMixin,
+    CompiledReadMixin,
+    TimedPermissionsMixin,
+)
+from .serializers import AccountSerializer, LoginSerializer
 from .models import User
+from .recent import recent_signups
 
 
-class AccountView(generics.ListCreateAPIView):
+class AccountView(
+    TimedPermissionsMixin,
+    ConditionalRequestMixin,
+    CompiledReadMixin,
+    PaginationByModeMixin,
+    generics.ListCreateAPIView,
+):
     serializer_class = AccountSerializer
     queryset = User.objects
+    keyset_ordering = ("-date_joined", "-id")
+
+    def get_pagination_mode(self):
+        if "num" in self.kwargs:
+            return None
+
+        return super().get_pagination_mode()
 
     def get_queryset(self):
         if "num" in list(self.kwargs.keys()):
-            num_users = self.kwargs["num"]
+            num_users = min(self.kwargs["num"], settings.NEWEST_ACCOUNTS_MAX)
 
-            return self.queryset.order_by("-date_joined")[0:num_users]
+            return self.get_newest(num_users)
 
         return self.queryset.all()
 
+    def get_newest(self, num_users):
+        newest = self.queryset.order_by(*self.keyset_ordering)
+        users = recent_signups.get(num_users)
+
+        if users is None and num_users <= recent_signups.size:
+            recent_signups.seed(newest)
+            users = recent_signups.get(num_users)
+
+        if users is None:
+            return newest[0:num_users]
+
+        return users
+
 
-class UpdateAccountView(generics.UpdateAPIView):
-    authentication_classes = [TokenAuthentication]
+class AsyncAccountView(CompiledReadMixin, AsyncListAPIView):
+    serializer_class = AccountSerializer
+    queryset = User.objects
+    keyset_ordering = ("-date_joined", "-id")
+
+
+class UpdateAccountView(
+    TimedPermissionsMixin, ConditionalRequestMixin, generics.UpdateAPIView
+):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsOwner]
 
     serializer_class = AccountSerializer
     queryset = User.objects
 
 
-class ActivateDeactivateAccountView(generics.UpdateAPIView):
-    authentication_classes = [TokenAuthentication]
+class ActivateDeactivateAccountView(
+    TimedPermissionsMixin, ConditionalRequestMixin, generics.UpdateAPIView
+):
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAdmin]
 
     serializer_class = AccountSerializer
@@ -36,3 +85,39 @@ class ActivateDeactivateAccountView(generics.UpdateAPIView):
 
     def perform_update(self, serializer):
         serializer.save(is_admin=self.request.user.is_superuser)
+
+
+class LoginView(generics.GenericAPIView):
+    authentication_classes = []
+    permission_classes = []
+
+    serializer_class = LoginSerializer
+
+    def get_current_token(self):
+        try:
+            credentials = CachedTokenAuthentication().authenticate(self.request)
+        except AuthenticationFailed:
+            return None
+
+        if credentials is None:
+            return None
+
+        user, token = credentials
+        username = self.request.data.get("username")
+
+        if username is not None and username != user.username:
+            return None
+
+        return token
+
+    def post(self, request, *args, **kwargs):
+        token = self.get_current_token()
+
+        if token is None:
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            token, _ = Token.objects.get_or_create(
+                user=serializer.validated_data["user"]
+            )
+
+        return Response({"token": token.key})
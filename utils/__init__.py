@@ -4,4 +4,22 @@ from .permissions import (
     IsOwner,
     IsAdmin,
 )
-from .mixins import SerializerByMethodMixin
+from .mixins import (
+    SerializerByMethodMixin,
+    QueryPlanMixin,
+    PaginationByModeMixin,
+    CachedResponseMixin,
+    ConditionalRequestMixin,
+    PreparedStatementsMixin,
+    CompiledReadMixin,
+)
+from .pagination import KeysetPagination, FeedPagination
+from .authentication import CachedTokenAuthentication
+from .response_cache import ResponseCache
+from .parsers import NDJSONParser
+from .renderers import NDJSONRenderer, CSVRenderer
+from .batching import batched
+from .ids import uuid7
+from .compiled import compile_serializer
+from .views import AsyncListAPIView, AsyncRetrieveAPIView
+from .instrumentation import TimedPermissionsMixin, TimedSerializerMixin
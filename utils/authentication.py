@@ -0,0 +1,63 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+
+from _project.db.prepared import prepared_statements
+
+from .cache import TTLLRUCache
+
+
+token_cache = TTLLRUCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_TTL
+)
+
+
+def user_version_key(user_id) -> str:
+    return f"auth:user:{user_id}:version"
+
+
+def get_user_version(user_id) -> int:
+    # Seeded from the clock, so a version evicted from the shared cache
+    # never comes back equal to one a worker still holds.
+    cache = caches["auth"]
+    key = user_version_key(user_id)
+    version = cache.get(key)
+
+    if version is None:
+        version = time.time_ns()
+        cache.add(key, version)
+        version = cache.get(key, version)
+
+    return version
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+
+        if cached is not None:
+            credentials, version = cached
+
+            if version == get_user_version(credentials[0].pk):
+                return credentials
+
+        with prepared_statements():
+            credentials = super().authenticate_credentials(key)
+
+        token_cache.set(key, (credentials, get_user_version(credentials[0].pk)))
+
+        return credentials
+
+
+def invalidate_token(key: str, user_id):
+    # The token row is gone, but other workers only notice through the
+    # version of its user.
+    token_cache.delete(key)
+    invalidate_user_tokens(user_id)
+
+
+def invalidate_user_tokens(user_id):
+    token_cache.delete_where(lambda key, cached: cached[0][0].pk == user_id)
+    caches["auth"].set(user_version_key(user_id), time.time_ns())
@@ -0,0 +1,8 @@
+from itertools import islice
+
+
+def batched(iterable, size: int):
+    iterator = iter(iterable)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,221 @@
+"""
+Compiled read-only serializers.
+
+`compile_serializer` turns the read fields of a ModelSerializer into one
+generated function from `values()` rows to the dicts `serializer.data`
+would hold, once per class. Lists skip model instances and the per-field
+`get_attribute`/`to_representation` calls, which dominate large pages.
+
+Fields that do not map to a column (method fields, `source="*"`, related
+fields other than nested serializers, to-many relations) make a serializer
+not compilable; `compile_serializer` returns None and views keep the
+regular path.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .instrumentation import timed_call
+
+# to_representation is a no-op for the values these fields get from the
+# database, so the compiled function copies them as they are.
+IDENTITY_FIELDS = (
+    serializers.ReadOnlyField,
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+)
+
+
+class NotCompilable(Exception):
+    pass
+
+
+def static(converter):
+    return lambda: converter
+
+
+def datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+
+    if output_format is None or output_format.lower() != ISO_8601:
+        return static(field.to_representation)
+
+    # The current timezone can change per request, so it is resolved once
+    # per list instead of once per value.
+    def bind():
+        tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+
+        if tz is None:
+            return field.to_representation
+
+        def convert(value):
+            if value.tzinfo is None:
+                return field.to_representation(value)
+
+            value = value.astimezone(tz).isoformat()
+
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+        return convert
+
+    return bind
+
+
+def get_converter(field):
+    """None for fields copied as they are, else a factory of the converter."""
+    kind = type(field)
+
+    if kind in IDENTITY_FIELDS:
+        return None
+
+    if kind is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return static(str)
+
+    if kind is serializers.DateTimeField and settings.USE_TZ:
+        return datetime_converter(field)
+
+    return static(field.to_representation)
+
+
+def walk_source(model, source_attrs, nested: bool):
+    """
+    The model the source ends on (for nested serializers) or its model
+    field, and whether a null can show up along the way.
+    """
+    nullable = False
+
+    for index, attr in enumerate(source_attrs):
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            raise NotCompilable(attr)
+
+        last = index == len(source_attrs) - 1
+        nullable = nullable or model_field.null
+
+        if not model_field.is_relation:
+            if not last or nested:
+                raise NotCompilable(attr)
+
+            return model_field, nullable
+
+        if not model_field.concrete or model_field.many_to_many:
+            raise NotCompilable(attr)
+
+        if last and not nested:
+            # The foreign key column itself, as in `source="user_id"`.
+            if attr != model_field.attname:
+                raise NotCompilable(attr)
+
+            return model_field, nullable
+
+        model = model_field.related_model
+
+    return model, nullable
+
+
+class CompiledSerializer:
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.converters = []
+        lookups = []
+        expression = self.compile(serializer_class(), "", lookups)
+        self.lookups = tuple(dict.fromkeys(lookups))
+
+        arguments = ", ".join(
+            ["rows", *(f"c{index}" for index in range(len(self.converters)))]
+        )
+        source = (
+            f"def represent({arguments}):\n"
+            f"    return [{expression} for row in rows]\n"
+        )
+        namespace = {}
+        exec(
+            compile(source, f"<compiled {serializer_class.__qualname__}>", "exec"),
+            namespace,
+        )
+        self.represent = namespace["represent"]
+        self.source = source
+
+    def compile(self, serializer, prefix: str, lookups: list) -> str:
+        model = serializer.Meta.model
+        items = []
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if field.source == "*" or isinstance(field, serializers.ListSerializer):
+                raise NotCompilable(name)
+
+            nested = isinstance(field, serializers.BaseSerializer)
+
+            if not nested and isinstance(
+                field, (serializers.RelatedField, serializers.ManyRelatedField)
+            ):
+                raise NotCompilable(name)
+
+            target, nullable = walk_source(model, field.source_attrs, nested)
+            path = prefix + "__".join(field.source_attrs)
+
+            if nested:
+                expression = self.compile(field, f"{path}__", lookups)
+
+                if nullable:
+                    pk = f"{path}__{target._meta.pk.attname}"
+                    lookups.append(pk)
+                    expression = f"None if row[{pk!r}] is None else {expression}"
+            else:
+                lookups.append(path)
+                expression = self.convert(field, f"row[{path!r}]")
+
+                if nullable and expression != f"row[{path!r}]":
+                    expression = f"None if row[{path!r}] is None else {expression}"
+
+            items.append(f"{name!r}: {expression}")
+
+        return "{" + ", ".join(items) + "}"
+
+    def convert(self, field, value: str) -> str:
+        converter = get_converter(field)
+
+        if converter is None:
+            return value
+
+        self.converters.append(converter)
+
+        return f"c{len(self.converters) - 1}({value})"
+
+    def to_representation(self, rows) -> list:
+        """The dicts `serializer_class(many=True).data` holds for these rows."""
+        return self.represent(rows, *(bind() for bind in self.converters))
+
+    def bind(self, rows) -> "CompiledData":
+        return CompiledData(self, rows)
+
+
+class CompiledData:
+    """Stands in for a `many=True` serializer in the list views."""
+
+    def __init__(self, compiled: CompiledSerializer, rows):
+        self.compiled = compiled
+        self.rows = rows
+
+    @property
+    def data(self) -> list:
+        return timed_call("serializer", self.compiled.to_representation, self.rows)
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(serializer_class) -> CompiledSerializer | None:
+    if not hasattr(getattr(serializer_class, "Meta", None), "model"):
+        return None
+
+    try:
+        return CompiledSerializer(serializer_class)
+    except NotCompilable:
+        return None
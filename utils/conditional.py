@@ -0,0 +1,49 @@
+from hashlib import md5
+
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "The resource has been modified since it was last fetched."
+    default_code = "precondition_failed"
+
+
+def resolve_lookup(instance, lookup: str):
+    if isinstance(instance, dict):
+        return instance[lookup]
+
+    value = instance
+
+    for attr in lookup.split("__"):
+        value = getattr(value, attr)
+
+    return value
+
+
+def make_etag(*parts) -> str:
+    digest = md5(usedforsecurity=False)
+
+    for part in parts:
+        digest.update(repr(part).encode())
+
+    return quote_etag(digest.hexdigest())
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    if not header or not etag:
+        return False
+
+    etags = parse_etags(header)
+
+    return "*" in etags or etag in etags
+
+
+def not_modified(etag: str) -> HttpResponseNotModified:
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+
+    return response
@@ -0,0 +1,222 @@
+"""
+Streaming NDJSON fixtures.
+
+Each line is one object in the shape `dumpdata` uses,
+`{"model": "app.model", "pk": ..., "fields": {...}}`, so `dumpdata
+--format jsonl` output can be imported too. Only concrete fields are
+written; many-to-many relations (user groups and permissions) are not.
+"""
+from collections import Counter
+from datetime import datetime
+import io
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.utils import timezone
+
+
+class FixtureEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder drops the microseconds, which keyset cursors use.
+        if isinstance(o, datetime):
+            return o.isoformat()
+
+        return super().default(o)
+
+
+def dump_objects(queryset, chunk_size: int = 2000):
+    """Yields the rows of `queryset` as fixture objects, in primary key order."""
+    opts = queryset.model._meta
+    fields = opts.concrete_fields
+    rows = (
+        queryset.order_by("pk")
+        .values_list(*(field.attname for field in fields))
+        .iterator(chunk_size=chunk_size)
+    )
+
+    for row in rows:
+        values = {field.name: value for field, value in zip(fields, row)}
+
+        yield {
+            "model": opts.label_lower,
+            "pk": values.pop(opts.pk.name),
+            "fields": values,
+        }
+
+
+def write_ndjson(stream, objects) -> int:
+    encoder = FixtureEncoder(ensure_ascii=False)
+    written = 0
+
+    for obj in objects:
+        stream.write(encoder.encode(obj) + "\n")
+        written += 1
+
+    return written
+
+
+def read_ndjson(stream):
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"NDJSON parse error on line {number} - {exc}")
+
+
+def build_instance(model, obj: dict):
+    opts = model._meta
+    values = {opts.pk.attname: opts.pk.to_python(obj["pk"])}
+
+    for name, value in obj["fields"].items():
+        field = opts.get_field(name)
+
+        if field.concrete and not field.many_to_many:
+            values[field.attname] = field.to_python(value)
+
+    return model(**values)
+
+
+def get_timestamp_fields(model) -> list:
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+
+
+def copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+
+    if isinstance(value, bool):
+        return "t" if value else "f"
+
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_instances(model, instances, using: str):
+    """Inserts `instances` with PostgreSQL's COPY, in the text format."""
+    connection = connections[using]
+    fields = model._meta.concrete_fields
+    buffer = io.StringIO()
+
+    for instance in instances:
+        buffer.write(
+            "\t".join(
+                copy_value(
+                    field.get_db_prep_save(getattr(instance, field.attname), connection)
+                )
+                for field in fields
+            )
+            + "\n"
+        )
+
+    buffer.seek(0)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+            "FROM STDIN",
+            buffer,
+        )
+
+
+def restore_timestamps(model, instances, fields, imported, using: str, since):
+    """Writes back the imported values of the auto_now/auto_now_add fields."""
+    manager = model._default_manager.using(using)
+
+    for instance, values in zip(instances, imported):
+        for field, value in zip(fields, values):
+            setattr(instance, field.attname, value)
+
+    if since is not None:
+        # Rows that already existed were skipped and keep their timestamps.
+        inserted = set(
+            manager.filter(
+                pk__in=[instance.pk for instance in instances],
+                **{f"{fields[0].name}__gte": since},
+            ).values_list("pk", flat=True)
+        )
+        instances = [instance for instance in instances if instance.pk in inserted]
+
+    manager.bulk_update(instances, [field.name for field in fields])
+
+
+def insert_instances(model, instances, using: str, ignore_conflicts: bool):
+    if connections[using].vendor == "postgresql" and not ignore_conflicts:
+        # COPY writes the attributes as they are, timestamps included.
+        copy_instances(model, instances, using)
+        return
+
+    # bulk_create stamps the auto_now/auto_now_add fields with the current
+    # time, so the imported values are written back in an UPDATE per batch.
+    fields = get_timestamp_fields(model)
+    imported = [
+        [getattr(instance, field.attname) for field in fields] for instance in instances
+    ]
+    since = timezone.now() if ignore_conflicts else None
+
+    model._default_manager.using(using).bulk_create(
+        instances, ignore_conflicts=ignore_conflicts
+    )
+
+    if fields:
+        restore_timestamps(model, instances, fields, imported, using, since)
+
+
+def load_objects(
+    objects,
+    models: dict,
+    using: str = "default",
+    batch_size: int = 2000,
+    ignore_conflicts: bool = False,
+) -> Counter:
+    """
+    Inserts fixture objects in batches of `batch_size` rows, without
+    signals or per-row saves. Objects of models not in `models` (a label to
+    model mapping) are counted as skipped. Returns the count per label.
+    """
+    counts = Counter()
+
+    # Consecutive objects of one model share a batch; a dump lists each
+    # model in one run, so batches stay full.
+    def runs():
+        model, instances = None, []
+
+        for obj in objects:
+            label = obj["model"]
+
+            if label not in models:
+                counts["skipped"] += 1
+                continue
+
+            if models[label] is not model and instances:
+                yield model, instances
+                instances = []
+
+            model = models[label]
+            instances.append(build_instance(model, obj))
+
+            if len(instances) >= batch_size:
+                yield model, instances
+                instances = []
+
+        if instances:
+            yield model, instances
+
+    for model, instances in runs():
+        insert_instances(model, instances, using, ignore_conflicts)
+        counts[model._meta.label_lower] += len(instances)
+
+    return counts
@@ -0,0 +1,38 @@
+from threading import Lock
+import os
+import time
+import uuid
+
+_lock = Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit Unix millisecond
+    timestamp, a 12-bit counter for ids minted in the same millisecond and
+    62 random bits. Ids from one process are strictly increasing.
+    """
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        elif _counter < _COUNTER_MAX:
+            _counter += 1
+        else:
+            _last_ms += 1
+            _counter = 0
+
+        timestamp_ms, counter = _last_ms, _counter
+
+    random = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = timestamp_ms << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | random
+
+    return uuid.UUID(int=value)
@@ -0,0 +1,325 @@
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+from random import random
+from threading import Lock
+from time import perf_counter
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.response import Response
+from rest_framework.views import APIView, status
+
+from _project.db.pool import pool_stats, reset_pool_stats
+
+from .authentication import CachedTokenAuthentication
+from .permissions import IsAdmin
+from .response_cache import response_caches
+
+TIME_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+METRICS = ("total", "db", "serializer", "permission")
+
+_timings = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """Where the time of one sampled request went, in seconds."""
+
+    __slots__ = ("start", "queries", "db", "serializer", "permission", "active")
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.queries = 0
+        self.db = 0.0
+        self.serializer = 0.0
+        self.permission = 0.0
+        self.active = set()
+
+    def as_dict(self) -> dict:
+        """Query count and durations in milliseconds."""
+        return {
+            "queries": self.queries,
+            "total": (perf_counter() - self.start) * 1000,
+            "db": self.db * 1000,
+            "serializer": self.serializer * 1000,
+            "permission": self.permission * 1000,
+        }
+
+
+def timed_call(metric: str, func, *args, **kwargs):
+    """
+    Calls `func`, adding its duration to `metric` of the sampled request.
+    Nested calls for the same metric (nested serializers) are counted once.
+    """
+    timings = _timings.get()
+
+    if timings is None or metric in timings.active:
+        return func(*args, **kwargs)
+
+    timings.active.add(metric)
+    start = perf_counter()
+
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings.active.discard(metric)
+        setattr(timings, metric, getattr(timings, metric) + perf_counter() - start)
+
+
+def query_timer(execute, sql, params, many, context):
+    timings = _timings.get()
+
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.db += perf_counter() - start
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float):
+        """Upper bound of the bucket holding the q-quantile."""
+        rank = q * self.count
+        seen = 0
+
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+
+            if seen >= rank:
+                return bound
+
+        return None
+
+    def as_dict(self) -> dict:
+        cumulative = 0
+        buckets = {}
+
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class TimingHistograms:
+    """
+    Per-route histograms of the sampled requests of this process. Each
+    worker keeps its own; scrape them all to see the fleet.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._routes = {}
+
+    def record(self, route: str, timings: dict):
+        with self._lock:
+            histograms = self._routes.get(route)
+
+            if histograms is None:
+                histograms = self._routes[route] = {
+                    "queries": Histogram(QUERY_BUCKETS),
+                    **{metric: Histogram(TIME_BUCKETS_MS) for metric in METRICS},
+                }
+
+            for metric, histogram in histograms.items():
+                histogram.observe(timings[metric])
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                route: {
+                    metric: histogram.as_dict()
+                    for metric, histogram in histograms.items()
+                }
+                for route, histograms in sorted(self._routes.items())
+            }
+
+
+request_timings = TimingHistograms()
+
+
+def get_route(request) -> str:
+    match = request.resolver_match
+
+    if match is None:
+        return f"{request.method} <unresolved>"
+
+    return f"{request.method} /{match.route}"
+
+
+def server_timing(timings: dict) -> str:
+    entries = [
+        f'db;dur={timings["db"]:.3f};desc="{timings["queries"]} queries"',
+        f'serializer;dur={timings["serializer"]:.3f}',
+        f'permission;dur={timings["permission"]:.3f}',
+        f'total;dur={timings["total"]:.3f}',
+    ]
+
+    return ", ".join(entries)
+
+
+class InstrumentationMiddleware:
+    """
+    Times INSTRUMENTATION_SAMPLE_RATE of the requests: total latency, DB
+    queries, serializers and permission checks. Sampled responses carry a
+    `Server-Timing` header and feed `request_timings`.
+
+    With the rate at 0 the middleware removes itself from the stack, and the
+    serializer and permission hooks cost one context variable lookup.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.sample_rate = settings.INSTRUMENTATION_SAMPLE_RATE
+
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+
+        if self.is_async:
+            # Same marker as django.utils.deprecation.MiddlewareMixin.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def install_query_timer(self) -> ExitStack:
+        # Execute wrappers are per thread, so under ASGI this runs in the
+        # thread the request's ORM calls are made from.
+        stack = ExitStack()
+
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(query_timer))
+
+        return stack
+
+    def finish(self, request, response, timings: RequestTimings):
+        metrics = timings.as_dict()
+        request_timings.record(get_route(request), metrics)
+        response["Server-Timing"] = server_timing(metrics)
+
+        return response
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        if random() >= self.sample_rate:
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+
+        try:
+            with self.install_query_timer():
+                response = self.get_response(request)
+        finally:
+            _timings.reset(token)
+
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        if random() >= self.sample_rate:
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+
+        try:
+            stack = await sync_to_async(self.install_query_timer)()
+
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            _timings.reset(token)
+
+        return self.finish(request, response, timings)
+
+
+class TimedSerializerMixin:
+    # Runs once per item of a list, so the unsampled path stays inline.
+
+    def to_representation(self, instance):
+        if _timings.get() is None:
+            return super().to_representation(instance)
+
+        return timed_call("serializer", super().to_representation, instance)
+
+    def run_validation(self, *args, **kwargs):
+        if _timings.get() is None:
+            return super().run_validation(*args, **kwargs)
+
+        return timed_call("serializer", super().run_validation, *args, **kwargs)
+
+
+class TimedPermissionsMixin:
+    def check_permissions(self, request):
+        timed_call("permission", super().check_permissions, request)
+
+    def check_object_permissions(self, request, obj):
+        timed_call("permission", super().check_object_permissions, request, obj)
+
+
+class TimingHistogramView(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAdmin]
+    # Operational endpoint, kept out of the public schema.
+    schema = None
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {
+                "sample_rate": settings.INSTRUMENTATION_SAMPLE_RATE,
+                "routes": request_timings.snapshot(),
+                "response_caches": {
+                    namespace: cache.stats()
+                    for namespace, cache in sorted(response_caches.items())
+                },
+                # Per database alias, for this worker; empty without DB_POOL_ENABLED.
+                "db_pools": pool_stats(),
+            }
+        )
+
+    def delete(self, request, *args, **kwargs):
+        request_timings.clear()
+
+        for cache in response_caches.values():
+            cache.reset_stats()
+
+        reset_pool_stats()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,238 @@
+from .query_plan import get_query_plan
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from _project.db.prepared import prepared_statements
+
+from .compiled import compile_serializer
+from .conditional import (
+    PreconditionFailed,
+    etag_matches,
+    make_etag,
+    not_modified,
+    resolve_lookup,
+)
+from .pagination import PAGINATION_MODES, KeysetPagination
+
+
 class SerializerByMethodMixin:
     def get_serializer_class(self, *args, **kwargs):
         return self.serializer_map.get(self.request.method, self.serializer_class)
+
+
+class PreparedStatementsMixin:
+    # Runs the reads of the view with prepared statements. A no-op unless the
+    # database uses the pooled backend with `PREPARED_STATEMENTS` set.
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+
+        with prepared_statements():
+            return super().dispatch(request, *args, **kwargs)
+
+
+class QueryPlanMixin:
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        plan = get_query_plan(self.get_serializer_class())
+
+        return plan.apply(queryset)
+
+
+class CompiledReadMixin:
+    # For list views: GET pages are fetched as values() rows and turned into
+    # dicts by the compiled serializer. Serializers that cannot be compiled,
+    # and querysets a view already sliced or replaced by a list, keep the
+    # regular path.
+
+    def get_compiled_serializer(self):
+        if self.request.method not in ("GET", "HEAD"):
+            return None
+
+        return compile_serializer(self.get_serializer_class())
+
+    def get_row_lookups(self):
+        # Columns the list needs besides the serialized ones: the ETag fields
+        # and the keyset position of the last row.
+        ordering = KeysetPagination().get_ordering(self)
+
+        return (
+            *getattr(self, "etag_fields", ()),
+            *(field.lstrip("-") for field in ordering),
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        compiled = self.get_compiled_serializer()
+
+        if (
+            compiled is None
+            or not isinstance(queryset, QuerySet)
+            or queryset.query.is_sliced
+        ):
+            return queryset
+
+        self.compiled_serializer = compiled
+        lookups = dict.fromkeys((*compiled.lookups, *self.get_row_lookups()))
+
+        return queryset.values(*lookups)
+
+    def get_serializer(self, *args, **kwargs):
+        compiled = getattr(self, "compiled_serializer", None)
+
+        if compiled is None or not kwargs.get("many") or not args:
+            return super().get_serializer(*args, **kwargs)
+
+        return compiled.bind(args[0])
+
+
+class PaginationByModeMixin:
+    pagination_query_param = "pagination"
+    pagination_map = PAGINATION_MODES
+
+    def get_pagination_mode(self):
+        return self.request.query_params.get(self.pagination_query_param)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            pagination_class = self.pagination_map.get(
+                self.get_pagination_mode(), self.pagination_class
+            )
+            self._paginator = pagination_class() if pagination_class else None
+
+        return self._paginator
+
+
+class CachedResponseMixin:
+    response_cache = None
+
+    def is_response_cacheable(self, request):
+        return self.response_cache is not None and not request.user.is_authenticated
+
+    def get(self, request, *args, **kwargs):
+        if not self.is_response_cacheable(request):
+            return super().get(request, *args, **kwargs)
+
+        key = self.response_cache.make_key(request)
+        cached = self.response_cache.get(key)
+
+        if cached is not None:
+            etag = cached.get("ETag")
+
+            if etag_matches(request.headers.get("If-None-Match"), etag):
+                return not_modified(etag)
+
+            return cached
+
+        response = super().get(request, *args, **kwargs)
+
+        if response.status_code == 200:
+            response["X-Cache"] = "MISS"
+            response.add_post_render_callback(
+                lambda rendered: self.response_cache.set(key, rendered)
+            )
+
+        return response
+
+
+class ConditionalRequestMixin:
+    etag_fields = ("pk", "updated_at")
+    version_field = "updated_at"
+
+    def get_etag(self, instance):
+        return make_etag(*(resolve_lookup(instance, f) for f in self.etag_fields))
+
+    def get_current_etag(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+
+        try:
+            row = queryset.values(*self.etag_fields).first()
+        except (TypeError, ValueError, ValidationError):
+            return None
+
+        return row and self.get_etag(row)
+
+    def retrieve(self, request, *args, **kwargs):
+        if_none_match = request.headers.get("If-None-Match")
+
+        if if_none_match:
+            etag = self.get_current_etag()
+
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+
+        response = Response(serializer.data)
+        response["ETag"] = self.get_etag(instance)
+
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+
+        if page is None:
+            rows, envelope = list(queryset), None
+        else:
+            rows, envelope = page, self.get_paginated_response([]).data
+
+        etag = make_etag(envelope, *(self.get_etag(row) for row in rows))
+
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return not_modified(etag)
+
+        serializer = self.get_serializer(rows, many=True)
+
+        if page is None:
+            response = Response(serializer.data)
+        else:
+            response = self.get_paginated_response(serializer.data)
+
+        response["ETag"] = etag
+
+        return response
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
+        if_match = request.headers.get("If-Match")
+        instance = self.get_object()
+
+        if if_match is not None and not etag_matches(if_match, self.get_etag(instance)):
+            raise PreconditionFailed()
+
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+
+        if if_match is None:
+            self.perform_update(serializer)
+        else:
+            with transaction.atomic():
+                self.claim_version(instance)
+                self.perform_update(serializer)
+
+        response = Response(serializer.data)
+        response["ETag"] = self.get_etag(instance)
+
+        return response
+
+    def claim_version(self, instance):
+        version = getattr(instance, self.version_field)
+        claimed = (
+            type(instance)
+            ._default_manager.filter(pk=instance.pk, **{self.version_field: version})
+            .update(**{self.version_field: timezone.now()})
+        )
+
+        if not claimed:
+            raise PreconditionFailed()
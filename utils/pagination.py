@@ -0,0 +1,271 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .conditional import resolve_lookup
+
+
+class KeysetPagination(BasePagination):
+    ordering = ("-id",)
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.KEYSET_PAGINATION_MAX_PAGE_SIZE
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, view)
+
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, view)
+
+        return self.set_page([instance async for instance in queryset])
+
+    def get_page_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(view)
+        self.page_size = self.get_page_size(request)
+
+        self.position, self.reverse = self.decode_cursor(request, queryset)
+        ordering = self.reverse_ordering() if self.reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        if self.position is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(self.position, self.reverse)
+            )
+
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+
+        self.has_next = has_more if not self.reverse else True
+        self.has_previous = self.position is not None if not self.reverse else has_more
+
+        return self.page
+
+    def get_ordering(self, view):
+        if hasattr(view, "get_keyset_ordering"):
+            return tuple(view.get_keyset_ordering())
+
+        return tuple(getattr(view, "keyset_ordering", self.ordering))
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def reverse_ordering(self):
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        )
+
+    def get_keyset_filter(self, position, reverse=False) -> Q:
+        keyset_filter = Q()
+        equal = {}
+
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+
+            keyset_filter |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+
+        first_field = self.ordering[0].lstrip("-")
+        first_bound = "lte" if self.ordering[0].startswith("-") != reverse else "gte"
+
+        return Q(**{f"{first_field}__{first_bound}": position[0]}) & keyset_filter
+
+    def get_position(self, instance):
+        return [resolve_lookup(instance, field.lstrip("-")) for field in self.ordering]
+
+    def encode_cursor(self, position, reverse=False, ordering=None) -> str:
+        payload = {
+            "p": [
+                value if isinstance(value, (int, float)) else str(value)
+                for value in position
+            ],
+            "o": list(ordering or self.ordering),
+            "r": int(reverse),
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode()
+
+        return urlsafe_b64encode(data).decode().rstrip("=")
+
+    def get_ordering_field(self, queryset, name: str):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+
+        opts = queryset.model._meta
+        *relations, attr = name.split("__")
+
+        for relation in relations:
+            opts = opts.get_field(relation).related_model._meta
+
+        return opts.get_field(attr)
+
+    def parse_position(self, queryset, position) -> list:
+        """The cursor values as the ordering fields' Python values."""
+        values = []
+
+        for field, value in zip(self.ordering, position):
+            if not isinstance(value, (str, int, float)):
+                raise ValueError(value)
+
+            value = self.get_ordering_field(queryset, field.lstrip("-")).to_python(
+                value
+            )
+
+            if value is None:
+                raise ValueError(value)
+
+            values.append(value)
+
+        return values
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None, False
+
+        # Cursors come from the client: anything but the shape encode_cursor
+        # writes for the current ordering is a 404, not a failed query.
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            payload = json.loads(urlsafe_b64decode(encoded + padding))
+            position = payload["p"]
+            reverse = bool(payload.get("r", 0))
+
+            if payload.get("o") != list(self.ordering):
+                raise ValueError(payload.get("o"))
+
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError(position)
+
+            position = self.parse_position(queryset, position)
+        except (
+            binascii.Error,
+            ValueError,
+            TypeError,
+            KeyError,
+            AttributeError,
+            ValidationError,
+            FieldDoesNotExist,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def get_link(self, instance, reverse):
+        url = self.request.build_absolute_uri()
+        cursor = self.encode_cursor(self.get_position(instance), reverse)
+
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.get_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+
+        return self.get_link(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data) -> dict:
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class FeedPagination(KeysetPagination):
+    """
+    Forward-only keyset pages for change feeds. `next` is always set: past
+    the last row it repeats the current cursor, so clients poll it later.
+    """
+
+    page_size = settings.CHANGE_FEED_PAGE_SIZE
+    max_page_size = settings.CHANGE_FEED_MAX_PAGE_SIZE
+
+    def decode_cursor(self, request, queryset):
+        position, reverse = super().decode_cursor(request, queryset)
+
+        if reverse:
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def get_next_link(self):
+        if not self.page:
+            return self.request.build_absolute_uri()
+
+        return self.get_link(self.page[-1], reverse=False)
+
+    def get_paginated_data(self, data) -> dict:
+        return {
+            "next": self.get_next_link(),
+            "has_more": self.has_next,
+            "results": data,
+        }
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "format": "uri"},
+                "has_more": {"type": "boolean"},
+                "results": schema,
+            },
+        }
+
+
+PAGINATION_MODES = {
+    "page": PageNumberPagination,
+    "keyset": KeysetPagination,
+}
@@ -0,0 +1,21 @@
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return self.parse_lines(stream)
+
+    def parse_lines(self, stream):
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield ParseError(f"NDJSON parse error on line {number} - {exc}")
@@ -0,0 +1,81 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+
+class QueryPlan:
+    def __init__(self, select_related=(), prefetch_related=()):
+        self.select_related = tuple(sorted(set(select_related)))
+        self.prefetch_related = tuple(sorted(set(prefetch_related)))
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        return queryset
+
+
+def _walk_relations(model, source_attrs, prefix, select_related, prefetch_related):
+    path = prefix
+
+    for attr in source_attrs:
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None, path
+
+        if not field.is_relation:
+            return None, path
+
+        path = f"{path}__{attr}" if path else attr
+
+        if field.many_to_many or field.one_to_many:
+            prefetch_related.add(path)
+        else:
+            select_related.add(path)
+
+        model = field.related_model
+
+    return model, path
+
+
+def _plan_serializer(serializer, prefix, select_related, prefetch_related):
+    model = serializer.Meta.model
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+
+        nested = isinstance(field, serializers.BaseSerializer)
+        attrs = field.source_attrs if nested else field.source_attrs[:-1]
+        related_model, path = _walk_relations(
+            model, attrs, prefix, select_related, prefetch_related
+        )
+
+        if not nested or related_model is None:
+            continue
+
+        child = getattr(field, "child", field)
+
+        if hasattr(getattr(child, "Meta", None), "model"):
+            _plan_serializer(child, path, select_related, prefetch_related)
+
+
+@lru_cache(maxsize=None)
+def get_query_plan(serializer_class) -> QueryPlan:
+    select_related = set()
+    prefetch_related = set()
+    meta = getattr(serializer_class, "Meta", None)
+
+    if hasattr(meta, "model"):
+        _plan_serializer(serializer_class(), "", select_related, prefetch_related)
+
+    select_related.update(getattr(meta, "select_related", ()))
+    prefetch_related.update(getattr(meta, "prefetch_related", ()))
+
+    return QueryPlan(select_related, prefetch_related)
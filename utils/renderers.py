@@ -0,0 +1,72 @@
+import csv
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Renders rows one line at a time. `stream` takes the column names and an
+    iterable of rows and yields the body in chunks of `chunk_size` rows, for
+    a StreamingHttpResponse; `render` handles regular (error) responses.
+    """
+
+    charset = "utf-8"
+
+    def render_lines(self, fields, rows):
+        raise NotImplementedError
+
+    def stream(self, fields, rows, chunk_size: int = 500):
+        lines = []
+
+        for line in self.render_lines(fields, rows):
+            lines.append(line)
+
+            if len(lines) >= chunk_size:
+                yield "".join(lines).encode(self.charset)
+                lines = []
+
+        if lines:
+            yield "".join(lines).encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        items = data if isinstance(data, list) else [data]
+        fields = list(items[0]) if items else []
+        rows = ([item.get(field) for field in fields] for item in items)
+
+        return b"".join(self.stream(fields, rows))
+
+
+class NDJSONRenderer(StreamingRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render_lines(self, fields, rows):
+        encoder = JSONEncoder(ensure_ascii=False)
+
+        for row in rows:
+            yield encoder.encode(dict(zip(fields, row))) + "\n"
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+class CSVRenderer(StreamingRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+    def render_lines(self, fields, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+
+        for row in rows:
+            yield writer.writerow(
+                ("true" if value else "false") if isinstance(value, bool) else value
+                for value in row
+            )
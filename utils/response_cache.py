@@ -0,0 +1,100 @@
+from hashlib import md5
+from threading import Lock
+import time
+
+from django.core.cache import caches
+from django.http import HttpResponse
+
+# Every ResponseCache by namespace, for the metrics endpoint.
+response_caches = {}
+
+
+class ResponseCache:
+    def __init__(self, namespace: str, alias: str = "default"):
+        self.namespace = namespace
+        self.alias = alias
+        self.version_key = f"{namespace}:version"
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        response_caches[namespace] = self
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def seed_version(self) -> int:
+        # Caches may evict the version key. Starting over from the clock
+        # keeps the new version above every earlier one, whose pages may
+        # still be cached.
+        version = time.time_ns()
+        self.cache.add(self.version_key, version, timeout=None)
+
+        return self.cache.get(self.version_key, version)
+
+    def get_version(self) -> int:
+        version = self.cache.get(self.version_key)
+
+        if version is None:
+            version = self.seed_version()
+
+        return version
+
+    def bump(self):
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            self.seed_version()
+
+    def make_key(self, request) -> str:
+        # Paginated bodies hold absolute links, so the scheme and host are
+        # part of the key.
+        path = f"{request.accepted_media_type}:{request.build_absolute_uri()}"
+        digest = md5(path.encode(), usedforsecurity=False).hexdigest()
+
+        return f"{self.namespace}:{self.get_version()}:{digest}"
+
+    def get(self, key):
+        cached = self.cache.get(key)
+
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if cached is None:
+            return None
+
+        content, content_type, status, etag = cached
+        response = HttpResponse(content, content_type=content_type, status=status)
+        response["X-Cache"] = "HIT"
+
+        if etag:
+            response["ETag"] = etag
+
+        return response
+
+    def set(self, key, response):
+        self.cache.set(
+            key,
+            (
+                response.content,
+                response["Content-Type"],
+                response.status_code,
+                response.get("ETag"),
+            ),
+        )
+
+    def stats(self) -> dict:
+        """Hits and misses of this process, and the shared version."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self.get_version(),
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
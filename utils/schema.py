@@ -0,0 +1,302 @@
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+import ast
+import gzip
+import inspect
+import logging
+import sys
+import textwrap
+
+from django.conf import settings
+from django.db.migrations.writer import MigrationWriter
+from django.db.models import Model
+from django.http import HttpResponse
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils.cache import patch_vary_headers
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+from rest_framework.settings import api_settings
+import django
+import drf_spectacular
+import rest_framework
+import yaml
+
+from .conditional import etag_matches, make_etag, not_modified
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_PREFIX = "# fingerprint: "
+SCHEMA_VIEW_ATTRS = (
+    "serializer_class",
+    "serializer_map",
+    "filter_backends",
+    "pagination_class",
+    "pagination_map",
+    "parser_classes",
+)
+
+
+def _iter_routes(patterns, prefix: str = ""):
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+
+        if isinstance(pattern, URLResolver):
+            yield from _iter_routes(pattern.url_patterns, route)
+        elif isinstance(pattern, URLPattern):
+            yield route, pattern
+
+
+def _iter_classes(value):
+    if isinstance(value, dict):
+        value = list(value.values())
+
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_classes(item)
+    elif isinstance(value, type):
+        yield value
+
+
+def _describe_view(callback) -> str:
+    view = getattr(callback, "cls", None) or callback
+    initkwargs = getattr(callback, "view_initkwargs", {})
+
+    return f"{view.__module__}.{view.__qualname__} {sorted(initkwargs.items())!r}"
+
+
+def _collect_classes(urlconf=None) -> set[type]:
+    classes = set()
+
+    def add(cls):
+        if cls in classes:
+            return
+
+        classes.add(cls)
+
+        for base in cls.__mro__[1:]:
+            add(base)
+
+        # Nested serializers are declared as field instances.
+        for field in getattr(cls, "_declared_fields", {}).values():
+            add(type(field))
+            child = getattr(field, "child", None)
+
+            if child is not None:
+                add(type(child))
+
+    add(api_settings.DEFAULT_SCHEMA_CLASS)
+
+    for _, pattern in _iter_routes(get_resolver(urlconf).url_patterns):
+        view = getattr(pattern.callback, "cls", None)
+
+        if view is None:
+            continue
+
+        add(view)
+
+        for attr in SCHEMA_VIEW_ATTRS:
+            for cls in _iter_classes(getattr(view, attr, None)):
+                add(cls)
+
+        queryset = getattr(view, "queryset", None)
+
+        if queryset is not None:
+            add(queryset.model)
+
+    return classes
+
+
+def get_schema_classes(urlconf=None) -> list[type]:
+    """
+    Project classes the schema is generated from: the views routed to and
+    the serializers, filters and paginators those views declare, with their
+    bases.
+    """
+    base_dir = str(settings.BASE_DIR)
+
+    return sorted(
+        (
+            cls
+            for cls in _collect_classes(urlconf)
+            if getattr(sys.modules.get(cls.__module__), "__file__", "").startswith(
+                base_dir
+            )
+        ),
+        key=lambda cls: (cls.__module__, cls.__qualname__),
+    )
+
+
+def get_schema_models(urlconf=None) -> list:
+    """The models behind the views and serializers of the schema."""
+    models = set()
+
+    for cls in _collect_classes(urlconf):
+        if issubclass(cls, Model) and hasattr(cls, "_meta") and not cls._meta.abstract:
+            models.add(cls)
+
+        model = getattr(getattr(cls, "Meta", None), "model", None)
+
+        if model is not None:
+            models.add(model)
+
+    return sorted(models, key=lambda model: model._meta.label)
+
+
+def get_model_definition(model) -> str:
+    # Fields as a migration would write them, inherited ones included; the
+    # serializers map from these.
+    opts = model._meta
+
+    return "\n".join(
+        f"{field.name} = {MigrationWriter.serialize(field)[0]}"
+        for field in [*opts.fields, *opts.many_to_many]
+    )
+
+
+def get_class_definition(cls) -> str:
+    # The syntax tree leaves out comments, blank lines and formatting, and
+    # unlike the module file, the code around the class.
+    return ast.dump(ast.parse(textwrap.dedent(inspect.getsource(cls))))
+
+
+def compute_fingerprint(urlconf=None) -> str:
+    """
+    Hash of what the schema is generated from: the routes, the definitions
+    of the classes behind them and the versions of the generators.
+    """
+    digest = sha256()
+    digest.update(repr(sorted(settings.SPECTACULAR_SETTINGS.items())).encode())
+    digest.update(django.__version__.encode())
+    digest.update(drf_spectacular.__version__.encode())
+    digest.update(rest_framework.__version__.encode())
+
+    for route, pattern in _iter_routes(get_resolver(urlconf).url_patterns):
+        digest.update(
+            f"{route} {pattern.name} {_describe_view(pattern.callback)}\n".encode()
+        )
+
+    for cls in get_schema_classes(urlconf):
+        digest.update(f"{cls.__module__}.{cls.__qualname__}\n".encode())
+        digest.update(get_class_definition(cls).encode())
+
+    for model in get_schema_models(urlconf):
+        digest.update(f"{model._meta.label}\n".encode())
+        digest.update(get_model_definition(model).encode())
+
+    return digest.hexdigest()
+
+
+def generate_schema(urlconf=None) -> dict:
+    return SchemaGenerator(urlconf=urlconf).get_schema(request=None, public=True)
+
+
+def render_schema_file(schema: dict, fingerprint: str) -> bytes:
+    content = OpenApiYamlRenderer().render(schema, renderer_context={})
+
+    return f"{FINGERPRINT_PREFIX}{fingerprint}\n".encode() + content
+
+
+def read_schema_file(path: Path):
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        return None, None
+
+    first_line = content.split(b"\n", 1)[0].decode()
+    fingerprint = None
+
+    if first_line.startswith(FINGERPRINT_PREFIX):
+        fingerprint = first_line[len(FINGERPRINT_PREFIX) :].strip()
+
+    return fingerprint, yaml.safe_load(content)
+
+
+class PrecomputedSchema:
+    """
+    The schema generated once per process and its rendered, gzipped and
+    ETag'd representations, one per renderer format.
+    """
+
+    def __init__(self, path: Path, urlconf=None):
+        self.fingerprint = compute_fingerprint(urlconf)
+        stored_fingerprint, stored = read_schema_file(path)
+
+        if stored_fingerprint == self.fingerprint:
+            self.schema = stored
+            self.is_stale = False
+        else:
+            self.schema = generate_schema(urlconf)
+            rendered = render_schema_file(self.schema, self.fingerprint)
+            self.is_stale = stored != yaml.safe_load(rendered)
+
+        if self.is_stale:
+            logger.warning(
+                "%s does not match the API, run `python manage.py build_schema`",
+                path,
+            )
+
+        self._artifacts = {}
+        self._lock = Lock()
+
+    def get_artifact(self, renderer) -> dict:
+        with self._lock:
+            if renderer.format not in self._artifacts:
+                content = renderer.render(self.schema, renderer_context={})
+                self._artifacts[renderer.format] = {
+                    "content": content,
+                    "gzip": gzip.compress(content, mtime=0),
+                    "etag": make_etag(self.fingerprint, renderer.format, content),
+                }
+
+            return self._artifacts[renderer.format]
+
+
+@lru_cache(maxsize=None)
+def get_precomputed_schema() -> PrecomputedSchema:
+    return PrecomputedSchema(Path(settings.SCHEMA_FILE), settings.SCHEMA_URLCONF)
+
+
+class PrecomputedSchemaView(SpectacularAPIView):
+    """
+    Serves the schema from memory. Falls back to per-request generation
+    when `SCHEMA_PRECOMPUTED` is off or the view is customised per request.
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        customised = self.urlconf or self.custom_settings or request.GET.get("lang")
+
+        if not settings.SCHEMA_PRECOMPUTED or customised:
+            return super().get(request, *args, **kwargs)
+
+        artifact = get_precomputed_schema().get_artifact(request.accepted_renderer)
+
+        if etag_matches(request.headers.get("If-None-Match"), artifact["etag"]):
+            return not_modified(artifact["etag"])
+
+        renderer = request.accepted_renderer
+        content_type = request.accepted_media_type
+
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+
+        accepts_gzip = "gzip" in request.headers.get("Accept-Encoding", "")
+        response = HttpResponse(
+            artifact["gzip"] if accepts_gzip else artifact["content"],
+            content_type=content_type,
+        )
+
+        if accepts_gzip:
+            response["Content-Encoding"] = "gzip"
+
+        response["ETag"] = artifact["etag"]
+        response[
+            "Content-Disposition"
+        ] = f'inline; filename="{self._get_filename(request, None)}"'
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+
+        return response
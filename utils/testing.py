@@ -0,0 +1,143 @@
+"""
+Query auditing for the test suite.
+
+`QueryAuditRunner` (the project's TEST_RUNNER) records the queries of every
+request made through the test clients and fails the test when the view
+exceeds its budget in `settings.QUERY_BUDGETS`:
+
+    QUERY_BUDGETS = {
+        "default": {"max_repeats": 1},
+        "products.views.ProductView": {"max_queries": 3},
+    }
+
+`max_repeats` is how many times one query shape (the SQL with its literals
+stripped) may run in a single request; running it once per row is an N+1.
+None lifts a limit, for views that write row by row on purpose.
+`QueryAuditTestMixin.assertQueryCountConstant` checks that a view's query
+count does not grow with the size of its result.
+"""
+from collections import Counter
+from unittest import mock
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.test.client import ClientHandler
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext
+
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+VALUE_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_shape(sql: str) -> str:
+    """The query with its literals replaced, so one N+1 query has one shape."""
+    shape = LITERAL_RE.sub("?", sql)
+    shape = VALUE_LIST_RE.sub("(...)", shape)
+
+    return " ".join(shape.split())
+
+
+def get_query_budget(view_path: str) -> dict:
+    budgets = getattr(settings, "QUERY_BUDGETS", {})
+
+    return {
+        "max_repeats": 1,
+        "max_queries": None,
+        **budgets.get("default", {}),
+        **budgets.get(view_path, {}),
+    }
+
+
+def audit_queries(view_path: str, queries: list[dict]) -> list[str]:
+    """Budget violations of `queries`, the ones of one request to the view."""
+    budget = get_query_budget(view_path)
+    problems = []
+
+    if budget["max_queries"] is not None and len(queries) > budget["max_queries"]:
+        problems.append(
+            f"{len(queries)} queries, the budget is {budget['max_queries']}"
+        )
+
+    if budget["max_repeats"] is None:
+        return problems
+
+    shapes = Counter(query_shape(query["sql"]) for query in queries)
+
+    for shape, count in shapes.most_common():
+        if count <= budget["max_repeats"]:
+            break
+
+        problems.append(f"{count}x (max_repeats={budget['max_repeats']}): {shape}")
+
+    return problems
+
+
+def audited_get_response(get_response):
+    def wrapper(handler, request):
+        with CaptureQueriesContext(connection) as context:
+            response = get_response(handler, request)
+
+        match = request.resolver_match
+
+        if match is not None:
+            view_path = match._func_path
+            problems = audit_queries(view_path, context.captured_queries)
+
+            if problems:
+                raise QueryBudgetExceeded(
+                    f"{request.method} {request.path} ({view_path}) exceeded its "
+                    "query budget:\n  " + "\n  ".join(problems)
+                )
+
+        return response
+
+    return wrapper
+
+
+def audit_client_queries():
+    """Patcher auditing the requests of the (sync) test clients."""
+    return mock.patch.object(
+        ClientHandler,
+        "get_response",
+        audited_get_response(ClientHandler.get_response),
+    )
+
+
+class QueryAuditRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+
+        self.query_audit = audit_client_queries()
+        self.query_audit.start()
+
+    def teardown_test_environment(self, **kwargs):
+        self.query_audit.stop()
+        super().teardown_test_environment(**kwargs)
+
+
+class QueryAuditTestMixin:
+    def assertQueryCountConstant(self, request, add_rows, sizes=(1, 10), msg=None):
+        """
+        Grows the data with `add_rows(count)` to each of `sizes` rows and
+        asserts `request()` runs the same number of queries every time.
+        """
+        counts = {}
+        rows = 0
+
+        for size in sizes:
+            add_rows(size - rows)
+            rows = size
+
+            with CaptureQueriesContext(connection) as context:
+                request()
+
+            counts[size] = len(context.captured_queries)
+
+        if len(set(counts.values())) > 1:
+            detail = ", ".join(f"{size} rows: {n}" for size, n in counts.items())
+            self.fail(self._formatMessage(msg, f"query count grows ({detail})"))
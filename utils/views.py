@@ -0,0 +1,101 @@
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.http import Http404, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from .pagination import KeysetPagination
+from .query_plan import get_query_plan
+
+
+class AsyncAPIView(View):
+    """
+    Read-only counterpart of the DRF generic views for ASGI deployments.
+
+    DRF views are synchronous, so these reuse its serializers, filter
+    backends and renderer, but fetch rows with the async ORM.
+    """
+
+    http_method_names = ["get", "head", "options"]
+
+    queryset = None
+    serializer_class = None
+    filter_backends = ()
+    renderer_class = JSONRenderer
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(Request(request), *args, **kwargs)
+
+    def get_queryset(self):
+        plan = get_query_plan(self.serializer_class)
+
+        return plan.apply(self.queryset.all())
+
+    def filter_queryset(self, queryset):
+        for backend in self.filter_backends:
+            queryset = backend().filter_queryset(self.request, queryset, self)
+
+        return queryset
+
+    def get_serializer_class(self):
+        return self.serializer_class
+
+    def get_serializer(self, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+
+        return serializer_class(*args, context={"request": self.request}, **kwargs)
+
+    def render(self, data, status=200) -> HttpResponse:
+        return HttpResponse(
+            self.renderer_class().render(data),
+            content_type=self.renderer_class.media_type,
+            status=status,
+        )
+
+    def handle_exception(self, exc) -> HttpResponse:
+        if isinstance(exc, Http404):
+            exc = NotFound()
+
+        if not isinstance(exc, APIException):
+            raise exc
+
+        data = (
+            exc.detail
+            if isinstance(exc.detail, (list, dict))
+            else {"detail": exc.detail}
+        )
+
+        return self.render(data, status=exc.status_code)
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            return await self.aget(self.request, *args, **kwargs)
+        except Exception as exc:
+            return self.handle_exception(exc)
+
+
+class AsyncListAPIView(AsyncAPIView):
+    pagination_class = KeysetPagination
+
+    async def aget(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, request, self)
+        data = self.get_serializer(page, many=True).data
+
+        return self.render(paginator.get_paginated_data(data))
+
+
+class AsyncRetrieveAPIView(AsyncAPIView):
+    lookup_field = "pk"
+
+    async def aget(self, request, *args, **kwargs):
+        lookup = {self.lookup_field: self.kwargs[self.lookup_field]}
+
+        try:
+            instance = await self.filter_queryset(self.get_queryset()).aget(**lookup)
+        except (ObjectDoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+        return self.render(self.get_serializer(instance).data)